@@ -0,0 +1,66 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" microbenchmark for the input type registry, run from the top-level folder: python3 -m lib.benchmark [COUNT] """
+
+from lib.classes import input_registry
+
+from sys import argv
+from time import perf_counter
+
+SAMPLES = {"DOMAIN": ["www.Example.com", "bad..example"],
+           "FILE": ["scan-results.xml", ""],
+           "FULLPATH": ["/usr/share/wordlists/rockyou.txt", "relative/path"],
+           "HTTPSURL": ["https://example.com/login?next=/", "http://example.com"],
+           "HTTPURL": ["http://10.0.0.1:8080/index.php", "ftp://example.com"],
+           "INT": ["8080", "80a"],
+           "INTRANGE": ["1-1024,8080", "1-"],
+           "IPV4": ["192.168.100.254", "192.168.100.256"],
+           "IPV4CIDR": ["10.0.0.0/8", "10.0.0.0/33"],
+           "IPV4RNGE": ["10.0.0.1-10.0.0.254", "10.0.0.1-"],
+           "IPV6": ["2001:db8:85a3::8a2e:370:7334", "2001:db8::g"],
+           "IPV6CIDR": ["2001:db8::/32", "2001:db8::/129"],
+           "IPV6RNGE": ["2001:db8::1-2001:db8::ff", "2001:db8::1"],
+           "MAC": ["00:1A:2b:3C:4d:5E", "00:1A:2b:3C:4d"],
+           "RLATVPTH": ["wordlists/common.txt", "/etc/passwd"],
+           "STR": ["any text at all", ""],
+           "WEBURL": ["https://example.com/", "example.com"]}
+
+
+def main():
+    """ SUMMARY:  times normalize() for a valid and an invalid sample of every registered input type
+          INPUT:  optional number of iterations per sample (default: 200000) from argv
+         OUTPUT:  none, only prints to the screen """
+
+    count = int(argv[1]) if argv.__len__() > 1 else 200000
+    normalize = input_registry.normalize
+
+    print("\n" + "TYPE".ljust(10) + "VALID ns/op".rjust(14) + "INVALID ns/op".rjust(16) + "VALUES/s".rjust(14))
+
+    for input_type in sorted(input_registry.registry):
+        timings = []
+        for value in SAMPLES.get(input_type, ["sample", ""]):
+            start = perf_counter()
+            for i in range(count):
+                normalize(input_type, value)
+            timings.append((perf_counter() - start) / count)
+
+        print(input_type.ljust(10) + str(round(timings[0] * 1e9)).rjust(14) + str(round(timings[1] * 1e9)).rjust(16) +
+              str(int(1 / timings[0])).rjust(14))
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
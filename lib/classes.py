@@ -13,32 +13,70 @@
 # limitations under the License.
 
 import lib.config as config
-from lib.config import print_error
-
-from os import devnull, path
-from pexpect import exceptions, pty_spawn
+from lib.config import print_error, write_atomically
+
+from asyncio import Event as AsyncEvent, gather, Lock as AsyncLock, new_event_loop, run_coroutine_threadsafe, \
+    TimeoutError as AsyncTimeoutError, wait_for
+from atexit import register
+from base64 import b64decode, b64encode
+from bisect import bisect_left
+from codecs import getincrementaldecoder
+from concurrent.futures import ThreadPoolExecutor, wait
+from fcntl import flock, ioctl, LOCK_EX
+from hashlib import sha256
+from json import dumps, loads
+from os import access, close, environ, getcwd, getpgrp, getpid, isatty, killpg, makedirs, openpty, path, pathsep, \
+    pipe, read, remove, replace, scandir, set_blocking, setpgid, stat, tcsetpgrp, umask, W_OK, wait4, WEXITSTATUS, \
+    WIFSIGNALED, write, WTERMSIG
+from pexpect import pty_spawn
 from prompt_toolkit import prompt, PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.history import FileHistory
+from prompt_toolkit.validation import Validator
 from queue import Queue
-from re import search
+from re import compile as compile_pattern, error as RegexError
+from select import select
 from shlex import split
-from subprocess import call, PIPE, Popen, STDOUT
-from threading import Event
-from time import sleep
+from shutil import copyfile, rmtree, which
+from signal import SIG_IGN, SIGCONT, SIGKILL, Signals, signal, SIGTERM, SIGTTOU, SIGWINCH, SIGXCPU
+from socket import AF_INET6, AF_UNIX, inet_ntop, inet_pton, recv_fds, send_fds, SOCK_STREAM, socket
+from sqlite3 import connect, Error as SQLiteError
+from stat import S_ISREG
+from subprocess import call, CalledProcessError, check_output, DEVNULL, PIPE, Popen
+from sys import argv, executable, stderr, stdout
+from termios import TIOCGWINSZ, TIOCSWINSZ
+from threading import Event, Lock, Thread, Timer
+from time import localtime, monotonic, sleep, strftime, time
 
 
 class AxiomAction:
     """ A fully-completed, ready-to-execute tool command requiring no user input """
 
-    def __init__(self, name, prompt_type, execution_type, text, output_list, note):
+    def __init__(self, name, prompt_type, execution_type, text, output_list, note, limits, cache_ttl):
+        self.cache_ttl = cache_ttl
         self.execution_type = execution_type
+        self.limits = limits
         self.name = name
         self.note = note
         self.output_list = output_list
         self.prompt_type = prompt_type
         self.text = text
 
+    def can_run_in_background(self):
+        """ returns True if the command/action runs as a local subprocess that needs no terminal (standalone or
+            autonomous bash execution), meaning it can be started as a background job """
+
+        if self.execution_type not in ["standalone", "autonomous"] or self.prompt_type != "bash":
+            return False
+
+        if isinstance(self, AxiomCommand):
+            multiple_lines = isinstance(self.text[0], list)
+        else:
+            multiple_lines = isinstance(self.text, list)
+
+        return not (self.execution_type == "autonomous" and multiple_lines)
+
     def cli_print(self):
         """ SUMMARY:  displays the executable action text to the user, not stylized
               INPUT:  none, reads values from self
@@ -57,19 +95,104 @@ class AxiomAction:
         print()
 
     def confirm_and_execute(self, tool):
-        """ SUMMARY:  asks user to confirm execution of the command/action before proceeding
+        """ SUMMARY:  asks user to confirm execution of the command/action before proceeding, offering to start it as
+                      a background job or to bypass its cached result when possible
               INPUT:  AxiomTool object
-             OUTPUT:  False if not confirmed, True if confirmed, after command/action executes """
+             OUTPUT:  False if not confirmed or started in the background, True if confirmed, after command/action
+                      executes """
 
         self.show()
-        response = input("\n[AXIOM] Execute? [Y/n] ")
 
-        if response not in ["Y", "y", "Yes", "yes"]:
+        choices = "Y/n"
+        if self.can_run_in_background():
+            choices += "/b"
+        if self.cache_ttl is not None:
+            choices += "/f"
+
+        response = input(str("\n[AXIOM] Execute? [" + choices + "] "))
+
+        if response in ["B", "b", "bg"] and "/b" in choices:
+            self.run_in_background(tool)
+            return False
+        elif response in ["F", "f", "force"] and "/f" in choices:
+            execution_cache.force = True
+            try:
+                self.run(tool)
+            finally:
+                execution_cache.force = False
+            return True
+        elif response not in ["Y", "y", "Yes", "yes"]:
             return False
         else:
             self.run(tool)
             return True
 
+    def create_execution(self, text, output_file):
+        """ SUMMARY:  prepares a local subprocess for finalized command/action text bounded by resource limits
+              INPUT:  1) finalized command/action text (str or list of strings) and 2) an open binary file receiving
+                      the subprocess output (or None to display it on the screen)
+             OUTPUT:  an AxiomExecution object that has not started yet """
+
+        limits = self.resolve_limits()
+
+        if isinstance(text, list):
+            return AxiomExecution(["bash"], False, limits, text, output_file)
+        elif self.execution_type == "autonomous":
+            return AxiomExecution(text, True, limits, None, output_file)
+        else:
+            return AxiomExecution(split(text), False, limits, None, output_file)
+
+    def describe_run(self, tool, inputs, local=True):
+        """ SUMMARY:  collects the details about a command/action execution that are recorded in the result store
+              INPUT:  1) AxiomTool object, 2) list of input values (str), empty for actions, and 3) False if the text is
+                      sent to an interactive subprocess, whose working directory is unknown
+             OUTPUT:  dictionary of tool, command, type, input, and output file details """
+
+        input_details = []
+        if isinstance(self, AxiomCommand):
+            input_count = 0
+            while input_count < inputs.__len__():
+                input_details.append({"name": self.input_list[input_count][0],
+                                      "type": self.input_list[input_count][1],
+                                      "value": inputs[input_count]})
+                input_count += 1
+
+        return {"tool": tool.name,
+                "platform": tool.platform,
+                "command": self.name,
+                "execution_type": self.execution_type,
+                "prompt_type": self.prompt_type,
+                "inputs": input_details,
+                "artifacts": self.resolve_artifacts(inputs, local)}
+
+    def execute_locally(self, text, details):
+        """ SUMMARY:  executes finalized command/action text as a local subprocess bounded by resource limits (blocking)
+                      and records the outcome in the result store, cacheable commands replay a cached result instead
+              INPUT:  1) finalized command/action text (str or list of strings) and 2) dictionary from describe_run()
+             OUTPUT:  subprocess exit code (int) or None if execution failed """
+
+        cache_key = None
+        if self.cache_ttl is not None:
+            cache_key = execution_cache.get_key(details, text)
+            if execution_cache.replay(cache_key, None):
+                return 0
+
+        execution = self.create_execution(text, None)
+        if cache_key is not None:
+            execution_cache.start_capture(cache_key, execution)
+
+        try:
+            return_code = execution.run()
+
+            if execution.start_time is not None:
+                result_store.record(details, text, execution.get_measurements())
+
+        finally:
+            if cache_key is not None:
+                execution_cache.store(cache_key, self.cache_ttl, details, execution)
+
+        return return_code
+
     def existing_subprocess(self):
         """ SUMMARY:  checks dispatch for existing subprocess with matching prompt type
               INPUT:  none, reads values from self
@@ -116,11 +239,55 @@ class AxiomAction:
                 print("         " + self.text[line])
                 line += 1
 
+    def render(self, values):
+        """ returns the action text unchanged, actions have no input placeholders to replace """
+
+        return self.text
+
+    def resolve_artifacts(self, inputs, local):
+        """ SUMMARY:  resolves the concrete filenames of declared F_INPUT, F_PREFIX, and F_STRING outputs, relative
+                      filenames are only made absolute for local executions since they run in the current directory
+              INPUT:  1) list of rendered input values (str), empty for actions, and 2) True for local executions
+             OUTPUT:  list of three-item tuples (output type, filename, prefix input value or None) """
+
+        artifacts = []
+        resolve = path.abspath if local else str
+
+        for output in self.output_list:
+            if not isinstance(output, tuple):
+                continue
+
+            output_type, output_value = output
+
+            if output_type == "F_INPUT" and int(output_value - 1) in range(inputs.__len__()):
+                artifacts.append((output_type, resolve(inputs[output_value - 1]), None))
+            elif output_type == "F_PREFIX" and int(output_value[0] - 1) in range(inputs.__len__()):
+                prefix = inputs[output_value[0] - 1]
+                artifacts.append((output_type, resolve(str(prefix + output_value[1])), resolve(prefix)))
+            elif output_type == "F_STRING":
+                artifacts.append((output_type, resolve(output_value), None))
+
+        return artifacts
+
+    def resolve_limits(self):
+        """ SUMMARY:  combines global resource limits with any limits listed for this command/action
+              INPUT:  none, reads values from self and global config object
+             OUTPUT:  dictionary of limit names and values (int or None) """
+
+        limits = {"timeout": None, "cpu_time": None, "address_space": None, "open_files": None}
+        limits.update(config.axiom.limits)
+        limits.update(self.limits)
+
+        return limits
+
     def run(self, tool):
-        """ SUMMARY:  checks if tool is compatible/installed and calls execution function for matching execution type
+        """ SUMMARY:  checks if tool is compatible/installed and calls execution function for matching execution type,
+                      first waiting for running interactive tasks that this one has to follow
               INPUT:  AxiomTool object
              OUTPUT:  none """
 
+        dispatch.wait_for_sessions(self.prompt_type)
+
         if self.prompt_type == "bash" and not self.existing_subprocess():
 
             if not tool.platform_matches():
@@ -158,49 +325,81 @@ class AxiomAction:
 
         if self.execution_type == "standalone":
             if multiple_lines:
-                self.run_multiline_standalone()
+                self.run_multiline_standalone(tool)
             else:
-                self.run_standalone()
+                self.run_standalone(tool)
         elif self.execution_type == "autonomous":
             if multiple_lines:
                 print_error("ERROR: Autonomous multi-line commands are unsupported")
             else:
-                self.run_autonomous()
+                self.run_autonomous(tool)
         elif self.execution_type == "interactive":
-            self.run_interactive()
+            self.run_interactive(tool)
         elif self.execution_type == "NX":
             if multiple_lines:
                 self.run_multiline_nx()
             else:
                 self.run_nx()
 
-    def run_autonomous(self):
+    def run_autonomous(self, tool):
         """ SUMMARY:  executes autonomous action as subprocess (blocking) or queues action as a task (if interactive)
-              INPUT:  none, reads values from self
+              INPUT:  AxiomTool object, also reads values from self
              OUTPUT:  no return values """
 
-        if self.prompt_type == "bash" and not self.existing_subprocess():
-            try:
-                print()
-                call(self.text, shell=True)
+        local = self.prompt_type == "bash" and not self.existing_subprocess()
+        details = self.describe_run(tool, [], local)
 
-            except OSError:
-                print_error("ERROR: Failed to execute via call()")
+        if local:
+            print()
+            self.execute_locally(self.text, details)
 
         else:
-            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, self.prompt_type))
+            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, self.prompt_type, details))
             dispatch.monitor_task_queue()
 
         dispatch.continue_trigger.set()
 
-    def run_interactive(self):
+    def run_in_background(self, tool):
+        """ SUMMARY:  checks if tool is compatible/installed, builds the command/action text, and starts it as a
+                      background job (non-blocking)
+              INPUT:  AxiomTool object, also reads values from self
+             OUTPUT:  AxiomJob object or None if the job was not started """
+
+        if jobs.count_running() >= config.axiom.max_jobs:
+            print_error(str("\nERROR: " + str(config.axiom.max_jobs) + " background jobs are already running " +
+                            "(see max_jobs in the configuration file)"))
+            return None
+
+        if not tool.platform_matches():
+            print_error(str("\nERROR: Cannot execute " + tool.name + " (" + tool.platform + ") on " +
+                            config.axiom.platform))
+            return None
+
+        if not tool.is_installed() and not tool.install() and not tool.proceed_despite_uninstalled():
+            return None
+
+        if isinstance(self, AxiomCommand):
+            inputs = self.collect_inputs()
+            text = self.render(inputs)
+        else:
+            inputs = []
+            text = self.text
+
+        job = jobs.launch(self, text, self.describe_run(tool, inputs))
+        if job is not None:
+            print("\n[AXIOM] Started job " + str(job.job_id) + " (output saved in " + job.log_filename + ")")
+
+        return job
+
+    def run_interactive(self, tool):
         """ SUMMARY:  creates and queues an AxiomInteractiveTask object for execution
-              INPUT:  none, reads values from self
+              INPUT:  AxiomTool object, also reads values from self
              OUTPUT:  no return values """
 
         ending_prompt = self.extract_ending_prompt()
         if ending_prompt is not False:
-            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, ending_prompt))
+            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, ending_prompt,
+                                                      self.describe_run(tool, [], False)))
             dispatch.monitor_task_queue()
 
         dispatch.continue_trigger.set()
@@ -217,33 +416,20 @@ class AxiomAction:
             line += 1
         dispatch.continue_trigger.set()
 
-    def run_multiline_standalone(self):
+    def run_multiline_standalone(self, tool):
         """ SUMMARY:  executes multi-line action as subprocess or queues action execution as a task (if interactive)
-              INPUT:  none, reads values from self
+              INPUT:  AxiomTool object, also reads values from self
              OUTPUT:  none """
 
-        if self.prompt_type == "bash" and not self.existing_subprocess():
-            try:
-                print()
-                proc = Popen(["bash", "-i"], shell=True, stdin=PIPE, stdout=PIPE)
-
-                i = 0
-                while proc.returncode is None:
-                    if i < self.text.__len__():
-                        proc.stdin.write(self.text[i].encode())
-                        proc.stdin.write("\n".encode())
-                        proc.stdin.flush()
-                        i += 1
-                    else:
-                        proc.stdin.close()
-
-                    proc.poll()
+        local = self.prompt_type == "bash" and not self.existing_subprocess()
+        details = self.describe_run(tool, [], local)
 
-            except OSError:
-                print_error("ERROR: Failed to execute via Popen()")
+        if local:
+            print()
+            self.execute_locally(self.text, details)
 
         else:
-            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, self.prompt_type))
+            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, self.prompt_type, details))
             dispatch.monitor_task_queue()
 
         dispatch.continue_trigger.set()
@@ -258,21 +444,20 @@ class AxiomAction:
         print()
         dispatch.continue_trigger.set()
 
-    def run_standalone(self):
+    def run_standalone(self, tool):
         """ SUMMARY:  executes action as a subprocess (blocking) or queues action execution as a task (if interactive)
-              INPUT:  none, reads values from self
+              INPUT:  AxiomTool object, also reads values from self
              OUTPUT:  none """
 
-        if self.prompt_type == "bash" and not self.existing_subprocess():
-            try:
-                print()
-                call(split(self.text))
+        local = self.prompt_type == "bash" and not self.existing_subprocess()
+        details = self.describe_run(tool, [], local)
 
-            except OSError:
-                print_error("ERROR: Failed to execute via call()")
+        if local:
+            print()
+            self.execute_locally(self.text, details)
 
         else:
-            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, self.prompt_type))
+            dispatch.tasking.put(AxiomInteractiveTask(self.text, self.prompt_type, self.prompt_type, details))
             dispatch.monitor_task_queue()
 
         dispatch.continue_trigger.set()
@@ -289,523 +474,3202 @@ class AxiomAction:
         self.print_text()
 
 
-class AxiomCommand(AxiomAction):
-    """ The general syntax, including data-type placeholders, for an instruction to execute """
+class AxiomBroker:
+    """ a local process that owns interactive pseudoterminal sessions and their prompt state, so expensive interactive
+        subprograms outlive the AXIOM Framework instances that use them """
 
-    def __init__(self, name, prompt_type, execution_type, text, output_list, note, input_list):
-        """ SUMMARY:  creates AxiomCommand objects, inherits from AxiomAction class
-              INPUT:  multiples values at instantiation
-             OUTPUT:  none, instantiates AxiomCommand object """
+    def __init__(self):
+        self.clients = {}
+        self.next_id = 1
+        self.running = True
+        self.sessions = {}
 
-        super().__init__(name, prompt_type, execution_type, text, output_list, note)
-        self.input_list = input_list
+    def attach(self, client, session_id):
+        """ SUMMARY:  hands a detached session's pseudoterminal and buffered output to a client
+              INPUT:  1) client socket and 2) session ID (int)
+             OUTPUT:  two-item tuple, reply (dict) and list of file descriptors to send with it """
 
-    def build(self):
-        """ SUMMARY:  interactively prompts user, possibly more than once, to enter/select all command input values
-              INPUT:  none, reads values from self
-             OUTPUT:  returns finalized command text, either a string or list of strings """
+        session = self.sessions.get(session_id)
 
-        input_count = 0
+        if session is None:
+            return {"error": "Invalid session specified"}, []
+        if session["client"] is not None:
+            return {"error": "Session is attached to another AXIOM Framework instance"}, []
 
-        if isinstance(self.text[0], str):
-            token_count = 0
-            built_text = str()
-            while token_count < self.text.__len__() or input_count < self.input_list.__len__():
-                if token_count < self.text.__len__():
-                    built_text += self.text[token_count]
-                    token_count += 1
-                if input_count < self.input_list.__len__():
-                    built_text += self.input_build_prompt(input_count)
-                    input_count += 1
-        else:
-            built_text = []
-            current_line = 0
-            while current_line < self.text.__len__():
-                line_tokens = self.text[current_line].__len__()
-                current_token = 0
-                line_inputs = line_tokens - 1
-                current_input = 0
-                built_line = str()
-                while current_token < line_tokens or current_input < line_inputs:
-                    if current_token < line_tokens:
-                        built_line += self.text[current_line][current_token]
-                        current_token += 1
-                    if current_input < line_inputs:
-                        built_line += self.input_build_prompt(input_count)
-                        current_input += 1
-                        input_count += 1
-                built_text.append(built_line)
-                current_line += 1
+        session["client"] = client
+        backlog = bytes(session["backlog"])
+        session["backlog"] = bytearray()
 
-        return built_text
+        reply = self.describe(session)
+        reply["backlog"] = b64encode(backlog).decode()
 
-    def build_with_placeholders(self):
-        """ SUMMARY:  creates command text containing placeholders for user preview before confirming execution
-              INPUT:  none, reads values from self
-             OUTPUT:  returns string or list of strings containing placeholders character sequences """
+        return reply, [session["process"].child_fd]
 
-        input_count = 0
+    def describe(self, session):
+        """ returns a dictionary describing a session for clients """
 
-        if isinstance(self.text[0], str):
-            token_count = 0
-            built_text = str()
-            while token_count < self.text.__len__() or input_count < self.input_list.__len__():
-                if token_count < self.text.__len__():
-                    built_text += self.text[token_count]
-                    token_count += 1
-                if input_count < self.input_list.__len__():
-                    built_text += str("{" + self.input_list[input_count][1] + "}")
-                    input_count += 1
+        if session["closed"] or not session["process"].isalive():
+            state = "exited"
+        elif session["client"] is not None:
+            state = "attached"
         else:
-            built_text = []
-            current_line = 0
-            while current_line < self.text.__len__():
-                line_tokens = self.text[current_line].__len__()
-                current_token = 0
-                line_inputs = line_tokens - 1
-                current_input = 0
-                built_line = str()
-                while current_token < line_tokens or current_input < line_inputs:
-                    if current_token < line_tokens:
-                        built_line += self.text[current_line][current_token]
-                        current_token += 1
-                    if current_input < line_inputs:
-                        built_line += str("{" + self.input_list[input_count][1] + "}")
-                        current_input += 1
-                        input_count += 1
-                built_text.append(built_line)
-                current_line += 1
+            state = "detached"
 
-        return built_text
+        return {"id": session["id"], "prompt": session["prompt"], "pid": session["process"].pid, "state": state,
+                "started": session["started"], "unread": session["backlog"].__len__()}
 
-    def cli_print(self):
-        """ SUMMARY:  prints command text to the screen (not stylized), overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  none, only prints to the screen """
+    def detach_all(self, client):
+        """ closes a client connection and resumes buffering the output of every session it was attached to """
 
-        text = self.build()
+        self.clients.pop(client, None)
 
-        print()
+        for session in self.sessions.values():
+            if session["client"] is client:
+                session["client"] = None
 
-        if isinstance(text, str):
-            print(text)
-        elif isinstance(text, list):
-            line = 0
-            while line < text.__len__():
-                print(text[line])
-                line += 1
+        client.close()
 
-        print()
+    def drain(self, session):
+        """ reads a detached session's available output into its backlog, keeping the newest session_buffer bytes """
 
-    def input_build_prompt(self, input_count):
-        """ SUMMARY:  prompts user to enter, and auto-suggests, command inputs to replace placeholder values
-              INPUT:  current command input number (int), also reads values from self
-             OUTPUT:  returns a user-supplied or user-selected string value """
+        try:
+            data = read(session["process"].child_fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = bytes()
 
-        input_type = self.input_list[input_count][1]
-        prompt_text = str("[AXIOM] Enter " + self.input_list[input_count][0] + ": ")
+        if not data:
+            session["closed"] = True
+            return
 
-        if input_type in ["STRMENU", "INTMENU"]:
-            option_name = self.input_list[input_count][0]
-            option_list = self.input_list[input_count][2]
-            response = self.option_prompt(option_name, option_list)
-            return response
-        elif input_type in ["STR", "INT", "IPV4", "IPV6", "IPV4RNGE", "IPV6RNGE", "IPV4CIDR", "IPV6CIDR", "MAC", "FILE",
-                            "RLATVPTH", "FULLPATH", "DOMAIN", "HTTPURL", "HTTPSURL", "WEBURL"]:
+        session["backlog"] += data
+        excess = session["backlog"].__len__() - config.axiom.session_buffer
 
-            if input_type == "HTTPSURL":
-                history_file = str(config.axiom.history_folder + "/WEBURL" + ".axiom")
-            else:
-                history_file = str(config.axiom.history_folder + "/" + input_type + ".axiom")
+        if excess > 0:
+            del session["backlog"][:excess]
 
-            session = PromptSession(history=FileHistory(history_file))
-            response = session.prompt(prompt_text, auto_suggest=AutoSuggestFromHistory())
-            return response
-        else:
-            response = prompt(prompt_text)
-            return response
+    def handle_request(self, client, message):
+        """ SUMMARY:  performs one client request: spawn, attach, list, status, update (prompt state), detach, kill, or
+                      stop
+              INPUT:  1) client socket and 2) request (dict)
+             OUTPUT:  two-item tuple, reply (dict) and list of file descriptors to send with it """
 
-    @staticmethod
-    def option_prompt(option_name, option_list):
-        """ SUMMARY:  infinite loop prompting user to select a listed STRMENU or INTMENU option
-              INPUT:  option_name (str) and option_list (list) variables created from input_list values
-             OUTPUT:  string value from the option corresponding to the user's selection """
+        action = message.get("action")
 
-        while True:
-            print("\n" + option_name + "\n")
+        if action == "spawn":
+            try:
+                process = pty_spawn.spawn("/bin/bash -i", timeout=config.axiom.pty_timeout)
+            except OSError:
+                return {"error": "Failed to spawn /bin/bash subprocess"}, []
 
-            count = 0
-            while count < option_list.__len__():
-                print("  " + str(count + 1) + "\t" + str(option_list[count]))
-                count += 1
+            session = {"id": self.next_id, "prompt": str(message.get("prompt")), "process": process, "client": client,
+                       "backlog": bytearray(), "closed": False, "started": time()}
+            self.sessions[self.next_id] = session
+            self.next_id += 1
 
-            number = prompt("\n[AXIOM] Select an option: ")
+            return self.describe(session), [process.child_fd]
 
-            try:
-                number = int(number)
-                number -= 1
-            except (ValueError, TypeError):
-                number = -1
+        if action == "attach":
+            return self.attach(client, message.get("id"))
 
-            if 0 <= number < option_list.__len__():
-                return option_list[number]
+        if action == "list":
+            return {"sessions": [self.describe(x) for x in self.sessions.values()]}, []
 
-    def print_text(self):
-        """ SUMMARY:  prints command text to the screen (stylized), overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  none, only prints to the screen """
+        if action == "status" and message.get("id") in self.sessions:
+            return self.describe(self.sessions[message.get("id")]), []
 
-        text_with_placeholders = self.build_with_placeholders()
-        if isinstance(text_with_placeholders, str):
-            print("\n  TEXT:  " + text_with_placeholders)
-        elif isinstance(text_with_placeholders, list):
-            print("\n  TEXT:  ", end="")
-            print(text_with_placeholders[0])
-            line = 1
-            while line < text_with_placeholders.__len__():
-                print("         " + text_with_placeholders[line])
-                line += 1
+        if action == "update" and message.get("id") in self.sessions:
+            self.sessions[message.get("id")]["prompt"] = str(message.get("prompt"))
+            return {}, []
 
-    def run_autonomous(self):
-        """ SUMMARY:  builds and runs command as subprocess (blocking) or queues task for interactive execution
-                      overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  none """
+        if action == "detach" and message.get("id") in self.sessions:
+            if self.sessions[message.get("id")]["client"] is client:
+                self.sessions[message.get("id")]["client"] = None
+            return {}, []
 
-        text = self.build()
-        if self.prompt_type == "bash" and not self.existing_subprocess():
-            try:
-                print()
-                call(text, shell=True)
+        if action == "kill" and message.get("id") in self.sessions:
+            self.sessions.pop(message.get("id"))["process"].close(force=True)
+            return {}, []
 
-            except OSError:
-                print_error("ERROR: Failed to execute via call()")
+        if action == "stop":
+            self.running = False
+            return {}, []
 
-        else:
-            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, self.prompt_type))
-            dispatch.monitor_task_queue()
+        if action in ["status", "update", "detach", "kill"]:
+            return {"error": "Invalid session specified"}, []
 
-        dispatch.continue_trigger.set()
+        return {"error": "Invalid request"}, []
 
-    def run_interactive(self):
-        """ SUMMARY:  builds command text and builds/queues interactive execution task
-                      overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  none """
+    @staticmethod
+    def launch():
+        """ SUMMARY:  starts "./axiom broker serve" in a new session in the background and waits for it to accept
+                      connections
+              INPUT:  none
+             OUTPUT:  True if the broker is running, False otherwise """
 
-        text = self.build()
-        ending_prompt = self.extract_ending_prompt()
-        if ending_prompt is not False:
-            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, ending_prompt))
-            dispatch.monitor_task_queue()
+        try:
+            Popen([executable, path.abspath(argv[0]), "broker", "serve"], stdin=DEVNULL, stdout=DEVNULL,
+                  stderr=DEVNULL, start_new_session=True)
+        except OSError:
+            return False
 
-        dispatch.continue_trigger.set()
+        deadline = monotonic() + 10
 
-    def run_multiline_nx(self):
-        """ SUMMARY:  builds and prints multi-line command text to screen, overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  no return values, only prints to screen """
+        while monotonic() < deadline:
+            if AxiomBroker.ping():
+                return True
+            sleep(0.1)
 
-        text = self.build()
-        print()
-        line = 0
-        while line < self.text.__len__():
-            print(text[line])
-            line += 1
-        dispatch.continue_trigger.set()
+        return False
 
-    def run_multiline_standalone(self):
-        """ SUMMARY:  builds and executes command as subprocess or queues task for interactive execution
-                      overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  no return values """
+    @staticmethod
+    def ping():
+        """ returns True if a broker accepts connections on its socket, False otherwise """
 
-        text = self.build()
-        if self.prompt_type == "bash" and not self.existing_subprocess():
-            try:
-                print()
-                proc = Popen(["bash", "-i"], shell=True, stdin=PIPE, stdout=PIPE)
+        client = socket(AF_UNIX, SOCK_STREAM)
 
-                i = 0
-                while proc.returncode is None:
-                    if i < text.__len__():
-                        proc.stdin.write(text[i].encode())
-                        proc.stdin.write("\n".encode())
-                        proc.stdin.flush()
-                        i += 1
-                    else:
-                        proc.stdin.close()
+        try:
+            client.connect(AxiomBroker.socket_filename())
+        except OSError:
+            return False
+        else:
+            return True
+        finally:
+            client.close()
 
-                    proc.poll()
+    def read_requests(self, client):
+        """ SUMMARY:  reads newline-delimited JSON requests from a client and sends a reply to each one
+              INPUT:  client socket
+             OUTPUT:  none, disconnects the client on EOF or error """
 
+        try:
+            data = client.recv(65536)
+        except OSError:
+            data = bytes()
+
+        if not data:
+            self.detach_all(client)
+            return
+
+        self.clients[client] += data
+
+        while b"\n" in self.clients[client]:
+            line, remainder = self.clients[client].split(b"\n", 1)
+            self.clients[client] = remainder
+
+            try:
+                message = loads(line)
+                reply, fds = self.handle_request(client, message)
+            except (AttributeError, TypeError, ValueError):
+                reply, fds = {"error": "Invalid request"}, []
+
+            payload = str(dumps(reply) + "\n").encode()
+
+            try:
+                sent = send_fds(client, [payload], fds) if fds else 0
+                client.sendall(payload[sent:])
             except OSError:
-                print_error("ERROR: Failed to execute via Popen()")
+                self.detach_all(client)
+                return
+
+    def reap(self):
+        """ forgets detached sessions whose subprocess exited and whose buffered output is empty """
+
+        for session_id in list(self.sessions):
+            session = self.sessions[session_id]
+            if session["client"] is None and session["backlog"].__len__() == 0 and not session["process"].isalive():
+                self.sessions.pop(session_id)
+                session["process"].close(force=True)
+
+    def serve(self):
+        """ SUMMARY:  serves clients on a Unix socket in the history folder until stopped, buffering the output of
+                      every detached session in the meantime
+              INPUT:  none
+             OUTPUT:  exit value (int) """
+
+        filename = self.socket_filename()
+
+        if self.ping():
+            print_error("ERROR: Session broker is already running")
+            return 1
+
+        listener = socket(AF_UNIX, SOCK_STREAM)
+        previous_umask = umask(0o077)
+
+        try:
+            if path.exists(filename):
+                remove(filename)
+            listener.bind(filename)
+            listener.listen(8)
+        except OSError:
+            print_error(str("ERROR: Failed to listen on " + filename))
+            return 1
+        finally:
+            umask(previous_umask)
+
+        while self.running:
+            detached = {}
+            for session in self.sessions.values():
+                if session["client"] is None and not session["closed"]:
+                    detached[session["process"].child_fd] = session
+
+            readable = select([listener] + list(self.clients) + list(detached), [], [], 1)[0]
+
+            for x in readable:
+                if x is listener:
+                    try:
+                        self.clients[listener.accept()[0]] = bytearray()
+                    except OSError:
+                        pass
+                elif x in self.clients:
+                    self.read_requests(x)
+                elif x in detached and detached[x]["client"] is None:
+                    self.drain(detached[x])
+
+            self.reap()
+
+        for session in self.sessions.values():
+            session["process"].close(force=True)
+
+        listener.close()
+
+        try:
+            remove(filename)
+        except OSError:
+            pass
+
+        return 0
+
+    @staticmethod
+    def socket_filename():
+        """ returns the absolute filename (str) of the broker's Unix socket in the history folder """
+
+        return path.abspath(str(config.axiom.history_folder + "/broker.sock"))
+
+
+class AxiomBrokerProcess:
+    """ a pseudoterminal session owned by the session broker, provides the parts of the pexpect spawn interface that
+        AxiomDispatcher uses """
+
+    def __init__(self, session_id, pid, child_fd):
+        self.child_fd = child_fd
+        self.pid = pid
+        self.session_id = session_id
+
+    def close(self, force=True):
+        """ closes this instance's copy of the pseudoterminal, the broker keeps the session running """
+
+        try:
+            close(self.child_fd)
+        except OSError:
+            pass
+
+    def isalive(self):
+        """ returns True if the broker, which reaps its subprocesses, reports this one is still running """
+
+        try:
+            reply = dispatch.broker_request({"action": "status", "id": self.session_id})[0]
+        except OSError:
+            return False
+
+        return reply.get("state") in ["attached", "detached"]
+
+    def sendline(self, s=""):
+        """ writes a line of text to the pseudoterminal, waiting whenever the non-blocking pseudoterminal is full """
+
+        data = str(s + "\n").encode()
+        sleep(0.05)
+
+        while data:
+            try:
+                written = write(self.child_fd, data)
+            except BlockingIOError:
+                select([], [self.child_fd], [], 1)
+                continue
+            data = data[written:]
+
+
+class AxiomCommand(AxiomAction):
+    """ The general syntax, including data-type placeholders, for an instruction to execute """
+
+    def __init__(self, name, prompt_type, execution_type, text, output_list, note, limits, cache_ttl, input_list):
+        """ SUMMARY:  creates AxiomCommand objects, inherits from AxiomAction class
+              INPUT:  multiples values at instantiation
+             OUTPUT:  none, instantiates AxiomCommand object """
+
+        super().__init__(name, prompt_type, execution_type, text, output_list, note, limits, cache_ttl)
+        self.input_list = input_list
+
+    def build(self):
+        """ SUMMARY:  interactively prompts user, possibly more than once, to enter/select all command input values
+              INPUT:  none, reads values from self
+             OUTPUT:  returns finalized command text, either a string or list of strings """
+
+        return self.render(self.collect_inputs())
+
+    def build_with_placeholders(self):
+        """ SUMMARY:  creates command text containing placeholders for user preview before confirming execution
+              INPUT:  none, reads values from self
+             OUTPUT:  returns string or list of strings containing placeholders character sequences """
+
+        return self.render([str("{" + x[1] + "}") for x in self.input_list])
+
+    def cli_print(self):
+        """ SUMMARY:  prints command text to the screen (not stylized), overrides inherited AxiomAction function
+              INPUT:  none, reads values from self
+             OUTPUT:  none, only prints to the screen """
+
+        text = self.build()
+
+        print()
+
+        if isinstance(text, str):
+            print(text)
+        elif isinstance(text, list):
+            line = 0
+            while line < text.__len__():
+                print(text[line])
+                line += 1
+
+        print()
+
+    def collect_inputs(self):
+        """ SUMMARY:  fills every command input value in order from the active workspace, interactively prompting user
+                      to enter/select the values that are not bound (or to confirm bound values if configured)
+              INPUT:  none, reads values from self
+             OUTPUT:  list of input values (str), one per item in input_list """
+
+        values = []
+        input_count = 0
+        while input_count < self.input_list.__len__():
+            bound_value = self.resolve_bound_value(input_count)
+            if bound_value is not None and not config.axiom.confirm_bindings:
+                print("[AXIOM] Using " + self.input_list[input_count][0] + ": " + bound_value)
+                values.append(bound_value)
+            else:
+                values.append(str(self.input_build_prompt(input_count, bound_value)))
+            input_count += 1
+
+        return values
+
+    def get_input_resolvers(self):
+        """ SUMMARY:  looks up the normalizer or STRMENU/INTMENU option list of every input once, so a stream of input
+                      sets for this command does not repeat the lookups for each set
+              INPUT:  none, reads values from self
+             OUTPUT:  list of three-item tuples (input name, input type, function returning the resolved value or
+                      None) """
+
+        resolvers = []
+
+        for input_details in self.input_list:
+            if input_details[1] in ["STRMENU", "INTMENU"]:
+                resolve = self.get_option_resolver(input_details[2])
+            else:
+                resolve = input_registry.get_normalizer(input_details[1])
+
+            resolvers.append((input_details[0], input_details[1], resolve))
+
+        return resolvers
+
+    @staticmethod
+    def get_option_resolver(option_list):
+        """ returns a function equivalent to resolve_option() for one option list, with values and indexes hashed """
+
+        options = {}
+
+        for number, option in enumerate(option_list, 1):
+            options[str(number)] = str(option)
+
+        for option in option_list:
+            options[str(option)] = str(option)
+
+        def resolve_value(raw_value):
+            if raw_value in options:
+                return options[raw_value]
+
+            return AxiomCommand.resolve_option(option_list, raw_value)
+
+        return resolve_value
+
+    def input_build_prompt(self, input_count, default=None):
+        """ SUMMARY:  prompts user to enter, and auto-suggests, command inputs to replace placeholder values
+              INPUT:  1) current command input number (int) and 2) value pre-filled at the prompt (str) or None, also
+                      reads values from self
+             OUTPUT:  returns a user-supplied or user-selected string value, validated and normalized for its type """
+
+        input_type = self.input_list[input_count][1]
+        prompt_text = str("[AXIOM] Enter " + self.input_list[input_count][0] + ": ")
+        default = "" if default is None else default
+
+        if input_type in ["STRMENU", "INTMENU"]:
+            option_name = self.input_list[input_count][0]
+            option_list = self.input_list[input_count][2]
+            response = self.option_prompt(option_name, option_list, default)
+            return response
+        elif input_type in ["STR", "INT", "IPV4", "IPV6", "IPV4RNGE", "IPV6RNGE", "IPV4CIDR", "IPV6CIDR", "MAC", "FILE",
+                            "RLATVPTH", "FULLPATH", "DOMAIN", "HTTPURL", "HTTPSURL", "WEBURL"]:
+
+            if input_type == "HTTPSURL":
+                history_file = str(config.axiom.history_folder + "/WEBURL" + ".axiom")
+            else:
+                history_file = str(config.axiom.history_folder + "/" + input_type + ".axiom")
+
+            session = PromptSession(history=FileHistory(history_file))
+
+            if input_type in ["FILE", "FULLPATH", "RLATVPTH"]:
+                artifacts = result_store.get_artifact_values(1000)
+                response = session.prompt(prompt_text, auto_suggest=AutoSuggestFromHistory(),
+                                          completer=WordCompleter(list(artifacts), meta_dict=artifacts,
+                                                                  sentence=True),
+                                          validator=self.input_validator(input_type), validate_while_typing=False,
+                                          default=default)
+            else:
+                response = session.prompt(prompt_text, auto_suggest=AutoSuggestFromHistory(),
+                                          validator=self.input_validator(input_type), validate_while_typing=False,
+                                          default=default)
+            return input_registry.normalize(input_type, response)
+        else:
+            response = prompt(prompt_text, validator=self.input_validator(input_type), validate_while_typing=False,
+                              default=default)
+            return input_registry.normalize(input_type, response)
+
+    @staticmethod
+    def input_validator(input_type):
+        """ returns a prompt_toolkit Validator that rejects values the input registry considers invalid """
+
+        return Validator.from_callable(lambda text: input_registry.normalize(input_type, text) is not None,
+                                       error_message=str("Invalid " + input_type + " value"),
+                                       move_cursor_to_end=True)
+
+    @staticmethod
+    def option_prompt(option_name, option_list, default=""):
+        """ SUMMARY:  infinite loop prompting user to select a listed STRMENU or INTMENU option
+              INPUT:  option_name (str) and option_list (list) variables created from input_list values, and optional
+                      option value (str) whose number is pre-filled at the prompt
+             OUTPUT:  string value from the option corresponding to the user's selection """
+
+        default_number = ""
+        count = 0
+        while count < option_list.__len__():
+            if str(option_list[count]) == default:
+                default_number = str(count + 1)
+            count += 1
+
+        while True:
+            print("\n" + option_name + "\n")
+
+            count = 0
+            while count < option_list.__len__():
+                print("  " + str(count + 1) + "\t" + str(option_list[count]))
+                count += 1
+
+            number = prompt("\n[AXIOM] Select an option: ", default=default_number)
+
+            try:
+                number = int(number)
+                number -= 1
+            except (ValueError, TypeError):
+                number = -1
+
+            if 0 <= number < option_list.__len__():
+                return option_list[number]
+
+    def print_text(self):
+        """ SUMMARY:  prints command text to the screen (stylized), overrides inherited AxiomAction function
+              INPUT:  none, reads values from self
+             OUTPUT:  none, only prints to the screen """
+
+        text_with_placeholders = self.build_with_placeholders()
+        if isinstance(text_with_placeholders, str):
+            print("\n  TEXT:  " + text_with_placeholders)
+        elif isinstance(text_with_placeholders, list):
+            print("\n  TEXT:  ", end="")
+            print(text_with_placeholders[0])
+            line = 1
+            while line < text_with_placeholders.__len__():
+                print("         " + text_with_placeholders[line])
+                line += 1
+
+    def render(self, values):
+        """ SUMMARY:  replaces each input placeholder in the command text with the corresponding value
+              INPUT:  list of input values (str), one per item in input_list
+             OUTPUT:  returns finalized command text, either a string or list of strings """
+
+        input_count = 0
+
+        if isinstance(self.text[0], str) and self.text.__len__() == self.input_list.__len__() + 1:
+            built_text = [self.text[0]]
+            while input_count < self.input_list.__len__():
+                built_text.append(values[input_count])
+                input_count += 1
+                built_text.append(self.text[input_count])
+            return "".join(built_text)
+
+        elif isinstance(self.text[0], str):
+            token_count = 0
+            built_text = str()
+            while token_count < self.text.__len__() or input_count < self.input_list.__len__():
+                if token_count < self.text.__len__():
+                    built_text += self.text[token_count]
+                    token_count += 1
+                if input_count < self.input_list.__len__():
+                    built_text += values[input_count]
+                    input_count += 1
+        else:
+            built_text = []
+            current_line = 0
+            while current_line < self.text.__len__():
+                line_tokens = self.text[current_line].__len__()
+                current_token = 0
+                line_inputs = line_tokens - 1
+                current_input = 0
+                built_line = str()
+                while current_token < line_tokens or current_input < line_inputs:
+                    if current_token < line_tokens:
+                        built_line += self.text[current_line][current_token]
+                        current_token += 1
+                    if current_input < line_inputs:
+                        built_line += values[input_count]
+                        current_input += 1
+                        input_count += 1
+                built_text.append(built_line)
+                current_line += 1
+
+        return built_text
+
+    def resolve_bound_value(self, input_count):
+        """ SUMMARY:  looks up the value the active workspace binds to an input's name or type
+              INPUT:  current command input number (int), also reads values from self
+             OUTPUT:  validated and normalized value (str), or None if the input is unbound or its bound value is
+                      invalid for the input type """
+
+        input_name = self.input_list[input_count][0]
+        input_type = self.input_list[input_count][1]
+        raw_value = workspaces.lookup(input_name, input_type)
+
+        if raw_value is None:
+            return None
+
+        if input_type in ["STRMENU", "INTMENU"]:
+            value = self.resolve_option(self.input_list[input_count][2], raw_value)
+        else:
+            value = input_registry.normalize(input_type, raw_value)
+
+        if value is None:
+            print_error(str("[AXIOM] Ignoring bound value for " + input_name + " (invalid " + input_type + " value: " +
+                            raw_value + ")"))
+
+        return value
+
+    def resolve_input_values(self, item, resolvers=None):
+        """ SUMMARY:  converts input values keyed by input name into validated, normalized values in input order,
+                      resolving STRMENU/INTMENU options by value or by 1-based index
+              INPUT:  1) dictionary of input names and values (str or int) and 2) optional list from
+                      get_input_resolvers(), pass it when resolving a stream of input sets for the same command
+             OUTPUT:  list of input values (str), or an error string describing the first missing or invalid input """
+
+        if resolvers is None:
+            resolvers = self.get_input_resolvers()
+
+        values = []
+
+        for input_name, input_type, resolve in resolvers:
+            if input_name not in item:
+                return str("missing input " + input_name)
+
+            raw_value = item[input_name]
+            if not isinstance(raw_value, str):
+                raw_value = str(raw_value)
+
+            value = resolve(raw_value)
+
+            if value is None:
+                return str("invalid " + input_type + " value for " + input_name + ": " + raw_value)
+
+            values.append(value)
+
+        return values
+
+    @staticmethod
+    def resolve_option(option_list, raw_value):
+        """ returns the STRMENU/INTMENU option (str) matching a value or 1-based index (value wins), or None """
+
+        for option in option_list:
+            if str(option) == raw_value:
+                return raw_value
+
+        if raw_value.isdigit() and 1 <= int(raw_value) <= option_list.__len__():
+            return str(option_list[int(raw_value) - 1])
+
+        return None
+
+    def run_autonomous(self, tool):
+        """ SUMMARY:  builds and runs command as subprocess (blocking) or queues task for interactive execution
+                      overrides inherited AxiomAction function
+              INPUT:  AxiomTool object, also reads values from self
+             OUTPUT:  none """
+
+        inputs = self.collect_inputs()
+        text = self.render(inputs)
+        local = self.prompt_type == "bash" and not self.existing_subprocess()
+        details = self.describe_run(tool, inputs, local)
+
+        if local:
+            print()
+            self.execute_locally(text, details)
+
         else:
-            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, self.prompt_type))
+            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, self.prompt_type, details))
+            dispatch.monitor_task_queue()
+
+        dispatch.continue_trigger.set()
+
+    def run_interactive(self, tool):
+        """ SUMMARY:  builds command text and builds/queues interactive execution task
+                      overrides inherited AxiomAction function
+              INPUT:  AxiomTool object, also reads values from self
+             OUTPUT:  none """
+
+        inputs = self.collect_inputs()
+        text = self.render(inputs)
+        ending_prompt = self.extract_ending_prompt()
+        if ending_prompt is not False:
+            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, ending_prompt,
+                                                      self.describe_run(tool, inputs, False)))
             dispatch.monitor_task_queue()
 
-        dispatch.continue_trigger.set()
+        dispatch.continue_trigger.set()
+
+    def run_multiline_nx(self):
+        """ SUMMARY:  builds and prints multi-line command text to screen, overrides inherited AxiomAction function
+              INPUT:  none, reads values from self
+             OUTPUT:  no return values, only prints to screen """
+
+        text = self.build()
+        print()
+        line = 0
+        while line < self.text.__len__():
+            print(text[line])
+            line += 1
+        dispatch.continue_trigger.set()
+
+    def run_multiline_standalone(self, tool):
+        """ SUMMARY:  builds and executes command as subprocess or queues task for interactive execution
+                      overrides inherited AxiomAction function
+              INPUT:  AxiomTool object, also reads values from self
+             OUTPUT:  no return values """
+
+        inputs = self.collect_inputs()
+        text = self.render(inputs)
+        local = self.prompt_type == "bash" and not self.existing_subprocess()
+        details = self.describe_run(tool, inputs, local)
+
+        if local:
+            print()
+            self.execute_locally(text, details)
+
+        else:
+            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, self.prompt_type, details))
+            dispatch.monitor_task_queue()
+
+        dispatch.continue_trigger.set()
+
+    def run_nx(self):
+        """ SUMMARY:  builds and displays command text to screen, overrides inherited AxiomAction function
+              INPUT:  none, reads values from self
+             OUTPUT:  no return values, only prints to the screen """
+
+        text = self.build()
+        print()
+        print(text)
+        print()
+        dispatch.continue_trigger.set()
+
+    def run_standalone(self, tool):
+        """ SUMMARY:  builds and executes command as subprocess (blocking) or queues interactive task for execution
+                      overrides inherited AxiomAction function
+              INPUT:  AxiomTool object, also reads values from self
+             OUTPUT:  no return values """
+
+        inputs = self.collect_inputs()
+        text = self.render(inputs)
+        local = self.prompt_type == "bash" and not self.existing_subprocess()
+        details = self.describe_run(tool, inputs, local)
+
+        if local:
+            print()
+            self.execute_locally(text, details)
+
+        else:
+            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, self.prompt_type, details))
+            dispatch.monitor_task_queue()
+
+        dispatch.continue_trigger.set()
+
+    def show(self):
+        """ SUMMARY:  displays detailed information about the command, overrides inherited AxiomAction function
+              INPUT:  none, reads values from self
+             OUTPUT:  none, only prints to the screen """
+
+        print("\n  NAME:  " + self.name +
+              "\n  TYPE:  " + self.execution_type + " command (" + self.prompt_type + ")"
+                                                                                      "\n  NOTE:  " + self.note)
+
+        self.print_text()
+
+
+class AxiomDispatcher:
+    """ creates, manages, and interacts with subprocesses that require interactive input, multiplexing every session
+        on one asyncio event loop running in a daemon thread """
+
+    def __init__(self):
+        self.announcing = False
+        self.broadcasting = False
+        self.broker = None
+        self.broker_lock = Lock()
+        self.continue_trigger = Event()
+        self.failure = None
+        self.last_output = None
+        self.live_output = False
+        self.loop = None
+        self.next_id = 1
+        self.running = {}
+        self.running_lock = Lock()
+        self.spill_folder = None
+        self.subprocesses = []
+        self.tasking = Queue(maxsize=0)
+        self.trigger = Event()
+        self.warm_pool = []
+        self.warming = 0
+
+    def announce(self, future):
+        """ done callback of every submitted task, measures its duration and reports it if the user is sitting at a
+            prompt """
+
+        with self.running_lock:
+            current_task = self.running.get(future)
+            if current_task is not None:
+                current_task.duration = monotonic() - current_task.start_counter
+
+        if self.announcing:
+            self.report_finished_tasks()
+
+    def attach(self, session_id):
+        """ SUMMARY:  reattaches a detached session owned by the session broker to this instance
+              INPUT:  session ID (str) from the broker's session list
+             OUTPUT:  AxiomExecutingSubprocess object, or None if the session cannot be attached """
+
+        try:
+            reply, fds = self.broker_request({"action": "attach", "id": int(session_id)})
+        except ValueError:
+            print_error("\nERROR: Invalid session specified (see \"sessions\")")
+            return None
+        except OSError:
+            print_error("\nERROR: Failed to connect to session broker")
+            return None
+
+        if "error" in reply or fds.__len__() == 0:
+            print_error(str("\nERROR: " + reply.get("error", "Session broker did not send the session")))
+            return None
+
+        process = AxiomBrokerProcess(reply["id"], reply["pid"], fds[0])
+
+        self.start()
+
+        return run_coroutine_threadsafe(self.adopt(process, reply["prompt"], b64decode(reply["backlog"])),
+                                        self.loop).result()
+
+    async def adopt(self, process, prompt_type, backlog):
+        """ SUMMARY:  starts managing a pseudoterminal received from the session broker
+              INPUT:  1) AxiomBrokerProcess object, 2) its current prompt type name (str), and 3) output the broker
+                      buffered while the session was detached (bytes)
+             OUTPUT:  AxiomExecutingSubprocess object """
+
+        session = AxiomExecutingSubprocess(process.session_id, prompt_type, process,
+                                           str(self.spill_folder + "/session-" + str(process.session_id) + ".log"))
+        self.next_id = max(self.next_id, process.session_id + 1)
+        session.pending += backlog
+        self.subprocesses.append(session)
+        self.loop.add_reader(process.child_fd, self.drain_session, session)
+
+        return session
+
+    async def broadcast(self, sessions, current_task):
+        """ SUMMARY:  transmits a task's text to several sessions at once, collecting each session's output while the
+                      sessions run in parallel and then displaying the collected output one session at a time, any
+                      output that arrived before the task is displayed first and is not part of the collected output
+              INPUT:  1) list of AxiomExecutingSubprocess objects and 2) an AxiomInteractiveTask object
+             OUTPUT:  None, or the first session's failure message (str), prints to the screen """
+
+        current_task.sessions = sessions
+
+        try:
+            failures = await gather(*[self.read_and_transmit(x, current_task, True) for x in sessions])
+
+        finally:
+            for x in sessions:
+                if x.capture is not None:
+                    output = bytes(x.capture)
+                    x.capture = None
+                    self.last_output = None
+                    self.write_output(x, output)
+                    print()
+
+        metrics.increment("axiom_dispatcher_broadcasts_total")
+        metrics.observe("axiom_dispatcher_broadcast_sessions", sessions.__len__())
+
+        for failure in failures:
+            if failure is not None:
+                return failure
+
+        return None
+
+    def broker_request(self, message):
+        """ SUMMARY:  sends one request to the session broker over a connection kept for this instance's lifetime,
+                      sessions stay attached to this instance until the connection closes
+              INPUT:  request (dict)
+             OUTPUT:  two-item tuple, reply (dict) and list of received file descriptors, raises OSError on failure """
+
+        with self.broker_lock:
+            if self.broker is None:
+                broker = socket(AF_UNIX, SOCK_STREAM)
+                try:
+                    broker.connect(AxiomBroker.socket_filename())
+                except OSError:
+                    broker.close()
+                    raise
+                self.broker = broker
+
+            try:
+                self.broker.sendall(str(dumps(message) + "\n").encode())
+                data, fds = recv_fds(self.broker, 65536, 1)[0:2]
+
+                while not data.endswith(b"\n"):
+                    block = self.broker.recv(65536)
+                    if not block:
+                        raise ConnectionError("session broker closed the connection")
+                    data += block
+
+            except OSError:
+                self.broker.close()
+                self.broker = None
+                raise
+
+        return loads(data), fds
+
+    def count_running(self):
+        """ returns the number (int) of submitted interactive tasks that have not finished """
+
+        with self.running_lock:
+            return [x for x in self.running if not x.done()].__len__()
+
+    def drain_session(self, session):
+        """ SUMMARY:  event loop reader callback, moves a session's available output into its pending buffer
+              INPUT:  an AxiomExecutingSubprocess object whose pseudoterminal is readable
+             OUTPUT:  none, stops watching the pseudoterminal once the subprocess closes it """
+
+        session.drain()
+
+        if session.closed:
+            self.loop.remove_reader(session.process.child_fd)
+
+        self.relay_if_idle(session)
+
+    async def fill_warm_pool(self):
+        """ SUMMARY:  pre-spawns /bin/bash pseudoterminals until the warm pool is full, each one is reaped if it stays
+                      unused for the pool's idle timeout
+              INPUT:  none, reads values from self and global config object
+             OUTPUT:  none, appends to self.warm_pool """
+
+        while self.warm_pool.__len__() + self.warming < config.axiom.warm_pool["size"]:
+            self.warming += 1
+
+            try:
+                process = await self.loop.run_in_executor(None, self.spawn_bash)
+            except OSError:
+                metrics.increment("axiom_dispatcher_spawn_failures_total")
+                return
+            finally:
+                self.warming -= 1
+
+            self.warm_pool.append(process)
+            self.loop.call_later(config.axiom.warm_pool["idle_timeout"], self.reap_warm_pty, process)
+
+    def find(self, session_id):
+        """ returns the AxiomExecutingSubprocess object with a matching session ID (str or int) or None """
+
+        for x in self.subprocesses:
+            if str(x.id) == str(session_id):
+                return x
+
+        return None
+
+    async def get_subprocess_output_detect_prompt(self, session):
+        """ SUMMARY:  prints subprocess output to the screen while searching for any configured interactive prompt,
+                      waking only on new output or a deadline until the prompt settles for pattern_timeout seconds
+              INPUT:  an AxiomExecutingSubprocess object
+             OUTPUT:  number of bytes read from the subprocess (int) and the detected prompt type name (str or None),
+                      prints output to the screen """
+
+        observed_prompt = None
+        output_bytes = 0
+        settle_deadline = None
+        safety_deadline = monotonic() + config.axiom.safety_timeout
+
+        while True:
+            if settle_deadline is None:
+                data = await session.read_available(safety_deadline)
+            else:
+                data = await session.read_available(settle_deadline)
+
+            if data:
+                output_bytes += data.__len__()
+                self.write_output(session, data)
+                safety_deadline = monotonic() + config.axiom.safety_timeout
+                observed_prompt = prompt_types.detect(session.tail)
+
+                if observed_prompt is not None:
+                    settle_deadline = monotonic() + config.axiom.pattern_timeout
+                else:
+                    settle_deadline = None
+
+            elif session.closed or settle_deadline is not None:
+                if session.capture is None:
+                    print()
+                break
+
+            else:
+                await self.loop.run_in_executor(None, session.process.sendline)
+                metrics.increment("axiom_dispatcher_safety_enters_total")
+                safety_deadline = monotonic() + config.axiom.safety_timeout
+
+        return output_bytes, observed_prompt
+
+    def matching_subprocesses(self, prompt_type):
+        """ SUMMARY:  locates open subprocesses whose current prompt type matches, the first one is where a task with
+                      that starting prompt type goes unless broadcasting
+              INPUT:  prompt type name (str)
+             OUTPUT:  list of AxiomExecutingSubprocess objects, most recently used (or selected) first """
+
+        matches = [x for x in self.subprocesses if x.current_prompt == prompt_type and not x.closed]
+
+        return sorted(matches, key=lambda x: x.last_used, reverse=True)
+
+    def monitor_task_queue(self):
+        """ SUMMARY:  submits any queued tasks to the event loop and returns without waiting for them, a task only waits
+                      for running tasks in the sessions it will be sent to, finished tasks are reported by notify()
+              INPUT:  none, gets AxiomInteractiveTask objects from the "tasking" queue
+             OUTPUT:  none """
+
+        while not self.tasking.empty():
+            current_task = self.tasking.get()
+            self.wait_for_sessions(current_task.starting_prompt)
+
+            current_task.start_counter = monotonic()
+            future = self.submit(current_task)
+            with self.running_lock:
+                self.running[future] = current_task
+            future.add_done_callback(self.announce)
+
+            self.tasking.task_done()
+
+    def notify(self):
+        """ SUMMARY:  prints one line for every interactive task that finished since the previous notification, called
+                      from the UI thread so it can exit if a task failed to spawn or transmit to its subprocess
+              INPUT:  none, reads values from self
+             OUTPUT:  none """
+
+        self.report_finished_tasks()
+
+        if self.failure is not None:
+            exit(1)
+
+    def print_backlog(self, session):
+        """ SUMMARY:  displays a session's unread output, waiting for any task running in that session to finish
+              INPUT:  an AxiomExecutingSubprocess object
+             OUTPUT:  number of bytes displayed (int), prints to the screen """
+
+        return run_coroutine_threadsafe(self.print_backlog_when_idle(session), self.loop).result()
+
+    async def print_backlog_when_idle(self, session):
+        """ displays a session's unread output once it is not running a task, returns the number of bytes (int) """
+
+        async with session.lock:
+            self.last_output = None
+            return await self.print_unread_output(session)
+
+    async def print_unread_output(self, session):
+        """ SUMMARY:  displays all of a session's unread output, including any output spilled to disk
+              INPUT:  an AxiomExecutingSubprocess object
+             OUTPUT:  number of bytes displayed (int), prints to the screen """
+
+        output_bytes = 0
+
+        while True:
+            data = await session.read_available(None)
+            if not data:
+                break
+            output_bytes += data.__len__()
+            self.write_output(session, data)
+
+        return output_bytes
+
+    async def read_and_transmit(self, session, current_task, capture=False):
+        """ SUMMARY:  prints prior program output, transmits text to existing subprocess, and updates the prompt, tasks
+                      for the same subprocess take turns while tasks for other subprocesses proceed concurrently
+              INPUT:  1) targeted AxiomExecutingSubprocess object, 2) AxiomInteractiveTask object from "tasking" queue,
+                      and 3) True to collect the task's output in session.capture instead of printing it
+             OUTPUT:  None, or a failure message (str) if the text could not be transmitted """
+
+        async with session.lock:
+            if session.current_prompt != current_task.starting_prompt:
+                print_error("\nERROR: Prompt type incompatible with current runtime")
+                return None
+
+            metrics.increment("axiom_dispatcher_bytes_read_total", await self.print_unread_output(session))
+
+            if capture:
+                session.capture = bytearray()
+
+            failure = await self.transmit_text(current_task, session)
+
+        return failure
+
+    def reap_warm_pty(self, process):
+        """ terminates a pre-spawned pseudoterminal that was never used, the pool refills when the next one is used """
+
+        if process in self.warm_pool:
+            self.warm_pool.remove(process)
+            self.loop.run_in_executor(None, process.close, True)
+            metrics.increment("axiom_dispatcher_warm_pool_total", 1, {"result": "reaped"})
+
+    def remove_spill_files(self):
+        """ deletes every session's spill file and the spill folder when AXIOM Framework exits, since unread output may
+            include credentials """
+
+        for x in self.subprocesses:
+            x.remove_spill_file()
+
+        if self.spill_folder is not None:
+            rmtree(self.spill_folder, ignore_errors=True)
+
+    def report_finished_tasks(self):
+        """ prints one line for every interactive task that finished since the previous report, and the error of any
+            task that failed, which is kept for notify() """
+
+        with self.running_lock:
+            for future in [x for x in self.running if x.done()]:
+                current_task = self.running.pop(future)
+                failure = future.result()
+
+                if failure is not None:
+                    print_error(str("ERROR: " + failure))
+                    self.failure = self.failure or failure
+                elif current_task.sessions.__len__() > 0 and current_task.details is not None:
+                    print("[AXIOM] " + ("Session " if current_task.sessions.__len__() == 1 else "Sessions ") +
+                          ", ".join([str(x.id) for x in current_task.sessions]) + " finished " +
+                          current_task.details["tool"] + " / " + current_task.details["command"] + " after " +
+                          str(round(current_task.duration, 1)) + "s")
+
+    def relay_if_idle(self, session):
+        """ starts relaying a session's output to the screen if live output is enabled and no task is running in it """
+
+        if self.live_output and not session.relaying and not session.lock.locked():
+            session.relaying = True
+            self.loop.create_task(self.relay_live_output(session))
+
+    async def relay_live_output(self, session):
+        """ SUMMARY:  displays an idle session's unread output while the user waits at an interactive prompt
+              INPUT:  an AxiomExecutingSubprocess object
+             OUTPUT:  none, prints to the screen above the input line """
+
+        try:
+            async with session.lock:
+                while self.live_output:
+                    data = await session.read_available(None)
+                    if not data:
+                        break
+                    self.write_output(session, data)
+        finally:
+            session.relaying = False
+
+    async def route_task(self, current_task):
+        """ SUMMARY:  routes a task based on runtime context, running on the dispatcher's event loop
+              INPUT:  an AxiomInteractiveTask object
+             OUTPUT:  None when the task's output is complete or the task is rejected, or a failure message (str) if a
+                      subprocess could not be spawned or written to, never exits since it runs on the loop thread """
+
+        targets = self.matching_subprocesses(current_task.starting_prompt)
+
+        if targets.__len__() > 1 and self.broadcasting:
+            print("\n[AXIOM] Broadcasting to sessions " + ", ".join([str(x.id) for x in targets]))
+            return await self.broadcast(targets, current_task)
+        elif targets.__len__() > 0:
+            if targets.__len__() > 1:
+                print("\n[AXIOM] Sending to session " + str(targets[0].id) + " (enter \"use ID\" to choose another)")
+            current_task.sessions = targets[0:1]
+            return await self.read_and_transmit(targets[0], current_task)
+        elif current_task.starting_prompt == "bash":
+            return await self.spawn_and_transmit(current_task)
+        else:
+            print_error("\nERROR: Prompt type incompatible with current runtime")
+
+        return None
+
+    def spawn_brokered_bash(self, prompt_type):
+        """ SUMMARY:  asks the session broker, starting it if needed, to spawn an interactive /bin/bash pseudoterminal
+              INPUT:  prompt type name (str) recorded by the broker
+             OUTPUT:  AxiomBrokerProcess object, or None if the broker is unavailable """
+
+        if not AxiomBroker.ping() and not AxiomBroker.launch():
+            print_error("ERROR: Failed to start session broker, spawning a local subprocess")
+            return None
+
+        try:
+            reply, fds = self.broker_request({"action": "spawn", "prompt": prompt_type})
+        except OSError:
+            print_error("ERROR: Failed to connect to session broker, spawning a local subprocess")
+            return None
+
+        if "error" in reply or fds.__len__() == 0:
+            print_error(str("ERROR: " + reply.get("error", "Session broker did not send the session") +
+                            ", spawning a local subprocess"))
+            return None
+
+        return AxiomBrokerProcess(reply["id"], reply["pid"], fds[0])
+
+    async def spawn_and_transmit(self, current_task):
+        """ SUMMARY:  creates a new subprocess, transmits a command's/action's executable text, and updates the prompt
+              INPUT:  an AxiomInteractiveTask object from the "tasking" queue
+             OUTPUT:  None, or a failure message (str) if the subprocess could not be spawned or written to """
+
+        spawn_start = monotonic()
+
+        try:
+            process = self.take_warm_pty()
+            if process is None and config.axiom.broker:
+                process = await self.loop.run_in_executor(None, self.spawn_brokered_bash, current_task.starting_prompt)
+            if process is None:
+                process = self.spawn_bash()
+
+        except OSError:
+            metrics.increment("axiom_dispatcher_spawn_failures_total")
+            return "Failed to spawn /bin/bash subprocess"
+
+        else:
+            metrics.observe("axiom_dispatcher_spawn_seconds", monotonic() - spawn_start)
+
+            if isinstance(process, AxiomBrokerProcess):
+                session = await self.adopt(process, current_task.starting_prompt, bytes())
+            else:
+                session = AxiomExecutingSubprocess(self.next_id, current_task.starting_prompt, process,
+                                                   str(self.spill_folder + "/session-" + str(self.next_id) + ".log"))
+                self.next_id += 1
+                self.subprocesses.append(session)
+                self.loop.add_reader(process.child_fd, self.drain_session, session)
+
+            current_task.sessions = [session]
+
+            if config.axiom.warm_pool["size"] > 0 and not config.axiom.broker:
+                self.loop.create_task(self.fill_warm_pool())
+
+            async with session.lock:
+                return await self.transmit_text(current_task, session)
+
+    def select(self, session):
+        """ makes a session the one that receives tasks for its prompt type and stops broadcasting """
+
+        session.last_used = monotonic()
+        self.broadcasting = False
+
+    def set_announcing(self, enabled):
+        """ SUMMARY:  enables or disables reporting tasks from the event loop the moment they finish, and displaying
+                      their output through sys.stdout, which is only safe while a prompt patches stdout, enabling it
+                      also reports tasks that already finished
+              INPUT:  True or False
+             OUTPUT:  none """
+
+        self.announcing = enabled
+
+        if enabled:
+            self.report_finished_tasks()
+
+    def set_live_output(self, enabled):
+        """ SUMMARY:  enables or disables displaying idle sessions' output as it arrives, enabling it also relays any
+                      output that arrived while it was disabled
+              INPUT:  True or False
+             OUTPUT:  none """
+
+        self.live_output = enabled
+
+        if enabled and self.loop is not None:
+            self.last_output = None
+            for x in self.subprocesses:
+                self.loop.call_soon_threadsafe(self.relay_if_idle, x)
+
+    def show(self):
+        """ SUMMARY:  displays every interactive session with its prompt type, state, and amount of unread output
+              INPUT:  none, reads values from self
+             OUTPUT:  none, only prints to the screen """
+
+        brokered = []
+
+        if config.axiom.broker and AxiomBroker.ping():
+            try:
+                local_ids = [x.id for x in self.subprocesses if isinstance(x.process, AxiomBrokerProcess)]
+                brokered = [x for x in self.broker_request({"action": "list"})[0].get("sessions", [])
+                            if x["id"] not in local_ids]
+            except OSError:
+                print_error("\nERROR: Failed to connect to session broker")
+
+        if self.subprocesses.__len__() == 0 and brokered.__len__() == 0:
+            print("\nNo interactive sessions (run an interactive command to start one)\n")
+            return
+
+        selected = []
+        for prompt_type in set([x.current_prompt for x in self.subprocesses]):
+            selected += self.matching_subprocesses(prompt_type)[0:1]
+
+        print("\n" + "    ID  " + "PROMPT".ljust(14) + "STATE".ljust(10) + "UNREAD".rjust(12) + "OUTPUT".rjust(12))
+        for x in self.subprocesses:
+            print(("  * " if x in selected and not self.broadcasting else "    ") + str(x.id).rjust(2) + "  " +
+                  str(x.current_prompt).ljust(14) +
+                  ("closed" if x.closed else "open").ljust(10) + str(x.count_unread()).rjust(12) +
+                  str(x.output_bytes).rjust(12))
+        for x in brokered:
+            print("    " + str(x["id"]).rjust(2) + "  " + str(x["prompt"]).ljust(14) + str(x["state"]).ljust(10) +
+                  str(x["unread"]).rjust(12) + "-".rjust(12))
+
+        if self.broadcasting:
+            print("\nBroadcasting each task to every open session with its starting prompt type")
+        else:
+            print("\n* receives tasks for its prompt type (\"use ID\" selects another session, \"use all\" broadcasts)")
+        print()
+
+    @staticmethod
+    def spawn_bash():
+        """ starts an interactive /bin/bash pseudoterminal subprocess, raises OSError on failure """
+
+        return pty_spawn.spawn("/bin/bash -i", timeout=config.axiom.pty_timeout)
+
+    def start(self):
+        """ creates the event loop shared by every interactive session and runs it in a daemon thread """
+
+        if self.loop is None:
+            self.spill_folder = str(config.axiom.binary_folder + "/sessions/" + strftime("%Y%m%d-%H%M%S", localtime()) +
+                                    "-" + str(getpid()))
+            self.loop = new_event_loop()
+            Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def submit(self, current_task):
+        """ SUMMARY:  schedules a task on the dispatcher's event loop without waiting for it
+              INPUT:  an AxiomInteractiveTask object
+             OUTPUT:  a future (concurrent.futures.Future) resolved when the task completes """
+
+        self.start()
+
+        return run_coroutine_threadsafe(self.route_task(current_task), self.loop)
+
+    def take_warm_pty(self):
+        """ SUMMARY:  removes a live pre-spawned pseudoterminal from the warm pool
+              INPUT:  none, reads values from self
+             OUTPUT:  a pseudoterminal subprocess object from pty_spawn, or None if the pool is empty """
+
+        while self.warm_pool.__len__() > 0:
+            process = self.warm_pool.pop(0)
+            if process.isalive():
+                metrics.increment("axiom_dispatcher_warm_pool_total", 1, {"result": "hit"})
+                return process
+            self.loop.run_in_executor(None, process.close, True)
+
+        if config.axiom.warm_pool["size"] > 0:
+            metrics.increment("axiom_dispatcher_warm_pool_total", 1, {"result": "miss"})
+
+        return None
+
+    async def transmit_text(self, current_task, session):
+        """ SUMMARY:  transmits line-buffered input to a subprocess, waits for & displays the subprocess's output, and
+                      updates the subprocess's prompt to the prompt type actually observed (or the declared one)
+              INPUT:  1) an AxiomInteractiveTask object and 2) an AxiomExecutingSubprocess object
+             OUTPUT:  None, or a failure message (str) if the text could not be transmitted, prints to the screen and
+                      records the task in the result store from an executor thread, since hashing its output files
+                      must not stall other sessions """
+
+        proc = session.process
+        start_time = time()
+        start_counter = monotonic()
+        session.last_used = start_counter
+
+        try:
+            if isinstance(current_task.text, str):
+                await self.loop.run_in_executor(None, proc.sendline, current_task.text)
+            elif isinstance(current_task.text, list):
+                i = 0
+                while i < current_task.text.__len__():
+                    await self.loop.run_in_executor(None, proc.sendline, current_task.text[i])
+                    i += 1
+
+        except OSError:
+            return "Failed to transmit command"
+
+        else:
+            output_bytes, observed_prompt = await self.get_subprocess_output_detect_prompt(session)
+            duration = monotonic() - start_counter
+
+            if observed_prompt is None:
+                observed_prompt = current_task.ending_prompt
+            elif observed_prompt != current_task.ending_prompt:
+                print(str("[AXIOM] Detected " + observed_prompt + " prompt (expected " + current_task.ending_prompt +
+                          ")"))
+                metrics.increment("axiom_dispatcher_prompt_transitions_total", 1,
+                                  {"expected": current_task.ending_prompt, "observed": observed_prompt})
+
+            session.current_prompt = observed_prompt
+            session.prompt_pattern = prompt_types.patterns.get(observed_prompt)
+
+            if isinstance(proc, AxiomBrokerProcess):
+                try:
+                    await self.loop.run_in_executor(None, self.broker_request,
+                                                    {"action": "update", "id": session.id, "prompt": observed_prompt})
+                except OSError:
+                    print_error("ERROR: Failed to update prompt state in session broker")
+            metrics.observe("axiom_dispatcher_prompt_wait_seconds", duration,
+                            {"prompt_type": current_task.ending_prompt})
+            metrics.increment("axiom_dispatcher_bytes_read_total", output_bytes)
+            await self.loop.run_in_executor(None, result_store.record, current_task.details, current_task.text,
+                                            {"start_time": start_time, "end_time": time(), "duration": duration,
+                                             "output_bytes": output_bytes})
+
+        return None
+
+    def wait_for_sessions(self, prompt_type):
+        """ SUMMARY:  waits for the running tasks that a task with the given starting prompt type must follow: tasks in
+                      the sessions it would be sent to, tasks whose session is still being spawned with that prompt
+                      type, and tasks expected to leave a session at that prompt type
+              INPUT:  prompt type name (str)
+             OUTPUT:  none, reports the tasks that finished (exiting if one of them failed) """
+
+        targets = self.matching_subprocesses(prompt_type)
+        if not self.broadcasting:
+            targets = targets[0:1]
+
+        with self.running_lock:
+            busy = [future for future, current_task in self.running.items() if not future.done() and
+                    (current_task.ending_prompt == prompt_type or
+                     any(x in targets for x in current_task.sessions) or
+                     (current_task.sessions.__len__() == 0 and current_task.starting_prompt == prompt_type))]
+
+        if busy.__len__() > 0:
+            wait(busy)
+            self.notify()
+
+    def warm_up(self):
+        """ starts filling the warm pool of pre-spawned /bin/bash pseudoterminals in the background, if enabled """
+
+        if config.axiom.warm_pool["size"] > 0 and not config.axiom.broker:
+            self.start()
+            run_coroutine_threadsafe(self.fill_warm_pool(), self.loop)
+
+    def write_output(self, session, data):
+        """ SUMMARY:  writes a session's output to the screen, labeling it whenever output switches between sessions,
+                      through sys.stdout while a prompt patches stdout so prompt_toolkit prints it above the input line
+              INPUT:  1) an AxiomExecutingSubprocess object and 2) bytes read from its subprocess
+             OUTPUT:  none, only prints to the screen or collects the output while the session is broadcasting """
+
+        if session.capture is not None:
+            session.capture += data
+            return
+
+        if self.last_output is not session and (self.live_output or self.subprocesses.__len__() > 1):
+            print(str("\n[AXIOM] Session " + str(session.id) + " (" + session.current_prompt + "):"), flush=True)
+
+        self.last_output = session
+        session.output_bytes += data.__len__()
+
+        if self.live_output or self.announcing:
+            print(session.display_decoder.decode(data), end="", flush=True)
+        else:
+            stdout.buffer.write(data)
+            stdout.buffer.flush()
+
+
+class AxiomExecutingSubprocess:
+    """ structure for managing subprocesses that require interactive input """
+
+    tail_size = 512
+
+    def __init__(self, session_id, current_prompt, process, spill_filename):
+        self.capture = None
+        self.closed = False
+        self.current_prompt = current_prompt
+        self.decoder = getincrementaldecoder("utf-8")(errors="replace")
+        self.display_decoder = getincrementaldecoder("utf-8")(errors="replace")
+        self.id = session_id
+        self.last_used = monotonic()
+        self.lock = AsyncLock()
+        self.output_bytes = 0
+        self.pending = bytearray()
+        self.process = process
+        self.prompt_pattern = None
+        self.readable = AsyncEvent()
+        self.relaying = False
+        self.spill_file = None
+        self.spill_filename = spill_filename
+        self.spill_offset = 0
+        self.spilled = 0
+        self.tail = str()
+
+        set_blocking(process.child_fd, False)
+
+    def count_unread(self):
+        """ returns the number of bytes (int) read from the subprocess but not yet displayed """
+
+        return self.pending.__len__() + self.spilled - self.spill_offset
+
+    def drain(self):
+        """ SUMMARY:  reads all output currently available from the non-blocking pseudoterminal in chunks, so the
+                      subprocess never blocks on a full pseudoterminal even when no task is running
+              INPUT:  none, reads from self.process
+             OUTPUT:  none, appends to self.pending and wakes any coroutine waiting in read_available """
+
+        while True:
+            try:
+                chunk = read(self.process.child_fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                self.closed = True
+                break
+
+            if not chunk:
+                self.closed = True
+                break
+
+            self.pending += chunk
+
+            if self.pending.__len__() > config.axiom.session_buffer:
+                self.spill()
+
+        if self.closed and self.spilled == 0:
+            self.remove_spill_file()
+
+        self.readable.set()
+
+    async def read_available(self, deadline):
+        """ SUMMARY:  waits until the session has unread output or a deadline passes, then takes the oldest unread
+                      output (spilled output first, in chunks) and updates the tail window used for prompt detection
+              INPUT:  deadline (float) on the monotonic clock, or None to return without waiting
+             OUTPUT:  bytes read from the subprocess, empty if the deadline passed or the subprocess closed """
+
+        if self.count_unread() == 0 and not self.closed and deadline is not None:
+            try:
+                await wait_for(self.readable.wait(), max(deadline - monotonic(), 0))
+            except AsyncTimeoutError:
+                pass
+
+        self.readable.clear()
+
+        if self.spilled > self.spill_offset:
+            data = self.read_spilled()
+        else:
+            data = bytes(self.pending)
+            self.pending = bytearray()
+
+        if data:
+            self.update_tail(data)
+
+        return data
+
+    def read_spilled(self):
+        """ SUMMARY:  reads the next chunk of output spilled to disk, emptying the spill file once all of it is read
+              INPUT:  none, reads values from self
+             OUTPUT:  bytes read from the spill file """
+
+        try:
+            self.spill_file.seek(self.spill_offset)
+            data = self.spill_file.read(min(self.spilled - self.spill_offset, 1048576))
+        except OSError:
+            data = bytes()
+
+        if not data:
+            self.spill_offset = self.spilled
+        else:
+            self.spill_offset += data.__len__()
+
+        if self.spill_offset >= self.spilled:
+            try:
+                self.spill_file.truncate(0)
+            except OSError:
+                pass
+            self.spill_offset = 0
+            self.spilled = 0
+            if self.closed:
+                self.remove_spill_file()
+
+        return data
+
+    def remove_spill_file(self):
+        """ closes and deletes the session's spill file (which may hold sensitive output) once it is drained """
+
+        if self.spill_file is None:
+            return
+
+        try:
+            self.spill_file.close()
+            remove(self.spill_filename)
+        except OSError:
+            pass
+
+        self.spill_file = None
+
+    def spill(self):
+        """ SUMMARY:  moves the oldest unread output held in memory to the spill file, or discards it if the spill file
+                      cannot be written, keeping the newest half of session_buffer in memory
+              INPUT:  none, reads values from self and global config object
+             OUTPUT:  none, updates self.pending and the spill file """
+
+        excess = self.pending.__len__() - config.axiom.session_buffer // 2
+
+        try:
+            if self.spill_file is None:
+                makedirs(path.dirname(self.spill_filename), exist_ok=True)
+                self.spill_file = open(self.spill_filename, 'w+b')
+            self.spill_file.seek(0, 2)
+            self.spill_file.write(self.pending[:excess])
+            self.spilled += excess
+            metrics.increment("axiom_dispatcher_spilled_bytes_total", excess)
+
+        except OSError:
+            metrics.increment("axiom_dispatcher_dropped_bytes_total", excess)
+
+        del self.pending[:excess]
+
+    def update_tail(self, data):
+        """ SUMMARY:  incrementally decodes new output and keeps a bounded window of the unterminated last line, so
+                      prompt matching costs the same no matter how much output the subprocess produces
+              INPUT:  bytes read from the subprocess
+             OUTPUT:  none, updates self.tail """
+
+        text = str(self.tail + self.decoder.decode(bytes(data)))
+        line_start = text.rfind("\n")
+
+        self.tail = text[line_start + 1:][-self.tail_size:]
+
+
+class AxiomExecution:
+    """ a local subprocess bounded by resource limits and an optional wall-clock timeout """
+
+    launcher = str("import os, resource, sys\n" +
+                   "try:\n" +
+                   "    if sys.argv[1] == 'group':\n" +
+                   "        os.setpgid(0, 0)\n" +
+                   "    for name, value in zip(['RLIMIT_CPU', 'RLIMIT_AS', 'RLIMIT_NOFILE'], sys.argv[2:5]):\n" +
+                   "        if value != '-':\n" +
+                   "            resource.setrlimit(getattr(resource, name), tuple(map(int, value.split(':'))))\n" +
+                   "    os.execvp(sys.argv[5], sys.argv[5:])\n" +
+                   "except OSError as error:\n" +
+                   "    sys.stderr.write(sys.argv[5] + ': ' + str(error.strerror) + '\\n')\n" +
+                   "    os._exit(127)\n")
+
+    def __init__(self, args, shell, limits, input_lines, output_file=None):
+        """ SUMMARY:  creates an execution that has not started yet
+              INPUT:  1) argument list or shell command text, 2) True if text is interpreted by the shell, 3) dictionary
+                      of limit names and values (int or None), 4) list of lines written to STDIN (or None), and 5) an
+                      open binary file receiving STDOUT + STDERR instead of the screen (or None to run in the
+                      foreground)
+             OUTPUT:  none, instantiates AxiomExecution object """
+
+        self.args = args
+        self.capture_file = None
+        self.duration = None
+        self.end_time = None
+        self.finished = Event()
+        self.foreground = output_file is None
+        self.input_lines = input_lines
+        self.limits = limits
+        self.output_bytes = 0
+        self.output_file = output_file
+        self.process = None
+        self.process_group = limits.get("timeout") is not None or not self.foreground
+        self.relay = None
+        self.return_code = None
+        self.rusage = None
+        self.shell = shell
+        self.start_counter = None
+        self.start_time = None
+        self.terminal_size = None
+        self.termination_reason = None
+        self.timers = []
+
+    def build_args(self):
+        """ SUMMARY:  builds the argument list passed to Popen(), prefixed with the launcher (a short Python program
+                      that starts a process group and sets rlimits, then executes the program) when either is needed,
+                      since preexec_fn is unsafe in a process with threads
+              INPUT:  none, reads values from self
+             OUTPUT:  list of arguments (str) """
+
+        args = ["/bin/sh", "-c", self.args] if self.shell else self.args[:]
+
+        limits = [self.limits.get("cpu_time"), self.limits.get("address_space"), self.limits.get("open_files")]
+        if not self.process_group and limits == [None, None, None]:
+            return args
+
+        if limits[0] is not None:
+            limits[0] = str(str(limits[0]) + ":" + str(limits[0] + 1))
+        if limits[1] is not None:
+            limits[1] = str(str(limits[1] * 1024 * 1024) + ":" + str(limits[1] * 1024 * 1024))
+        if limits[2] is not None:
+            limits[2] = str(str(limits[2]) + ":" + str(limits[2]))
+
+        return [executable, "-I", "-S", "-c", self.launcher, "group" if self.process_group else "-"] + \
+            ["-" if x is None else x for x in limits] + args
+
+    def describe_termination(self):
+        """ SUMMARY:  explains why the subprocess ended abnormally
+              INPUT:  none, reads values from self
+             OUTPUT:  string describing the reason or None if the subprocess exited on its own """
+
+        if self.termination_reason is not None:
+            return self.termination_reason
+
+        if self.return_code is not None and self.return_code < 0:
+            try:
+                signal_name = Signals(-self.return_code).name
+            except ValueError:
+                signal_name = str("signal " + str(-self.return_code))
+
+            if -self.return_code == SIGXCPU or \
+                    (-self.return_code == SIGKILL and self.limits.get("cpu_time") is not None):
+                return str("exceeded the " + str(self.limits["cpu_time"]) + " second CPU time limit (" +
+                           signal_name + ")")
+
+            return str("terminated by " + signal_name)
+
+        return None
+
+    def get_max_rss(self):
+        """ returns the subprocess's peak resident set size in kilobytes, or None if unavailable """
+
+        if self.rusage is None:
+            return None
+        elif config.axiom.platform == "macOS":
+            return int(self.rusage.ru_maxrss / 1024)
+        else:
+            return int(self.rusage.ru_maxrss)
+
+    def get_measurements(self):
+        """ SUMMARY:  collects the timing, exit, and resource usage values of a finished subprocess
+              INPUT:  none, reads values from self
+             OUTPUT:  dictionary of measurements passed to the result store """
+
+        if self.rusage is not None:
+            user_time = self.rusage.ru_utime
+            system_time = self.rusage.ru_stime
+        else:
+            user_time = None
+            system_time = None
+
+        return {"start_time": self.start_time, "end_time": self.end_time, "duration": self.duration,
+                "exit_code": self.return_code, "termination": self.describe_termination(),
+                "user_time": user_time, "system_time": system_time, "max_rss": self.get_max_rss(),
+                "output_bytes": self.output_bytes}
+
+    def give_terminal(self):
+        """ SUMMARY:  puts a new subprocess in its own process group from the parent as well as the child (whichever
+                      runs first wins the race) and makes it the terminal's foreground process group, resuming it in
+                      case it tried to read the terminal before the handoff
+              INPUT:  none, reads values from self
+             OUTPUT:  none """
+
+        try:
+            setpgid(self.process.pid, self.process.pid)
+        except OSError:
+            pass
+
+        if self.foreground and isatty(0):
+            try:
+                previous_handler = signal(SIGTTOU, SIG_IGN)
+                tcsetpgrp(0, self.process.pid)
+                signal(SIGTTOU, previous_handler)
+                killpg(self.process.pid, SIGCONT)
+            except OSError:
+                pass
+
+    def record_exit(self, status):
+        """ SUMMARY:  stores the exit code and timing after the subprocess has been reaped, stops the output relay
+              INPUT:  wait status (int) returned by wait4(), or None if unavailable
+             OUTPUT:  none """
+
+        self.duration = monotonic() - self.start_counter
+        self.end_time = time()
+
+        if status is None:
+            self.return_code = self.process.returncode
+        elif WIFSIGNALED(status):
+            self.return_code = -WTERMSIG(status)
+        else:
+            self.return_code = WEXITSTATUS(status)
+
+        self.process.returncode = self.return_code
+        self.finished.set()
+        if self.relay is not None:
+            self.relay.join()
+
+        if self.termination_reason is not None or self.return_code < 0:
+            outcome = "terminated"
+        elif self.return_code == 0:
+            outcome = "succeeded"
+        else:
+            outcome = "failed"
+
+        metrics.observe("axiom_execution_seconds", self.duration, {"outcome": outcome})
+        metrics.increment("axiom_executions_total", 1, {"outcome": outcome})
+        if self.output_bytes is not None:
+            metrics.increment("axiom_execution_output_bytes_total", self.output_bytes)
+
+    def relay_output(self, output_fd):
+        """ SUMMARY:  copies subprocess output to the screen (or output file) while counting the bytes, runs in a
+                      separate thread
+              INPUT:  file descriptor (int) of the pseudo-terminal master or pipe read end
+             OUTPUT:  none """
+
+        while True:
+            if self.terminal_size is not None:
+                self.resize_terminal(output_fd)
+
+            try:
+                readable = select([output_fd], [], [], 0.1)[0]
+                if not readable:
+                    if self.finished.is_set():
+                        break
+                    continue
+
+                data = read(output_fd, 65536)
+
+            except OSError:
+                break
+
+            if not data:
+                break
+
+            self.output_bytes += data.__len__()
+
+            if self.capture_file is not None:
+                try:
+                    self.capture_file.write(data)
+                except OSError:
+                    pass
+
+            if self.foreground:
+                stdout.buffer.write(data)
+                stdout.buffer.flush()
+            else:
+                try:
+                    self.output_file.write(data)
+                except OSError:
+                    pass
+
+        close(output_fd)
+
+    def resize_terminal(self, terminal_fd):
+        """ SUMMARY:  copies the screen's window size to the subprocess's pseudo-terminal whenever it changes and sends
+                      the subprocess SIGWINCH, since the resize only signals the screen's foreground process group
+              INPUT:  file descriptor (int) of the pseudo-terminal master or slave
+             OUTPUT:  none """
+
+        try:
+            size = ioctl(stdout.fileno(), TIOCGWINSZ, b"\0" * 8)
+            if size != self.terminal_size:
+                ioctl(terminal_fd, TIOCSWINSZ, size)
+                if self.terminal_size is not None:
+                    self.send_signal(SIGWINCH)
+                self.terminal_size = size
+        except OSError:
+            pass
+
+    def restore_terminal(self):
+        """ returns control of the terminal to AXIOM Framework after a foreground process group finishes """
+
+        if self.process_group and self.foreground and isatty(0):
+            try:
+                previous_handler = signal(SIGTTOU, SIG_IGN)
+                tcsetpgrp(0, getpgrp())
+                signal(SIGTTOU, previous_handler)
+            except OSError:
+                pass
+
+    def run(self):
+        """ SUMMARY:  starts the subprocess, waits for it to finish, and reports abnormal termination
+              INPUT:  none, reads values from self
+             OUTPUT:  subprocess exit code (int) or None if execution failed """
+
+        if not self.start():
+            return None
+
+        self.wait()
+
+        reason = self.describe_termination()
+        if reason is not None:
+            print_error(str("\nERROR: Command " + reason))
+
+        return self.return_code
+
+    def send_signal(self, signal_number):
+        """ SUMMARY:  signals the subprocess, including its children when it runs in its own process group
+              INPUT:  signal number (int)
+             OUTPUT:  none """
+
+        if self.finished.is_set():
+            return
+
+        try:
+            if self.process_group:
+                killpg(self.process.pid, signal_number)
+            else:
+                self.process.send_signal(signal_number)
+        except OSError:
+            pass
+
+    def start(self):
+        """ SUMMARY:  launches the subprocess and starts the wall-clock timer, a foreground subprocess writes directly
+                      to the screen (its output size is not measured) unless its output is captured for the execution
+                      cache, which relays it through a pseudo-terminal that follows the screen's window size, while
+                      other output is relayed through a pipe
+              INPUT:  none, reads values from self
+             OUTPUT:  True or False """
+
+        try:
+            if not self.foreground:
+                output_fd, child_fd = pipe()
+                child_stderr = child_fd
+            elif stdout.isatty() and self.capture_file is None:
+                output_fd, child_fd = None, None
+                child_stderr = None
+                self.output_bytes = None
+            elif stdout.isatty():
+                output_fd, child_fd = openpty()
+                self.resize_terminal(child_fd)
+                child_stderr = child_fd
+            else:
+                output_fd, child_fd = pipe()
+                child_stderr = None
+
+        except OSError:
+            print_error("ERROR: Failed to create subprocess output relay")
+            return False
+
+        if self.input_lines is not None:
+            child_stdin = PIPE
+        elif self.foreground:
+            child_stdin = None
+        else:
+            child_stdin = DEVNULL
+
+        stdout.flush()
+        self.start_time = time()
+        start_counter = monotonic()
+
+        try:
+            self.process = Popen(self.build_args(), stdin=child_stdin, stdout=child_fd, stderr=child_stderr)
+
+        except (OSError, ValueError):
+            if output_fd is not None:
+                close(output_fd)
+                close(child_fd)
+            self.start_time = None
+            print_error("ERROR: Failed to execute via Popen()")
+            metrics.increment("axiom_executions_total", 1, {"outcome": "spawn_failed"})
+            return False
+
+        self.start_counter = start_counter
+
+        if self.process_group:
+            self.give_terminal()
+
+        if output_fd is not None:
+            close(child_fd)
+            self.relay = Thread(target=self.relay_output, args=(output_fd,), daemon=True)
+            self.relay.start()
+
+        if self.limits.get("timeout") is not None:
+            reason = str("exceeded the " + str(self.limits["timeout"]) + " second timeout and was terminated")
+            self.timers.append(Timer(self.limits["timeout"], self.terminate, [reason]))
+            self.timers[-1].daemon = True
+            self.timers[-1].start()
+
+        if self.input_lines is not None:
+            try:
+                for line in self.input_lines:
+                    self.process.stdin.write(str(line + "\n").encode())
+                self.process.stdin.close()
+            except OSError:
+                pass
+
+        return True
+
+    def terminate(self, reason):
+        """ SUMMARY:  sends SIGTERM to the subprocess followed by SIGKILL if it is still running after 5 seconds
+              INPUT:  reason for termination (str)
+             OUTPUT:  none """
+
+        if self.finished.is_set():
+            return
+
+        if self.termination_reason is None:
+            self.termination_reason = reason
+
+        self.send_signal(SIGTERM)
+
+        self.timers.append(Timer(5, self.send_signal, [SIGKILL]))
+        self.timers[-1].daemon = True
+        self.timers[-1].start()
+
+    def wait(self):
+        """ SUMMARY:  blocks until the subprocess exits, collecting its resource usage and killing it if AXIOM
+                      Framework is interrupted
+              INPUT:  none, reads values from self
+             OUTPUT:  subprocess exit code (int) """
+
+        try:
+            status, self.rusage = wait4(self.process.pid, 0)[1:]
+
+        except ChildProcessError:
+            status = None
+
+        except BaseException:
+            self.send_signal(SIGKILL)
+            status, self.rusage = wait4(self.process.pid, 0)[1:]
+            self.record_exit(status)
+            raise
+
+        finally:
+            for timer in self.timers:
+                timer.cancel()
+            self.restore_terminal()
+
+        self.record_exit(status)
+
+        return self.return_code
+
+
+class AxiomExecutionCache:
+    """ the stored output and output files of successful executions of cacheable commands, keyed by command text,
+        environment, and input file contents, bounded by a time-to-live and a least-recently-used size limit """
+
+    def __init__(self):
+        self.connection = None
+        self.folder = str(config.axiom.history_folder + "/cache")
+        self.force = False
+        self.lock = Lock()
+
+    def connect(self):
+        """ SUMMARY:  opens the cache index in the history folder, creating the table on first use
+              INPUT:  none, reads values from self
+             OUTPUT:  an open sqlite3 connection, raises sqlite3.Error on failure """
+
+        if self.connection is None:
+            try:
+                makedirs(self.folder, exist_ok=True)
+            except OSError as error:
+                raise SQLiteError(str(error))
+
+            connection = connect(str(self.folder + "/index.db"), timeout=30, check_same_thread=False)
+            connection.execute("CREATE TABLE IF NOT EXISTS entries ("
+                               "key TEXT PRIMARY KEY, "
+                               "tool TEXT, "
+                               "command TEXT, "
+                               "created_time REAL, "
+                               "expiry_time REAL, "
+                               "used_time REAL, "
+                               "size INTEGER, "
+                               "artifacts TEXT)")
+            connection.commit()
+            self.connection = connection
+
+        return self.connection
+
+    def evict(self, connection):
+        """ SUMMARY:  deletes expired entries, then the least recently used entries until the total size of the cache
+                      fits the configured limit, called while holding the lock
+              INPUT:  open sqlite3 connection
+             OUTPUT:  none """
+
+        now = time()
+        for (key,) in connection.execute("SELECT key FROM entries WHERE expiry_time <= ?", (now,)).fetchall():
+            rmtree(str(self.folder + "/" + key), ignore_errors=True)
+        connection.execute("DELETE FROM entries WHERE expiry_time <= ?", (now,))
+
+        total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        size_limit = config.axiom.cache["size"] * 1048576
+
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY used_time").fetchall():
+            if total_size <= size_limit:
+                break
+            rmtree(str(self.folder + "/" + key), ignore_errors=True)
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total_size -= size
+            metrics.increment("axiom_cache_evictions_total")
+
+        connection.commit()
+
+    def get_key(self, details, text):
+        """ SUMMARY:  computes the cache key of an execution from its finalized text, the working directory, the listed
+                      environment variables, and the SHA-256 of every file input that is not a declared output file
+              INPUT:  1) dictionary from describe_run() and 2) finalized command/action text (str or list of strings)
+             OUTPUT:  SHA-256 hex digest (str) """
+
+        output_files = set(x[1] for x in details["artifacts"])
+        input_files = []
+
+        for input_details in details["inputs"]:
+            if input_details["type"] in ["FILE", "FULLPATH", "RLATVPTH"]:
+                filename = path.abspath(input_details["value"])
+                if filename not in output_files and path.isfile(filename):
+                    try:
+                        input_files.append([filename, result_store.hash_file(filename)])
+                    except OSError:
+                        input_files.append([filename, None])
+
+        return sha256(dumps({"text": text, "directory": getcwd(),
+                             "environment": dict((x, environ.get(x)) for x in config.axiom.cache["environment"]),
+                             "files": input_files}, sort_keys=True).encode()).hexdigest()
+
+    def replay(self, key, output_file):
+        """ SUMMARY:  writes a cached execution's output to the screen (or an output file) and restores its output
+                      files, unless re-execution is forced
+              INPUT:  1) cache key (str) and 2) open binary file receiving the output, or None for the screen
+             OUTPUT:  True if a live entry was replayed, False on a cache miss """
+
+        if self.force:
+            return False
+
+        try:
+            with self.lock:
+                connection = self.connect()
+                entry = connection.execute("SELECT created_time, artifacts FROM entries "
+                                           "WHERE key = ? AND expiry_time > ?", (key, time())).fetchone()
+                if entry is not None:
+                    connection.execute("UPDATE entries SET used_time = ? WHERE key = ?", (time(), key))
+                    connection.commit()
+
+        except SQLiteError as error:
+            print_error(str("ERROR: Failed to query execution cache (" + str(error) + ")"))
+            return False
+
+        entry_folder = str(self.folder + "/" + key)
+
+        try:
+            if entry is None:
+                raise FileNotFoundError(key)
+
+            with open(str(entry_folder + "/output"), 'rb') as cached_output:
+                data = cached_output.read(65536)
+                while data:
+                    if output_file is None:
+                        stdout.buffer.write(data)
+                    else:
+                        output_file.write(data)
+                    data = cached_output.read(65536)
+
+            for filename, stored_name in loads(entry[1]):
+                copyfile(str(entry_folder + "/" + stored_name), filename)
+
+        except OSError:
+            metrics.increment("axiom_cache_total", 1, {"result": "miss"})
+            return False
+
+        stdout.flush()
+        metrics.increment("axiom_cache_total", 1, {"result": "hit"})
+
+        if output_file is None:
+            print(str("\n[AXIOM] Replayed cached result from " + strftime("%Y-%m-%d %H:%M:%S", localtime(entry[0])) +
+                      " (force re-execution with \"f\" at the prompt or --force in \"run\" mode)"), file=stderr)
+
+        return True
+
+    def start_capture(self, key, execution):
+        """ makes an execution that has not started yet copy its output into a temporary file read by store() """
+
+        try:
+            makedirs(self.folder, exist_ok=True)
+            execution.capture_file = open(str(self.folder + "/" + key + "." + str(getpid()) + "-" +
+                                              str(id(execution)) + ".tmp"), 'wb')
+        except OSError:
+            execution.capture_file = None
+
+    def store(self, key, ttl, details, execution):
+        """ SUMMARY:  saves the captured output and output files of a successful execution as a cache entry, then
+                      enforces the time-to-live and size limit, discards the captured output otherwise
+              INPUT:  1) cache key (str), 2) time-to-live in seconds (int), 3) dictionary from describe_run(), and 4)
+                      finished AxiomExecution object passed to start_capture()
+             OUTPUT:  none """
+
+        capture_file = execution.capture_file
+        if capture_file is None:
+            return
+
+        capture_file.close()
+        entry_folder = str(self.folder + "/" + key)
+
+        if execution.start_time is None or execution.return_code != 0 or execution.describe_termination() is not None:
+            try:
+                remove(capture_file.name)
+            except OSError:
+                pass
+            return
+
+        artifacts = []
+
+        try:
+            rmtree(entry_folder, ignore_errors=True)
+            makedirs(entry_folder)
+            replace(capture_file.name, str(entry_folder + "/output"))
+            size = stat(str(entry_folder + "/output")).st_size
+
+            for output_type, filename, prefix in details["artifacts"]:
+                if path.isfile(filename):
+                    stored_name = str("artifact-" + str(artifacts.__len__() + 1))
+                    copyfile(filename, str(entry_folder + "/" + stored_name))
+                    size += stat(filename).st_size
+                    artifacts.append([filename, stored_name])
+
+        except OSError:
+            rmtree(entry_folder, ignore_errors=True)
+            try:
+                remove(capture_file.name)
+            except OSError:
+                pass
+            return
+
+        now = time()
+
+        try:
+            with self.lock:
+                connection = self.connect()
+                connection.execute("INSERT OR REPLACE INTO entries (key, tool, command, created_time, expiry_time, "
+                                   "used_time, size, artifacts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                   (key, details["tool"], details["command"], now, now + ttl, now, size,
+                                    dumps(artifacts)))
+                self.evict(connection)
+
+        except SQLiteError as error:
+            print_error(str("ERROR: Failed to update execution cache (" + str(error) + ")"))
+
+
+class AxiomInputTypes:
+    """ a registry of validators and normalizers for every configured input type, compiled once at startup """
+
+    ipv4 = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(?:\.(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}"
+
+    patterns = {"DOMAIN": r"(?=.{1,253}\.?$)(?:[A-Za-z0-9_](?:[A-Za-z0-9_-]{0,61}[A-Za-z0-9])?\.)*"
+                          r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.?",
+                "FILE": r"[^\x00]+",
+                "FULLPATH": r"(?:/|~|[A-Za-z]:\\|\\\\)[^\x00]*",
+                "HTTPSURL": r"(?i:https://)[^\s/?#]+[^\s]*",
+                "HTTPURL": r"(?i:http://)[^\s/?#]+[^\s]*",
+                "INT": r"[-+]?\d+",
+                "INTRANGE": r"-?\d+(?:--?\d+)?(?:\s*,\s*-?\d+(?:--?\d+)?)*",
+                "IPV4": ipv4,
+                "IPV4CIDR": ipv4 + r"/(?:3[0-2]|[12]?\d)(?:\s*,\s*" + ipv4 + r"/(?:3[0-2]|[12]?\d))*",
+                "IPV4RNGE": ipv4 + r"-(?:" + ipv4 + r"|25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+                                   r"(?:\s*,\s*" + ipv4 + r"-(?:" + ipv4 + r"|25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d))*",
+                "MAC": r"[0-9A-Fa-f]{2}(?:([:-])[0-9A-Fa-f]{2}(?:\1[0-9A-Fa-f]{2}){4}|[0-9A-Fa-f]{10})",
+                "RLATVPTH": r"(?![/~]|[A-Za-z]:\\|\\\\)[^\x00]+",
+                "WEBURL": r"(?i:https?://)[^\s/?#]+[^\s]*"}
+
+    def __init__(self, input_types_list):
+        """ SUMMARY:  compiles a validator and selects a normalizer for each input type, custom input types that
+                      AXIOM Framework does not recognize (and STR/STRMENU/INTMENU) accept any value unchanged
+              INPUT:  list of input type names (str) from the configuration file
+             OUTPUT:  none, instantiates AxiomInputTypes object """
+
+        normalizers = {"DOMAIN": self.normalize_domain,
+                       "INT": self.normalize_int,
+                       "INTRANGE": self.normalize_list,
+                       "IPV4CIDR": self.normalize_list,
+                       "IPV4RNGE": self.normalize_list,
+                       "IPV6": self.normalize_ipv6,
+                       "IPV6CIDR": self.normalize_ipv6_list,
+                       "IPV6RNGE": self.normalize_ipv6_list,
+                       "MAC": self.normalize_mac}
+
+        self.registry = {}
+        self.normalizers = {}
+        self.accept_any = self.compile_normalizer(False, None, None)
+
+        for input_type in input_types_list:
+            if input_type in self.patterns:
+                check = compile_pattern(self.patterns[input_type]).fullmatch
+            else:
+                check = None
+
+            trim = input_type not in ["FILE", "FULLPATH", "RLATVPTH", "STR", "STRMENU", "INTMENU"]
+            self.registry[input_type] = (trim, check, normalizers.get(input_type))
+            self.normalizers[input_type] = self.compile_normalizer(trim, check, normalizers.get(input_type))
+
+    @staticmethod
+    def compile_normalizer(trim, check, normalizer):
+        """ SUMMARY:  combines an input type's whitespace trimming, validator, and normalizer into one function
+              INPUT:  1) whether surrounding whitespace is removed (bool), 2) compiled fullmatch function or None, and
+                      3) normalizer function or None
+             OUTPUT:  function returning the normalized value (str) or None if the value is invalid """
+
+        def normalize_value(value):
+            if trim:
+                value = value.strip()
+                if value == "":
+                    return None
+
+            if check is not None and check(value) is None:
+                return None
+
+            if normalizer is not None:
+                return normalizer(value)
+
+            return value
+
+        return normalize_value
+
+    def get_normalizer(self, input_type):
+        """ returns the function normalize() applies to an input type, for callers that normalize many values """
+
+        return self.normalizers.get(input_type, self.accept_any)
+
+    def normalize(self, input_type, value):
+        """ SUMMARY:  validates a value and converts it to the input type's canonical form
+              INPUT:  1) input type name (str) and 2) value (str)
+             OUTPUT:  normalized value (str) or None if the value is invalid for the input type """
+
+        return self.normalizers.get(input_type, self.accept_any)(value)
+
+    @staticmethod
+    def normalize_domain(value):
+        """ returns a lowercase domain name without the trailing dot """
+
+        return value.rstrip(".").lower()
+
+    @staticmethod
+    def normalize_int(value):
+        """ returns an integer without a plus sign or leading zeros """
+
+        if value[0] not in "+-0":
+            return value
+
+        return str(int(value))
+
+    @staticmethod
+    def normalize_ipv6(value):
+        """ returns the compressed, lowercase form of an IPv6 address (keeping any "%scope" suffix), or None if it is
+            invalid """
+
+        address, separator, scope = value.partition("%")
+
+        try:
+            return str(inet_ntop(AF_INET6, inet_pton(AF_INET6, address)) + separator + scope)
+
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def normalize_ipv6_list(value):
+        """ returns comma-separated IPv6 networks ("addr/prefix") or ranges ("addr-addr") in compressed form or None """
+
+        segments = []
+
+        for segment in value.split(","):
+            if "/" in segment:
+                address, separator, prefix = segment.strip().partition("/")
+                if not prefix.isdigit() or int(prefix) > 128:
+                    return None
+            else:
+                address, separator, prefix = segment.strip().partition("-")
+                prefix = AxiomInputTypes.normalize_ipv6(prefix)
+
+            address = AxiomInputTypes.normalize_ipv6(address)
+            if address is None or prefix is None or "%" in address:
+                return None
+
+            segments.append(str(address + separator + prefix))
+
+        return ",".join(segments)
+
+    @staticmethod
+    def normalize_list(value):
+        """ removes whitespace around the commas of a comma-separated list """
+
+        if "," not in value:
+            return value
+
+        return ",".join(x.strip() for x in value.split(","))
+
+    @staticmethod
+    def normalize_mac(value):
+        """ returns a lowercase, colon-separated MAC address """
+
+        value = value.lower()
+
+        if value.__len__() == 12:
+            return ":".join([value[0:2], value[2:4], value[4:6], value[6:8], value[8:10], value[10:12]])
+
+        return value.replace("-", ":")
+
+
+class AxiomInstallDetector:
+    """ memoizes tool installation checks and invalidates them when PATH or the PTF install folders change """
+
+    def __init__(self):
+        self.catalog = {}
+        self.lock = Lock()
+        self.ptf_install_path = None
+        self.results = {}
+        self.signature = None
+
+    def detect(self, tool):
+        """ SUMMARY:  checks local system for installed tool via 1) PTF install folder and 2) in-process PATH lookup
+              INPUT:  an AxiomTool object
+             OUTPUT:  True or False, raises OSError if PTF data cannot be read """
+
+        if tool.ptf_module in self.catalog:
+            install_path = self.get_ptf_install_path()
+            ptf_tool_folder = self.catalog[tool.ptf_module].resolve_install_folder(install_path)
+
+            return path.exists(ptf_tool_folder)
+
+        return which(tool.name) is not None
+
+    def get_ptf_install_path(self):
+        """ SUMMARY:  extracts the PTF base install path from the PTF config file, only reading the file once
+              INPUT:  none, reads values from self and global config object
+             OUTPUT:  base install path (str), raises OSError if it cannot be extracted """
+
+        if self.ptf_install_path is None:
+            ptf_config_file = str(config.axiom.ptf_folder + "/config/ptf.config")
+
+            try:
+                with open(ptf_config_file) as ptf_config:
+                    for line in ptf_config:
+                        if line.startswith("BASE_INSTALL_PATH="):
+                            self.ptf_install_path = line.split("\"")[1]
+                            break
+
+            except (IndexError, OSError):
+                pass
+
+            if self.ptf_install_path is None:
+                raise OSError(str("Failed to extract PTF base install path from " + ptf_config_file))
+
+        return self.ptf_install_path
+
+    def get_signature(self):
+        """ SUMMARY:  summarizes the state of every folder that can affect installation checks
+              INPUT:  none, reads PATH from the environment and the PTF install path from self
+             OUTPUT:  tuple containing the PATH value and modification times of relevant folders """
+
+        path_value = environ.get("PATH", "")
+        folders = path_value.split(pathsep)
+
+        if self.ptf_install_path is not None:
+            folders.append(self.ptf_install_path)
+            try:
+                for entry in scandir(self.ptf_install_path):
+                    if entry.is_dir():
+                        folders.append(entry.path)
+            except OSError:
+                pass
+
+        modification_times = []
+        for folder in folders:
+            try:
+                modification_times.append(stat(folder).st_mtime_ns)
+            except OSError:
+                modification_times.append(None)
+
+        return path_value, tuple(modification_times)
+
+    def invalidate(self):
+        """ discards all memoized results so the next check queries the filesystem again """
+
+        with self.lock:
+            self.results = {}
+            self.signature = None
+
+    def is_installed(self, tool):
+        """ SUMMARY:  returns a memoized installation check result, discarding stale results when folders change
+              INPUT:  an AxiomTool object
+             OUTPUT:  True or False, raises OSError if PTF data cannot be read """
+
+        key = (tool.name, tool.platform)
+        signature = self.get_signature()
+
+        with self.lock:
+            if signature != self.signature:
+                self.results = {}
+                self.signature = signature
+            elif key in self.results:
+                return self.results[key]
+
+        result = self.detect(tool)
+
+        with self.lock:
+            if signature == self.signature:
+                self.results[key] = result
+
+        return result
+
+    def probe(self, tools, status, workers=8):
+        """ SUMMARY:  checks every platform-compatible tool concurrently, recording the results for display alongside
+                      the other platforms a tool name is available for
+              INPUT:  1) list of AxiomTool objects, 2) dictionary to update, and 3) number of worker threads (int)
+             OUTPUT:  none, updates the supplied dictionary with tool name keys and status text values """
+
+        other_platforms = {}
+        for tool in tools:
+            if not tool.platform_matches():
+                other_platforms.setdefault(tool.name, []).append(tool.platform)
+
+        def probe_tool(tool):
+            try:
+                text = "installed" if self.is_installed(tool) else "not installed"
+            except OSError:
+                return
+
+            if tool.name in other_platforms:
+                text = str(text + " (also " + ", ".join(other_platforms[tool.name]) + ")")
+
+            status[tool.name] = text
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            executor.map(probe_tool, [x for x in tools if x.platform_matches()])
+
+    def probe_in_background(self, tools, status):
+        """ SUMMARY:  starts a daemon thread that probes tool installation status without delaying the caller
+              INPUT:  1) list of AxiomTool objects and 2) dictionary to update with status text
+             OUTPUT:  none """
+
+        Thread(target=self.probe, args=(tools, status), daemon=True).start()
+
+    def set_catalog(self, catalog):
+        """ SUMMARY:  replaces the PTF module catalog used for lookups and discards all memoized results
+              INPUT:  dictionary with PTF module path keys and AxiomPtfModule values
+             OUTPUT:  none """
+
+        self.catalog = catalog
+        self.invalidate()
+
+
+class AxiomInteractiveTask:
+    """ defines tasks sent to AxiomDispatcher queue for working with interactive subprocesses """
+
+    def __init__(self, text, starting_prompt, ending_prompt, details):
+        """ SUMMARY:  creates object, to be queued, for handling interactive execution tasks
+              INPUT:  the finalized command/action text (str or list), starting + ending prompt type names, and a
+                      dictionary of details recorded in the result store (or None)
+             OUTPUT:  self, instantiates an AxiomInteractiveTask object  """
+
+        self.details = details
+        self.duration = None
+        self.ending_prompt = ending_prompt
+        self.sessions = []
+        self.start_counter = None
+        self.starting_prompt = starting_prompt
+        self.text = text
+
+        self.prompt_change = self.detect_prompt_change()
+
+        self.ending_prompt_pattern = self.resolve_ending_prompt_pattern()
+
+    def detect_prompt_change(self):
+        """ SUMMARY:  compares two prompt type names, called by AxiomInteractiveTask init method
+              INPUT:  self, two string values that represent prompt type names
+             OUTPUT:  True or False based on string comparison """
+
+        if self.starting_prompt == self.ending_prompt:
+            return False
+        else:
+            return True
+
+    def resolve_ending_prompt_pattern(self):
+        """ SUMMARY:  looks up the ending prompt pattern in the global prompt_types object
+              INPUT:  self and global prompt_types object
+             OUTPUT:  string containing the appropriate prompt pattern """
+
+        if self.prompt_change:
+            return prompt_types.patterns.get(self.ending_prompt)
+        else:
+            return prompt_types.patterns.get(self.starting_prompt)
+
+
+class AxiomJob:
+    """ a standalone or autonomous command/action running in the background with its output saved to a log file """
+
+    def __init__(self, job_id, name, text, details, execution, log_file, log_filename):
+        """ SUMMARY:  creates a job for an execution that has already started
+              INPUT:  1) job number (int), 2) "tool / command" display name (str), 3) finalized command/action text,
+                      4) dictionary from describe_run(), 5) AxiomExecution object, 6) open unbuffered binary log file,
+                      and 7) log filename (str)
+             OUTPUT:  none, instantiates AxiomJob object """
+
+        self.details = details
+        self.done = Event()
+        self.execution = execution
+        self.job_id = job_id
+        self.log_file = log_file
+        self.log_filename = log_filename
+        self.name = name
+        self.notified = False
+        self.text = text
+
+    def describe_state(self):
+        """ returns the job state: running, done, failed (exit code), or terminated """
+
+        if not self.done.is_set():
+            return "running"
+        elif self.execution.describe_termination() is not None or self.execution.return_code < 0:
+            return "terminated"
+        elif self.execution.return_code == 0:
+            return "done"
+        else:
+            return str("failed (" + str(self.execution.return_code) + ")")
+
+    def follow(self):
+        """ SUMMARY:  displays the job's output so far, then keeps displaying new output until the job finishes
+              INPUT:  none, reads values from self
+             OUTPUT:  True if the job finished, False if the user detached with CTRL+C or the log is unreadable """
+
+        try:
+            with open(self.log_filename, 'rb') as log_file:
+                while True:
+                    data = log_file.read(65536)
+                    if data:
+                        stdout.buffer.write(data)
+                        stdout.buffer.flush()
+                    elif self.done.is_set():
+                        return True
+                    else:
+                        self.done.wait(0.2)
+
+        except KeyboardInterrupt:
+            print()
+            return False
 
-    def run_nx(self):
-        """ SUMMARY:  builds and displays command text to screen, overrides inherited AxiomAction function
-              INPUT:  none, reads values from self
-             OUTPUT:  no return values, only prints to the screen """
+        except OSError:
+            print_error(str("ERROR: Failed to read " + self.log_filename))
+            return False
 
-        text = self.build()
-        print()
-        print(text)
-        print()
-        dispatch.continue_trigger.set()
+    def get_elapsed(self):
+        """ returns the seconds (float) the job has been running, or ran for if finished """
 
-    def run_standalone(self):
-        """ SUMMARY:  builds and executes command as subprocess (blocking) or queues interactive task for execution
-                      overrides inherited AxiomAction function
+        if self.execution.duration is not None:
+            return self.execution.duration
+
+        return monotonic() - self.execution.start_counter
+
+    def get_usage(self):
+        """ SUMMARY:  measures the CPU time and memory of the job, sampled from ps(1) while it runs and taken from the
+                      resource usage of the reaped subprocess once it finishes
               INPUT:  none, reads values from self
-             OUTPUT:  no return values """
+             OUTPUT:  two-item tuple, CPU seconds (float) and resident set size in kilobytes (int), either may be
+                      None """
 
-        text = self.build()
-        if self.prompt_type == "bash" and not self.existing_subprocess():
-            try:
-                print()
-                call(split(text))
+        if self.done.is_set():
+            if self.execution.rusage is None:
+                return None, None
+            return self.execution.rusage.ru_utime + self.execution.rusage.ru_stime, self.execution.get_max_rss()
+
+        try:
+            fields = check_output(["ps", "-o", "rss=,time=", "-p", str(self.execution.process.pid)],
+                                  stderr=DEVNULL).decode().split()
+
+            days, separator, clock = fields[1].rpartition("-")
+            cpu_time = 0.0
+            for part in clock.split(":"):
+                cpu_time = cpu_time * 60 + float(part)
+            if days != "":
+                cpu_time += int(days) * 86400
+
+            return cpu_time, int(fields[0])
+
+        except (CalledProcessError, IndexError, OSError, ValueError):
+            return None, None
+
+    def tail(self, count):
+        """ returns the last lines (list of str) of the job's output, reading at most the final 64 KB of the log """
+
+        try:
+            with open(self.log_filename, 'rb') as log_file:
+                log_file.seek(0, 2)
+                log_file.seek(max(0, log_file.tell() - 65536))
+                data = log_file.read()
+
+        except OSError:
+            print_error(str("ERROR: Failed to read " + self.log_filename))
+            return []
+
+        return data.decode(errors="replace").splitlines()[-count:]
+
+    def wait_for_exit(self):
+        """ runs in a separate thread, waits for the job to finish, records the outcome, closes the log file, then
+            announces the job if the user is sitting at a prompt """
+
+        try:
+            self.execution.wait()
+            result_store.record(self.details, self.text, self.execution.get_measurements())
+
+        finally:
+            self.log_file.close()
+            self.done.set()
+            if jobs.announcing:
+                jobs.notify()
+
+
+class AxiomJobControl:
+    """ the background jobs started from the interactive prompt, at most max_jobs running at once """
+
+    def __init__(self):
+        self.announcing = False
+        self.jobs = []
+        self.lock = Lock()
+        self.log_folder = None
+        self.next_id = 1
+
+    def count_running(self):
+        """ returns the number (int) of background jobs that have not finished """
+
+        return [x for x in self.jobs if not x.done.is_set()].__len__()
+
+    def find(self, job_id):
+        """ returns the AxiomJob object matching a job number (str or int), or None """
+
+        for job in self.jobs:
+            if str(job.job_id) == str(job_id).lstrip("%"):
+                return job
+
+        return None
+
+    def launch(self, action, text, details):
+        """ SUMMARY:  starts finalized command/action text as a background job with its output saved to a log file
+              INPUT:  1) AxiomAction or AxiomCommand object, 2) finalized command/action text (str or list of strings),
+                      and 3) dictionary from describe_run()
+             OUTPUT:  AxiomJob object or None if the job failed to start """
 
+        if self.log_folder is None:
+            log_folder = str(config.axiom.binary_folder + "/jobs/" + strftime("%Y%m%d-%H%M%S", localtime()) + "-" +
+                             str(getpid()))
+            try:
+                makedirs(log_folder, exist_ok=True)
             except OSError:
-                print_error("ERROR: Failed to execute via call()")
-        else:
-            dispatch.tasking.put(AxiomInteractiveTask(text, self.prompt_type, self.prompt_type))
-            dispatch.monitor_task_queue()
+                print_error(str("ERROR: Failed to create " + log_folder))
+                return None
+            self.log_folder = log_folder
 
-        dispatch.continue_trigger.set()
+        log_filename = str(self.log_folder + "/job-" + str(self.next_id) + ".log")
+
+        try:
+            log_file = open(log_filename, 'wb', buffering=0)
+        except OSError:
+            print_error(str("ERROR: Failed to write " + log_filename))
+            return None
+
+        execution = action.create_execution(text, log_file)
+        if not execution.start():
+            log_file.close()
+            return None
+
+        job = AxiomJob(self.next_id, str(details["tool"] + " / " + details["command"]), text, details, execution,
+                       log_file, log_filename)
+        Thread(target=job.wait_for_exit, daemon=True).start()
+
+        self.jobs.append(job)
+        self.next_id += 1
+
+        return job
+
+    def notify(self):
+        """ prints one line for every background job that finished since the previous notification """
+
+        with self.lock:
+            for job in self.jobs:
+                if job.done.is_set() and not job.notified:
+                    job.notified = True
+                    print("[AXIOM] Job " + str(job.job_id) + " " + job.describe_state() + " after " +
+                          str(round(job.get_elapsed(), 1)) + "s: " + job.name)
+
+    def set_announcing(self, enabled):
+        """ SUMMARY:  enables or disables announcing jobs from their own threads the moment they finish, which is only
+                      safe while a prompt patches stdout, enabling it also announces jobs that already finished
+              INPUT:  True or False
+             OUTPUT:  none """
+
+        self.announcing = enabled
+
+        if enabled:
+            self.notify()
 
     def show(self):
-        """ SUMMARY:  displays detailed information about the command, overrides inherited AxiomAction function
+        """ SUMMARY:  displays every background job with its state, elapsed time, CPU time, and memory usage
               INPUT:  none, reads values from self
              OUTPUT:  none, only prints to the screen """
 
-        print("\n  NAME:  " + self.name +
-              "\n  TYPE:  " + self.execution_type + " command (" + self.prompt_type + ")"
-                                                                                      "\n  NOTE:  " + self.note)
+        if self.jobs.__len__() == 0:
+            print("\nNo background jobs (enter \"b\" when asked to execute a standalone or autonomous command)\n")
+            return
 
-        self.print_text()
+        print("\n" + "  ID  " + "STATE".ljust(14) + "ELAPSED".rjust(9) + "CPU".rjust(9) + "MEMORY".rjust(10) +
+              "  COMMAND")
+        for job in self.jobs:
+            cpu_time, rss = job.get_usage()
+            print("  " + str(job.job_id).rjust(2) + "  " + job.describe_state().ljust(14) +
+                  str(str(round(job.get_elapsed(), 1)) + "s").rjust(9) +
+                  (str(round(cpu_time, 1)) + "s" if cpu_time is not None else "-").rjust(9) +
+                  (str(round(rss / 1024, 1)) + " MB" if rss is not None else "-").rjust(10) + "  " + job.name)
 
+            job.notified = job.notified or job.done.is_set()
+        print()
 
-class AxiomDispatcher:
-    """ creates, manages, and interacts with subprocesses that require interactive input """
+    def terminate_all(self):
+        """ terminates running jobs when AXIOM Framework exits, their output relay threads do not outlive it """
 
-    def __init__(self):
-        self.continue_trigger = Event()
-        self.subprocesses = []
-        self.tasking = Queue(maxsize=0)
-        self.trigger = Event()
+        for job in self.jobs:
+            if not job.done.is_set():
+                job.execution.send_signal(SIGTERM)
 
-    def check_for_ambiguous_target(self, current_task):
-        """ SUMMARY:  detects existing subprocesses with prompt types that match a task's ending prompt type
-              INPUT:  current_task, an AxiomInteractiveTask object from the "tasking" queue
-             OUTPUT:  True or False """
 
-        prompt_type = current_task.ending_prompt
+class AxiomMetrics:
+    """ low-overhead in-memory counters and histograms, merged into a cumulative file in the history folder at exit """
 
-        for x in self.subprocesses:
-            if x.current_prompt == prompt_type:
-                return True
+    buckets = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0]
 
-        return False
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.lock = Lock()
 
     @staticmethod
-    def get_subprocess_output_detect_prompt(proc, pattern):
-        """ SUMMARY:  prints subprocess output to the screen while searching for an interactive prompt
-              INPUT:  1) a pseudoterminal subprocess object from pty_spawn and 2) a regex prompt pattern (str)
-             OUTPUT:  no return values, only prints to the screen """
+    def describe_series(name, labels):
+        """ returns a series name with Prometheus-style labels, e.g. axiom_executions_total{outcome="ok"} """
 
-        timeout = 0
-        safety_timer = 0
+        if labels.__len__() == 0:
+            return name
 
-        while True:
-            try:
-                print(proc.readline().decode(), end='')
-            except exceptions.TIMEOUT:
-                if search(pattern, proc.before.decode()):
-                    if timeout >= config.axiom.pattern_timeout:
-                        print(proc.before.decode())
-                        break
-                    else:
-                        timeout += 1
-                        sleep(1)
-                        continue
-                else:
-                    safety_timer += 1
-                    sleep(1)
-                    if safety_timer >= config.axiom.safety_timeout:
-                        proc.sendline()
-                    continue
-            else:
-                timeout = 0
-                safety_timer = 0
+        return str(name + "{" + ",".join(str(x[0] + "=\"" + str(x[1]) + "\"") for x in labels) + "}")
 
-    def handle_new_tasks(self):
-        """ SUMMARY:  gets AxiomInteractiveTask objects from queue and routes tasks based on runtime context
-              INPUT:  self, gets objects from "tasking" queue
-             OUTPUT:  no return value, returns when task is routed """
+    def export_json(self):
+        """ returns a JSON snapshot (str) of every counter and histogram """
 
-        if not self.tasking.empty():
-            current_task = self.tasking.get()
-            if self.matching_subprocess(current_task) >= 0:
-                target = self.matching_subprocess(current_task)
-                if current_task.prompt_change:
-                    if self.check_for_ambiguous_target(current_task):
-                        print_error("\nERROR: Cannot create subprocess with same prompt type as existing subprocess")
-                        self.tasking.task_done()
-                        return
-                self.read_and_transmit(target, current_task)
-                self.tasking.task_done()
-                return
-            elif current_task.starting_prompt == "bash":
-                if self.check_for_ambiguous_target(current_task):
-                    print_error("\nERROR: Cannot create subprocess with same prompt type as existing subprocess")
-                    self.tasking.task_done()
-                    return
-                self.spawn_and_transmit(current_task)
-                self.tasking.task_done()
-                return
-            else:
-                print_error("\nERROR: Prompt type incompatible with current runtime")
-                self.tasking.task_done()
-                return
+        with self.lock:
+            return dumps(self.get_snapshot(), indent=2, sort_keys=True)
+
+    def export_prometheus(self):
+        """ SUMMARY:  renders every counter and histogram in the Prometheus text exposition format
+              INPUT:  none, reads values from self
+             OUTPUT:  string suitable for the node_exporter textfile collector """
+
+        lines = []
+
+        with self.lock:
+            for name in sorted(set(x[0] for x in self.counters)):
+                lines.append(str("# TYPE " + name + " counter"))
+                for key in sorted(x for x in self.counters if x[0] == name):
+                    lines.append(str(self.describe_series(name, key[1]) + " " + str(self.counters[key])))
+
+            for name in sorted(set(x[0] for x in self.histograms)):
+                lines.append(str("# TYPE " + name + " histogram"))
+                for key in sorted(x for x in self.histograms if x[0] == name):
+                    histogram = self.histograms[key]
+                    cumulative = 0
+                    i = 0
+                    while i < self.buckets.__len__():
+                        cumulative += histogram["counts"][i]
+                        lines.append(str(self.describe_series(name + "_bucket", key[1] + (("le", self.buckets[i]),)) +
+                                         " " + str(cumulative)))
+                        i += 1
+                    lines.append(str(self.describe_series(name + "_bucket", key[1] + (("le", "+Inf"),)) + " " +
+                                     str(histogram["count"])))
+                    lines.append(str(self.describe_series(name + "_sum", key[1]) + " " + str(histogram["sum"])))
+                    lines.append(str(self.describe_series(name + "_count", key[1]) + " " + str(histogram["count"])))
+
+        return str("\n".join(lines) + "\n")
 
-    def matching_subprocess(self, current_task):
-        """ SUMMARY:  locates existing subprocess with identical prompt type to queued task
-              INPUT:  current_task, an AxiomInteractiveTask object from the "tasking" queue
-             OUTPUT:  integer, zero or positive if match found, -1 if no match """
+    def get_quantile(self, key, quantile):
+        """ returns the upper bound (seconds) of the bucket containing the quantile, None if above every bucket """
+
+        histogram = self.histograms[key]
+        threshold = quantile * histogram["count"]
+        cumulative = 0
 
         i = 0
-        while i < self.subprocesses.__len__():
-            if current_task.starting_prompt == self.subprocesses[i].current_prompt:
-                return i
-            else:
-                i += 1
+        while i < self.buckets.__len__():
+            cumulative += histogram["counts"][i]
+            if cumulative >= threshold:
+                return self.buckets[i]
+            i += 1
 
-        return -1
+        return None
 
-    def monitor_task_queue(self):
-        """ calls any required functions related to new tasks in the queue """
+    def get_snapshot(self):
+        """ returns a JSON-compatible dictionary of every counter and histogram (caller must hold the lock) """
 
-        self.handle_new_tasks()
+        return {"buckets": self.buckets,
+                "counters": [{"name": key[0], "labels": dict(key[1]), "value": value}
+                             for key, value in self.counters.items()],
+                "histograms": [{"name": key[0], "labels": dict(key[1]), "counts": value["counts"],
+                                "count": value["count"], "sum": value["sum"]}
+                               for key, value in self.histograms.items()]}
 
-    def read_and_transmit(self, target, current_task):
-        """ SUMMARY:  prints prior program output, transmits text to existing subprocess, and updates the prompt
-              INPUT:  targeted subprocess number (INT) and AxiomInteractiveTask object from "tasking" queue
-             OUTPUT:  no return values """
+    def increment(self, name, value=1, labels=None):
+        """ adds a value to a counter """
 
-        proc = self.subprocesses[target].process
+        key = (name, tuple(sorted(labels.items())) if labels else ())
 
-        while True:
-            try:
-                print(proc.readline().decode(), end='')
-            except exceptions.TIMEOUT:
-                break
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
 
-        self.transmit_text(current_task, proc)
+    def merge(self, snapshot):
+        """ SUMMARY:  adds the values of a previously saved snapshot to the in-memory metrics
+              INPUT:  dictionary from get_snapshot(), histograms with different bucket boundaries are discarded
+             OUTPUT:  no return value """
 
-        self.subprocesses[target].current_prompt = current_task.ending_prompt
-        self.subprocesses[target].prompt_pattern = current_task.ending_prompt_pattern
-        dispatch.continue_trigger.set()
+        with self.lock:
+            for counter in snapshot.get("counters", []):
+                key = (counter["name"], tuple(sorted(counter["labels"].items())))
+                self.counters[key] = self.counters.get(key, 0) + counter["value"]
 
-    def spawn_and_transmit(self, current_task):
-        """ SUMMARY:  creates a new subprocess, transmits a command's/action's executable text, and updates the prompt
-              INPUT:  an AxiomInteractiveTask object from the "tasking" queue
-             OUTPUT:  no return values """
+            if snapshot.get("buckets") != self.buckets:
+                return
+
+            for saved in snapshot.get("histograms", []):
+                key = (saved["name"], tuple(sorted(saved["labels"].items())))
+                histogram = self.histograms.setdefault(key, {"counts": [0] * self.buckets.__len__(), "count": 0,
+                                                             "sum": 0.0})
+                histogram["counts"] = [x + y for x, y in zip(histogram["counts"], saved["counts"])]
+                histogram["count"] += saved["count"]
+                histogram["sum"] += saved["sum"]
+
+    def observe(self, name, value, labels=None):
+        """ records one measurement (seconds) in a histogram """
+
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        bucket = bisect_left(self.buckets, value)
+
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = {"counts": [0] * self.buckets.__len__(), "count": 0, "sum": 0.0}
+                self.histograms[key] = histogram
+            if bucket < self.buckets.__len__():
+                histogram["counts"][bucket] += 1
+            histogram["count"] += 1
+            histogram["sum"] += value
+
+    def save(self):
+        """ SUMMARY:  merges this process's metrics into the cumulative metrics file and rewrites the Prometheus
+                      textfile (if configured), called once at exit
+              INPUT:  none, reads values from self and global config object
+             OUTPUT:  no return value, silently skips folders the current user cannot write to """
+
+        if self.counters.__len__() == 0 and self.histograms.__len__() == 0:
+            return
+
+        folder = config.axiom.history_folder
+        if folder is None or not path.isdir(folder) or not access(folder, W_OK):
+            return
+
+        metrics_filename = str(folder + "/metrics.json")
 
         try:
-            self.subprocesses.append(AxiomExecutingSubprocess(current_task.starting_prompt,
-                                                              pty_spawn.spawn("/bin/bash -i",
-                                                                              timeout=config.axiom.pty_timeout)))
+            with open(str(folder + "/metrics.lock"), 'w') as lock_file:
+                flock(lock_file, LOCK_EX)
+                cumulative = AxiomMetrics()
+                if path.exists(metrics_filename):
+                    with open(metrics_filename, 'r') as metrics_file:
+                        cumulative.merge(loads(metrics_file.read()))
+                with self.lock:
+                    cumulative.merge(self.get_snapshot())
+                write_atomically(metrics_filename, cumulative.export_json())
+                if config.axiom.metrics_textfile is not None:
+                    write_atomically(config.axiom.metrics_textfile, cumulative.export_prometheus())
+
+        except (KeyError, OSError, TypeError, ValueError) as error:
+            print_error(str("ERROR: Failed to save metrics (" + str(error) + ")"))
+
+
+class AxiomPromptTypes:
+    """ the configured prompt types, compiled once at startup into a single end-anchored alternation """
+
+    def __init__(self, prompts):
+        """ SUMMARY:  compiles one named group per prompt type so subprocess output is classified in a single pass
+              INPUT:  list of two-item tuples (prompt type name, pattern) from the configuration file
+             OUTPUT:  none, instantiates AxiomPromptTypes object """
+
+        alternatives = []
+        self.combined = None
+        self.names = {}
+        self.patterns = {}
+
+        for prompt_name, prompt_pattern in prompts:
+            self.patterns[prompt_name] = prompt_pattern
+
+            if prompt_name != "other":
+                group = str("p" + str(alternatives.__len__()))
+                self.names[group] = prompt_name
+                alternatives.append(str("(?P<" + group + ">" + prompt_pattern + ")"))
+
+        if alternatives:
+            try:
+                self.combined = compile_pattern(str("(?:" + "|".join(alternatives) + ")$"))
+            except RegexError:
+                print_error("ERROR: Invalid prompt pattern(s) in configuration file")
+                exit(1)
 
-        except OSError:
-            print_error("ERROR: Failed to spawn /bin/bash subprocess")
-            exit(1)
+    def detect(self, text):
+        """ SUMMARY:  determines which prompt type, if any, ends a piece of subprocess output, the leftmost match wins
+                      so a specific prompt (e.g. "mimikatz # ") is preferred over a generic suffix (e.g. "# ")
+              INPUT:  text (str), normally the tail window of an AxiomExecutingSubprocess
+             OUTPUT:  prompt type name (str) or None """
 
-        else:
-            target = self.matching_subprocess(current_task)
-            proc = self.subprocesses[target].process
+        if self.combined is None:
+            return None
 
-            self.transmit_text(current_task, proc)
+        match = self.combined.search(text)
 
-            self.subprocesses[target].current_prompt = current_task.ending_prompt
-            self.subprocesses[target].prompt_pattern = current_task.ending_prompt_pattern
-            dispatch.continue_trigger.set()
+        if match is None:
+            return None
 
-    def transmit_text(self, current_task, proc):
-        """ SUMMARY:  transmits line-buffered input to a subprocess and waits for & displays the subprocess's output
-              INPUT:  1) an AxiomInteractiveTask object and 2) a pseudoterminal subprocess object from pty_spawn
-             OUTPUT:  no return values, only prints to the screen """
+        return self.names[match.lastgroup]
 
-        pattern = str(current_task.ending_prompt_pattern + "$")
 
-        try:
-            if isinstance(current_task.text, str):
-                proc.sendline(current_task.text)
-            elif isinstance(current_task.text, list):
-                i = 0
-                while i < current_task.text.__len__():
-                    proc.sendline(current_task.text[i])
-                    i += 1
+class AxiomPtfModule:
+    """ details about a PTF module extracted from its module file """
 
-        except OSError:
-            print_error("ERROR: Failed to transmit command")
-            exit(1)
+    def __init__(self, module_path, description, install_type, install_location, dependencies, packages):
+        """ SUMMARY:  creates AxiomPtfModule objects for the PTF module catalog
+              INPUT:  module path (str), description (str), install type (str), install location (str), list of module
+                      paths the module depends on, and dictionary of platform names mapped to lists of package names
+             OUTPUT:  none, instantiates AxiomPtfModule object """
 
-        else:
-            self.get_subprocess_output_detect_prompt(proc, pattern)
+        self.category = module_path.split("/")[1]
+        self.dependencies = dependencies
+        self.description = description
+        self.install_location = install_location
+        self.install_type = install_type
+        self.module_path = module_path
+        self.name = module_path.split("/")[-1]
+        self.packages = packages
 
+    def resolve_install_folder(self, install_path):
+        """ SUMMARY:  determines where PTF installs the module when using organizational directories
+              INPUT:  the PTF base install path (str)
+             OUTPUT:  folder path (str) """
 
-class AxiomExecutingSubprocess:
-    """ structure for managing subprocesses that require interactive input """
+        return str(install_path + "/" + self.category + "/" + self.install_location)
 
-    def __init__(self, current_prompt, process):
-        self.current_prompt = current_prompt
-        self.process = process
-        self.prompt_pattern = None
 
+class AxiomResultStore:
+    """ an append-only SQLite database recording every command/action execution """
 
-class AxiomInteractiveTask:
-    """ defines tasks sent to AxiomDispatcher queue for working with interactive subprocesses """
+    def __init__(self):
+        self.connection = None
+        self.lock = Lock()
+
+    def aggregate(self, tool_name):
+        """ SUMMARY:  summarizes recorded executions per tool and command/action
+              INPUT:  tool name (str) to restrict the summary to, or None for every tool
+             OUTPUT:  list of tuples (tool, command, runs, failures, avg duration, max duration, avg CPU seconds,
+                      max RSS, total output bytes) """
+
+        statement = str("SELECT tool, command, COUNT(*), "
+                        "SUM(CASE WHEN exit_code IS NOT NULL AND exit_code != 0 THEN 1 ELSE 0 END), "
+                        "AVG(duration), MAX(duration), AVG(user_time + system_time), MAX(max_rss), "
+                        "SUM(output_bytes) FROM runs " +
+                        ("WHERE tool = ? " if tool_name is not None else "") +
+                        "GROUP BY tool, command ORDER BY tool, command")
+
+        return self.query(statement, (tool_name,) if tool_name is not None else ())
+
+    def connect(self):
+        """ SUMMARY:  opens the database in the history folder, creating the tables on first use
+              INPUT:  none, reads values from self and global config object
+             OUTPUT:  an open sqlite3 connection, raises sqlite3.Error on failure """
+
+        if self.connection is None:
+            connection = connect(str(config.axiom.history_folder + "/results.db"), timeout=30,
+                                 check_same_thread=False)
+            connection.execute("CREATE TABLE IF NOT EXISTS runs ("
+                               "id INTEGER PRIMARY KEY, "
+                               "tool TEXT, "
+                               "platform TEXT, "
+                               "command TEXT, "
+                               "execution_type TEXT, "
+                               "prompt_type TEXT, "
+                               "text TEXT, "
+                               "inputs TEXT, "
+                               "start_time REAL, "
+                               "end_time REAL, "
+                               "duration REAL, "
+                               "exit_code INTEGER, "
+                               "termination TEXT, "
+                               "user_time REAL, "
+                               "system_time REAL, "
+                               "max_rss INTEGER, "
+                               "output_bytes INTEGER)")
+            connection.execute("CREATE TABLE IF NOT EXISTS artifacts ("
+                               "id INTEGER PRIMARY KEY, "
+                               "run_id INTEGER REFERENCES runs (id), "
+                               "tool TEXT, "
+                               "command TEXT, "
+                               "output_type TEXT, "
+                               "path TEXT, "
+                               "prefix TEXT, "
+                               "size INTEGER, "
+                               "modified_time REAL, "
+                               "sha256 TEXT, "
+                               "recorded_time REAL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS artifacts_path ON artifacts (path)")
+            connection.execute("CREATE INDEX IF NOT EXISTS artifacts_tool ON artifacts (tool, command)")
+            connection.commit()
+            self.connection = connection
+
+        return self.connection
+
+    def describe_artifacts(self, details):
+        """ SUMMARY:  stats and hashes every output file of an execution that exists on the local filesystem, relative
+                      filenames written by interactive subprocesses are recorded as given without a size or hash
+              INPUT:  dictionary from describe_run()
+             OUTPUT:  list of tuples (tool, command, output type, filename, prefix, size, modified time, SHA-256) """
+
+        rows = []
+
+        for output_type, filename, prefix in details.get("artifacts", []):
+            if not path.isabs(filename):
+                rows.append((details["tool"], details["command"], output_type, filename, prefix, None, None, None))
+                continue
 
-    def __init__(self, text, starting_prompt, ending_prompt):
-        """ SUMMARY:  creates object, to be queued, for handling interactive execution tasks
-              INPUT:  the finalized command/action text (str or list), and starting + ending prompt type names
-             OUTPUT:  self, instantiates an AxiomInteractiveTask object  """
+            try:
+                file_status = stat(filename)
+                if not S_ISREG(file_status.st_mode):
+                    continue
+                digest = self.hash_file(filename)
 
-        self.ending_prompt = ending_prompt
-        self.starting_prompt = starting_prompt
-        self.text = text
+            except OSError:
+                continue
 
-        self.prompt_change = self.detect_prompt_change()
+            rows.append((details["tool"], details["command"], output_type, filename, prefix, file_status.st_size,
+                         file_status.st_mtime, digest))
 
-        self.ending_prompt_pattern = self.resolve_ending_prompt_pattern()
+        return rows
 
-    def detect_prompt_change(self):
-        """ SUMMARY:  compares two prompt type names, called by AxiomInteractiveTask init method
-              INPUT:  self, two string values that represent prompt type names
-             OUTPUT:  True or False based on string comparison """
+    def get_artifact_values(self, count):
+        """ returns up to "count" distinct artifact filenames and prefixes (newest first) mapped to their origin """
 
-        if self.starting_prompt == self.ending_prompt:
-            return False
-        else:
-            return True
+        values = {}
 
-    def resolve_ending_prompt_pattern(self):
-        """ SUMMARY:  extracts ending prompt pattern from global config object
-              INPUT:  self and global config object
-             OUTPUT:  string containing the appropriate prompt pattern """
+        for filename, prefix, tool, command in self.query("SELECT path, prefix, tool, command FROM artifacts "
+                                                          "ORDER BY id DESC LIMIT ?", (count,)):
+            origin = str(tool + " / " + command)
+            values.setdefault(filename, origin)
+            if prefix is not None:
+                values.setdefault(prefix, str(origin + " (prefix)"))
 
-        if self.prompt_change:
-            for x in config.axiom.prompts:
-                if x[0] == self.ending_prompt:
-                    return x[1]
-        else:
-            for x in config.axiom.prompts:
-                if x[0] == self.starting_prompt:
-                    return x[1]
+        return values
+
+    @staticmethod
+    def hash_file(filename):
+        """ returns the SHA-256 hex digest of a file, read in 1 MB blocks """
+
+        digest = sha256()
+
+        with open(filename, 'rb') as artifact_file:
+            block = artifact_file.read(1048576)
+            while block:
+                digest.update(block)
+                block = artifact_file.read(1048576)
+
+        return digest.hexdigest()
+
+    def query(self, statement, parameters):
+        """ SUMMARY:  runs a read-only SQL statement against the database
+              INPUT:  1) SQL statement (str) and 2) tuple of parameters
+             OUTPUT:  list of row tuples, empty if the database is unavailable """
+
+        try:
+            with self.lock:
+                return self.connect().execute(statement, parameters).fetchall()
+
+        except SQLiteError as error:
+            print_error(str("ERROR: Failed to query result store (" + str(error) + ")"))
+            return []
+
+    def recent(self, tool_name, count):
+        """ SUMMARY:  retrieves the most recently recorded executions
+              INPUT:  1) tool name (str) to restrict the results to, or None for every tool, and 2) maximum row count
+             OUTPUT:  list of tuples (id, start time, tool, command, exit code, termination, duration, CPU seconds,
+                      max RSS, output bytes, text), newest first """
+
+        statement = str("SELECT id, start_time, tool, command, exit_code, termination, duration, "
+                        "user_time + system_time, max_rss, output_bytes, text FROM runs " +
+                        ("WHERE tool = ? " if tool_name is not None else "") +
+                        "ORDER BY id DESC LIMIT ?")
+
+        return self.query(statement, (tool_name, count) if tool_name is not None else (count,))
+
+    def record(self, details, text, measurements):
+        """ SUMMARY:  appends one execution to the database
+              INPUT:  1) dictionary from describe_run() (or None), 2) finalized text (str or list), and 3) dictionary
+                      of timing, exit, and resource usage values (missing values are stored as NULL)
+             OUTPUT:  row ID (int) or None if the execution could not be recorded, also indexes output files """
+
+        if details is None:
+            return None
+
+        if isinstance(text, list):
+            text = "\n".join(text)
+
+        artifact_rows = self.describe_artifacts(details)
+
+        row = (details["tool"], details["platform"], details["command"], details["execution_type"],
+               details["prompt_type"], text, dumps(details["inputs"]), measurements.get("start_time"),
+               measurements.get("end_time"), measurements.get("duration"), measurements.get("exit_code"),
+               measurements.get("termination"), measurements.get("user_time"), measurements.get("system_time"),
+               measurements.get("max_rss"), measurements.get("output_bytes"))
+
+        try:
+            with self.lock:
+                connection = self.connect()
+                cursor = connection.execute("INSERT INTO runs (tool, platform, command, execution_type, prompt_type, "
+                                            "text, inputs, start_time, end_time, duration, exit_code, termination, "
+                                            "user_time, system_time, max_rss, output_bytes) "
+                                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                recorded_time = time()
+                for artifact_row in artifact_rows:
+                    connection.execute("INSERT INTO artifacts (run_id, tool, command, output_type, path, prefix, size, "
+                                       "modified_time, sha256, recorded_time) "
+                                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                       (cursor.lastrowid,) + artifact_row + (recorded_time,))
+                connection.commit()
+                return cursor.lastrowid
+
+        except SQLiteError as error:
+            print_error(str("ERROR: Failed to record execution in result store (" + str(error) + ")"))
+            return None
+
+    def search_artifacts(self, term, count):
+        """ SUMMARY:  retrieves recorded output files, optionally matching a search term
+              INPUT:  1) text (str) matched against filenames, tool names, and command names, or None, and 2) maximum
+                      row count
+             OUTPUT:  list of tuples (id, recorded time, tool, command, output type, filename, size, SHA-256, run id),
+                      newest first """
+
+        statement = str("SELECT id, recorded_time, tool, command, output_type, path, size, sha256, run_id "
+                        "FROM artifacts " +
+                        ("WHERE path LIKE ? OR tool LIKE ? OR command LIKE ? " if term is not None else "") +
+                        "ORDER BY id DESC LIMIT ?")
+
+        if term is None:
+            return self.query(statement, (count,))
+
+        pattern = str("%" + term + "%")
+        return self.query(statement, (pattern, pattern, pattern, count))
 
 
 class AxiomToolkit:
@@ -852,6 +3716,10 @@ class AxiomTool:
              OUTPUT:  True or False """
 
         if self.ptf_module not in ["", None]:
+            if self.ptf_module not in detector.catalog:
+                print_error(str("ERROR: Unknown PTF module " + self.ptf_module))
+                return False
+
             answer = input("[AXIOM] Install " + self.name + " via PTF? [Y/n] ")
             if answer not in ["Y", "y", "Yes", "yes"]:
                 return False
@@ -860,73 +3728,41 @@ class AxiomTool:
                     print_error(str("ERROR: Unable to run PTF on " + config.axiom.platform))
                     return False
                 else:
-                    input_text = str("python3 ./ptf --no-network-connection << EOF\n" +
-                                     str("use " + self.ptf_module + "\n") +
-                                     "install\n" +
-                                     "EOF\n")
-                    try:
-                        call(input_text, shell=True, cwd=config.axiom.ptf_folder)
-                        return True
-
-                    except OSError:
-                        print_error("ERROR: Failed to execute PTF")
-                        exit(1)
+                    return self.install_via_ptf() is not None
         else:
             return False
 
+    def install_via_ptf(self, log_file=None, ptf_folder=None):
+        """ SUMMARY:  runs a non-interactive PTF session that installs the tool's PTF module, safe to call from worker
+                      threads since it never exits
+              INPUT:  1) optional open file object receiving PTF output instead of the screen and 2) optional PTF
+                      folder to run from instead of the configured one (concurrent sessions each use their own copy)
+             OUTPUT:  PTF session exit code (int) or None if PTF could not be executed """
+
+        input_text = str("python3 ./ptf --no-network-connection << EOF\n" +
+                         str("use " + self.ptf_module + "\n") +
+                         "install\n" +
+                         "EOF\n")
+        try:
+            return_code = call(input_text, shell=True, cwd=ptf_folder or config.axiom.ptf_folder, stdout=log_file,
+                               stderr=log_file)
+            detector.invalidate()
+            return return_code
+
+        except OSError:
+            print_error("ERROR: Failed to execute PTF")
+            return None
+
     def is_installed(self):
-        """ SUMMARY:  checks local system for installed tool via 1) PTF and 2) 'which' command
+        """ SUMMARY:  checks local system for installed tool via 1) PTF catalog and 2) PATH lookup, results are memoized
               INPUT:  none. reads values from self
              OUTPUT:  True or False """
 
-        ptf_config_file = str(config.axiom.ptf_folder + "/config/ptf.config")
-
-        if self.ptf_module not in ["", None]:
-            tool_module_file = str(config.axiom.ptf_folder + "/" + self.ptf_module + ".py")
-
-            try:
-                with open(ptf_config_file) as ptf_config:
-                    for line in enumerate(ptf_config):
-                        if search("^BASE_INSTALL_PATH=", line[1]):
-                            install_path = line[1].split("\"")[1]
-                            break
-
-            except OSError:
-                print_error(str("ERROR: Failed to extract PTF base install path from " + ptf_config_file))
-                exit(1)
-
-            else:
-                try:
-                    with open(tool_module_file) as module_file:
-                        for line in enumerate(module_file):
-                            if search("^INSTALL_LOCATION=", line[1]):
-                                location = line[1].split("\"")[1]
-                                break
-
-                except OSError:
-                    print_error(str("ERROR: Failed to extract PTF install location from " + tool_module_file))
-                    exit(1)
-
-                else:
-                    folder = str(self.ptf_module.split("/")[1])
-                    ptf_tool_folder = str(install_path + "/" + folder + "/" + location)
-
-                    if path.exists(ptf_tool_folder):
-                        return True
-                    else:
-                        return False
-
-        text = str("which \"" + self.name + "\"")
-
         try:
-            dev_null = open(devnull, 'w')
-            if call(split(text), stdout=dev_null, stderr=STDOUT) == 0:
-                return True
-            else:
-                return False
+            return detector.is_installed(self)
 
-        except OSError:
-            print_error(str("ERROR: Failed to run command " + text))
+        except OSError as error:
+            print_error(str("ERROR: " + str(error)))
             exit(1)
 
     def platform_matches(self):
@@ -1006,4 +3842,113 @@ class AxiomTool:
             i += 1
 
 
+class AxiomWorkspaces:
+    """ named sets of input values bound by input type (e.g. IPV4) or input name (e.g. "Target"), the active workspace
+        fills matching command inputs so they are not prompted for """
+
+    def __init__(self):
+        self.active = None
+        self.filename = str(config.axiom.history_folder + "/workspaces.json")
+        self.overrides = {}
+        self.workspaces = None
+
+    def activate(self, name):
+        """ makes the named workspace active, creating it if it does not exist """
+
+        self.load()
+        self.active = name
+        self.workspaces.setdefault(name, {})
+        self.save()
+
+    def bind(self, key, value):
+        """ binds a value (str) to an input type or input name (str) in the active workspace """
+
+        self.get_bindings()[key] = value
+        self.save()
+
+    def get_bindings(self):
+        """ returns the dictionary of input types/names and values bound in the active workspace """
+
+        self.load()
+        return self.workspaces.setdefault(self.active, {})
+
+    def load(self):
+        """ reads the saved workspaces the first time they are needed, starting with an empty "default" workspace """
+
+        if self.workspaces is not None:
+            return
+
+        try:
+            with open(self.filename, 'r') as workspaces_file:
+                saved = loads(workspaces_file.read())
+            self.active = str(saved["active"])
+            self.workspaces = dict((str(x), dict((str(k), str(v)) for k, v in y.items()))
+                                   for x, y in saved["workspaces"].items())
+
+        except (AttributeError, KeyError, OSError, TypeError, ValueError):
+            self.active = "default"
+            self.workspaces = {}
+
+    def lookup(self, input_name, input_type):
+        """ returns the value (str) bound to an input name, or else its type, checking overrides supplied on the
+            command line before the active workspace, or None if unbound """
+
+        for bindings in [self.overrides, self.get_bindings()]:
+            if input_name in bindings:
+                return bindings[input_name]
+            if input_type in bindings:
+                return bindings[input_type]
+
+        return None
+
+    def save(self):
+        """ writes every workspace and the active workspace name to the history folder """
+
+        try:
+            write_atomically(self.filename, dumps({"active": self.active, "workspaces": self.workspaces}, indent=2))
+        except OSError:
+            print_error(str("ERROR: Failed to save workspaces to " + self.filename))
+
+    def show(self):
+        """ SUMMARY:  displays every workspace and the bindings of the active workspace
+              INPUT:  none, reads values from self
+             OUTPUT:  none, only prints to the screen """
+
+        bindings = self.get_bindings()
+
+        print("\n" + "Workspaces" + "\n")
+        for name in sorted(self.workspaces, key=str.casefold):
+            print("  " + ("* " if name == self.active else "  ") + name + "  (" +
+                  str(self.workspaces[name].__len__()) + " bound)")
+
+        print("\n" + "Bindings (" + self.active + ")" + "\n")
+        if bindings.__len__() == 0:
+            print("  none (bind values with: bind IPV4=10.0.0.1 or bind \"Output prefix=scan\")")
+        for key in sorted(bindings, key=str.casefold):
+            print("  " + key + " = " + bindings[key])
+        print()
+
+    def unbind(self, key):
+        """ removes the value bound to an input type or input name (str), returns True or False if it was not bound """
+
+        if key not in self.get_bindings():
+            return False
+
+        del self.get_bindings()[key]
+        self.save()
+        return True
+
+
+detector = AxiomInstallDetector()
+input_registry = AxiomInputTypes(config.axiom.input_types_list)
 dispatch = AxiomDispatcher()
+execution_cache = AxiomExecutionCache()
+jobs = AxiomJobControl()
+metrics = AxiomMetrics()
+prompt_types = AxiomPromptTypes(config.axiom.prompts)
+result_store = AxiomResultStore()
+workspaces = AxiomWorkspaces()
+
+register(metrics.save)
+register(jobs.terminate_all)
+register(dispatch.remove_spill_files)
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from colorama import Fore, Style
-from os import path
+from os import getpid, path, replace
 from sys import platform, stderr
 from yaml import parser, safe_load_all, scanner
 
@@ -42,12 +42,37 @@ class AxiomConfig:
         self.safety_timeout = None
         self.get_timeouts()
 
+        self.session_buffer = self.get_session_buffer()
+        self.live_output = self.get_live_output()
+        self.broker = self.get_broker()
+
+        self.install_workers = self.get_install_workers()
+
+        self.batch_workers = self.get_batch_workers()
+
+        self.fanout_rate = self.get_fanout_rate()
+        self.fanout_workers = self.get_fanout_workers()
+
+        self.max_jobs = self.get_max_jobs()
+
+        self.playbook_workers = self.get_playbook_workers()
+
+        self.limits = self.get_limits(self.yaml_list[0].get("limits"), "configuration file")
+
+        self.cache = self.get_cache()
+
+        self.metrics_textfile = self.get_metrics_textfile()
+
         self.toolkits = self.get_toolkits()
 
+        self.warm_pool = self.get_warm_pool()
+
         self.prompts = self.get_prompts()
 
         self.banner_file = self.get_banner()
 
+        self.confirm_bindings = self.get_confirm_bindings()
+
         self.inputs_pattern = None
         self.input_types_list = None
         self.get_inputs()
@@ -71,6 +96,131 @@ class AxiomConfig:
         else:
             return banner
 
+    def get_batch_workers(self):
+        """ validates user-supplied number of concurrent executions in "batch" mode, returns an integer (default: 8) """
+
+        try:
+            batch_workers = int(self.yaml_list[0].get("batch_workers", 8))
+
+            if batch_workers < 1:
+                print_error("ERROR: Invalid batch_workers setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid batch_workers setting in configuration file")
+            exit(1)
+
+        else:
+            return batch_workers
+
+    def get_broker(self):
+        """ validates user-supplied session broker behavior, returns True or False (default: False) """
+
+        broker = self.yaml_list[0].get("broker", False)
+
+        if not isinstance(broker, bool):
+            print_error("ERROR: Invalid broker setting in configuration file")
+            exit(1)
+
+        return broker
+
+    def get_cache(self):
+        """ validates user-supplied execution cache settings, returns a dictionary of the default time-to-live in
+            seconds (int), maximum total size in megabytes (int), and names of environment variables in cache keys """
+
+        cache = {"ttl": 86400, "size": 256, "environment": ["PATH"]}
+
+        try:
+            raw_cache = self.yaml_list[0].get("cache")
+            if raw_cache is None:
+                return cache
+
+            for setting_name in raw_cache.keys():
+                if setting_name not in cache:
+                    print_error(str("ERROR: Unknown cache setting \"" + str(setting_name) + "\" in configuration file"))
+                    exit(1)
+
+            cache["ttl"] = int(raw_cache.get("ttl", cache["ttl"]))
+            cache["size"] = int(raw_cache.get("size", cache["size"]))
+            cache["environment"] = [str(x) for x in raw_cache.get("environment") or []]
+
+            if cache["ttl"] <= 0 or cache["size"] <= 0:
+                print_error("ERROR: Invalid cache setting(s) in configuration file")
+                exit(1)
+
+        except (AttributeError, TypeError, ValueError):
+            print_error("ERROR: Invalid cache setting(s) in configuration file")
+            exit(1)
+
+        return cache
+
+    def get_cache_ttl(self, raw_cache, source):
+        """ SUMMARY:  validates the "cache" item of a tool YAML command, true uses the default time-to-live
+              INPUT:  1) true, false, null, or a number of seconds and 2) a description of the source (str)
+             OUTPUT:  time-to-live in seconds (int), or None if the command's results are not cached """
+
+        if raw_cache is None or raw_cache is False:
+            return None
+
+        if raw_cache is True:
+            return self.cache["ttl"]
+
+        if not isinstance(raw_cache, int) or raw_cache <= 0:
+            print_error(str("ERROR: Invalid cache setting in " + source))
+            exit(1)
+
+        return raw_cache
+
+    def get_confirm_bindings(self):
+        """ validates user-supplied workspace binding behavior, returns True or False (default: False) """
+
+        confirm_bindings = self.yaml_list[0].get("confirm_bindings", False)
+
+        if not isinstance(confirm_bindings, bool):
+            print_error("ERROR: Invalid confirm_bindings setting in configuration file")
+            exit(1)
+
+        return confirm_bindings
+
+    def get_fanout_rate(self):
+        """ validates user-supplied maximum executions started per second in "fanout" mode, returns a float or None """
+
+        try:
+            fanout_rate = self.yaml_list[0].get("fanout_rate")
+
+            if fanout_rate is None:
+                return None
+
+            fanout_rate = float(fanout_rate)
+
+            if fanout_rate <= 0:
+                print_error("ERROR: Invalid fanout_rate setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid fanout_rate setting in configuration file")
+            exit(1)
+
+        else:
+            return fanout_rate
+
+    def get_fanout_workers(self):
+        """ validates user-supplied number of concurrent executions in "fanout" mode, returns an int (default: 8) """
+
+        try:
+            fanout_workers = int(self.yaml_list[0].get("fanout_workers", 8))
+
+            if fanout_workers < 1:
+                print_error("ERROR: Invalid fanout_workers setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid fanout_workers setting in configuration file")
+            exit(1)
+
+        else:
+            return fanout_workers
+
     def get_folders(self):
         """ validates user-supplied folder names and sets global config values """
 
@@ -133,6 +283,96 @@ class AxiomConfig:
             self.inputs_pattern = inputs_pattern
             self.input_types_list = input_types_list
 
+    def get_install_workers(self):
+        """ validates user-supplied number of concurrent PTF installations, returns an integer (default: 4) """
+
+        try:
+            install_workers = int(self.yaml_list[0].get("install_workers", 4))
+
+            if install_workers < 1:
+                print_error("ERROR: Invalid install_workers setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid install_workers setting in configuration file")
+            exit(1)
+
+        else:
+            return install_workers
+
+    @staticmethod
+    def get_limits(raw_limits, source):
+        """ validates resource limits from the configuration file or tool YAML, returns a dictionary
+              INPUT:  1) a dictionary of limit names and values (or None) and 2) a description of the source (str)
+             OUTPUT:  a dictionary containing only the limit names that were set, values are integers or None """
+
+        limits = {}
+
+        if raw_limits is None:
+            return limits
+
+        try:
+            for limit_name in raw_limits.keys():
+                if limit_name not in ["timeout", "cpu_time", "address_space", "open_files"]:
+                    print_error(str("ERROR: Unknown limit \"" + str(limit_name) + "\" in " + source))
+                    exit(1)
+
+                if raw_limits[limit_name] is None:
+                    limits[limit_name] = None
+                else:
+                    limits[limit_name] = int(raw_limits[limit_name])
+                    if limits[limit_name] <= 0:
+                        print_error(str("ERROR: Invalid " + str(limit_name) + " limit in " + source))
+                        exit(1)
+
+        except (AttributeError, TypeError, ValueError):
+            print_error(str("ERROR: Invalid limits in " + source))
+            exit(1)
+
+        return limits
+
+    def get_live_output(self):
+        """ validates user-supplied live interactive session output behavior, returns True or False (default: True) """
+
+        live_output = self.yaml_list[0].get("live_output", True)
+
+        if not isinstance(live_output, bool):
+            print_error("ERROR: Invalid live_output setting in configuration file")
+            exit(1)
+
+        return live_output
+
+    def get_max_jobs(self):
+        """ validates user-supplied number of concurrent background jobs in the interactive prompt (default: 4) """
+
+        try:
+            max_jobs = int(self.yaml_list[0].get("max_jobs", 4))
+
+            if max_jobs < 1:
+                print_error("ERROR: Invalid max_jobs setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid max_jobs setting in configuration file")
+            exit(1)
+
+        else:
+            return max_jobs
+
+    def get_metrics_textfile(self):
+        """ validates user-supplied Prometheus textfile path, returns a filename (str) or None if disabled """
+
+        metrics_textfile = self.yaml_list[0].get("metrics_textfile")
+
+        if metrics_textfile is None:
+            return None
+
+        if not isinstance(metrics_textfile, str) or metrics_textfile == "":
+            print_error("ERROR: Invalid metrics_textfile setting in configuration file")
+            exit(1)
+
+        return metrics_textfile
+
     def get_outputs(self):
         """ iterates over listed output types, returns a list of two-item tuples """
 
@@ -156,6 +396,23 @@ class AxiomConfig:
         else:
             return output_types
 
+    def get_playbook_workers(self):
+        """ validates user-supplied number of concurrent steps in "play" mode, returns an integer (default: 4) """
+
+        try:
+            playbook_workers = int(self.yaml_list[0].get("playbook_workers", 4))
+
+            if playbook_workers < 1:
+                print_error("ERROR: Invalid playbook_workers setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid playbook_workers setting in configuration file")
+            exit(1)
+
+        else:
+            return playbook_workers
+
     def get_prompts(self):
         """ iterates over listed prompt types, returns a list of two-item tuples """
 
@@ -181,11 +438,28 @@ class AxiomConfig:
         else:
             return prompt_types
 
+    def get_session_buffer(self):
+        """ validates user-supplied number of unread bytes kept in memory per interactive session (default: 1048576) """
+
+        try:
+            session_buffer = int(self.yaml_list[0].get("session_buffer", 1048576))
+
+            if session_buffer < 4096:
+                print_error("ERROR: Invalid session_buffer setting in configuration file")
+                exit(1)
+
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            print_error("ERROR: Invalid session_buffer setting in configuration file")
+            exit(1)
+
+        else:
+            return session_buffer
+
     def get_timeouts(self):
         """ validates user-supplied timeout values and sets them in the global config """
 
         try:
-            pattern_timeout = int(self.yaml_list[0]["pattern_timeout"])
+            pattern_timeout = float(self.yaml_list[0]["pattern_timeout"])
             pty_timeout = float(self.yaml_list[0]["pty_timeout"])
             safety_timeout = int(self.yaml_list[0]["safety_timeout"])
 
@@ -236,6 +510,36 @@ class AxiomConfig:
         else:
             return toolkits
 
+    def get_warm_pool(self):
+        """ validates user-supplied warm pseudoterminal pool settings, returns a dictionary of the number of pre-spawned
+            /bin/bash subprocesses (int, zero disables the pool) and seconds an unused one is kept (int) """
+
+        warm_pool = {"size": 1, "idle_timeout": 600}
+
+        try:
+            raw_warm_pool = self.yaml_list[0].get("warm_pool")
+            if raw_warm_pool is None:
+                return warm_pool
+
+            for setting_name in raw_warm_pool.keys():
+                if setting_name not in warm_pool:
+                    print_error(str("ERROR: Unknown warm_pool setting \"" + str(setting_name) +
+                                    "\" in configuration file"))
+                    exit(1)
+
+            warm_pool["size"] = int(raw_warm_pool.get("size", warm_pool["size"]))
+            warm_pool["idle_timeout"] = int(raw_warm_pool.get("idle_timeout", warm_pool["idle_timeout"]))
+
+            if warm_pool["size"] < 0 or warm_pool["idle_timeout"] <= 0:
+                print_error("ERROR: Invalid warm_pool setting(s) in configuration file")
+                exit(1)
+
+        except (AttributeError, TypeError, ValueError):
+            print_error("ERROR: Invalid warm_pool setting(s) in configuration file")
+            exit(1)
+
+        return warm_pool
+
     @staticmethod
     def get_yaml(config_file):
         """ extracts YAML content from specified file, returns a list object """
@@ -266,4 +570,15 @@ def print_error(message):
     stderr.write(Fore.RED + message + Style.RESET_ALL + "\n")
 
 
+def write_atomically(filename, text):
+    """ SUMMARY:  writes text to a temporary file then renames it so readers never observe a partial file
+          INPUT:  1) filename (str) and 2) text (str)
+         OUTPUT:  no return value, raises OSError if the file cannot be written """
+
+    temporary_filename = str(filename + "." + str(getpid()) + ".tmp")
+    with open(temporary_filename, 'w') as temporary_file:
+        temporary_file.write(text)
+    replace(temporary_filename, filename)
+
+
 axiom = AxiomConfig("config.yml")
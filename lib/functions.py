@@ -15,19 +15,31 @@
 from lib.classes import *
 
 from colorama import Fore, Style
+from concurrent.futures import as_completed, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from csv import DictReader, Error as CSVError
 from io import BytesIO
-from os import geteuid, listdir, mkdir, path, rename, remove
+from ipaddress import ip_address, ip_network, IPv4Address, IPv6Address
+from itertools import chain
+from os import geteuid, getpid, listdir, mkdir, path, rename, remove, walk
 from pickle import dump, load, PickleError
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import FuzzyCompleter, WordCompleter
+from prompt_toolkit.patch_stdout import patch_stdout
 from prompt_toolkit.styles import Style as ptkStyle
+from queue import Queue
 from re import split
-from shutil import rmtree
-from sys import argv
+from shutil import copytree, rmtree
+from sys import argv, stderr, stdin, stdout
+from threading import Lock
 from requests import get, RequestException
-from yaml import safe_load_all, parser, scanner
+from time import localtime, monotonic, strftime
+from yaml import safe_load, safe_load_all, parser, scanner
 from zipfile import BadZipFile, LargeZipFile, ZipFile
 
+# version of the data saved in binary files, increment it whenever a saved class gains or loses attributes
+BINARY_FORMAT = 2
+
 
 def able_to_merge(current_tool, tool_id, tools):
     """ SUMMARY:  determines if merging YAML data from 2 files is possible without data loss
@@ -78,7 +90,41 @@ def axiom_help():
           "\n" + "  ./axiom show nmap" +
           "\n" + "  ./axiom show mimikatz 1" +
           "\n" + "  ./axiom build powershell 4" +
+          "\n" + "  ./axiom build nmap 2 --input Target=10.0.0.1 --input \"Output prefix=scan\"" +
+          "\n" + "  ./axiom build nmap 2 --file targets.jsonl > commands.txt" +
           "\n" + "  ./axiom run hashcat 3" +
+          "\n" + "  ./axiom run nmap 2 --input Target=10.0.0.1" +
+          "\n" + "  ./axiom run msfvenom 4 --force" +
+          "\n" + "" +
+          "\n" + "Batch execution: ./axiom batch [TOOL] [NUM] [FILE]" +
+          "\n" + "" +
+          "\n" + "  ./axiom batch nmap 2 targets.jsonl" +
+          "\n" + "  ./axiom batch nmap 2 targets.csv" +
+          "\n" + "  cat targets.jsonl | ./axiom batch nmap 2" +
+          "\n" + "" +
+          "\n" + "Range fan-out: ./axiom fanout [TOOL] [NUM]" +
+          "\n" + "" +
+          "\n" + "  ./axiom fanout nmap 2" +
+          "\n" + "" +
+          "\n" + "Input workspaces: ./axiom [workspace|bind|unbind] [NAME|KEY=VALUE|KEY]" +
+          "\n" + "" +
+          "\n" + "  ./axiom workspace" +
+          "\n" + "  ./axiom workspace acme" +
+          "\n" + "  ./axiom bind IPV4=10.0.0.1" +
+          "\n" + "  ./axiom bind \"Output prefix=acme-scan\"" +
+          "\n" + "  ./axiom unbind IPV4" +
+          "\n" + "" +
+          "\n" + "Playbooks: ./axiom play [FILE] [--resume]" +
+          "\n" + "" +
+          "\n" + "  ./axiom play recon.yml" +
+          "\n" + "  ./axiom play recon.yml --resume" +
+          "\n" + "" +
+          "\n" + "Session broker: ./axiom broker [list|start|stop|kill] [ID]" +
+          "\n" + "" +
+          "\n" + "  ./axiom broker" +
+          "\n" + "  ./axiom broker start" +
+          "\n" + "  ./axiom broker kill 2" +
+          "\n" + "  ./axiom broker stop" +
           "\n" + "" +
           "\n" + "Configuration management: ./axiom [MODE] [URL]" +
           "\n" + "" +
@@ -86,25 +132,48 @@ def axiom_help():
           "\n" + "  ./axiom reload" +
           "\n" + "  ./axiom init" +
           "\n" + "  ./axiom init https://example.com/config.yml" +
+          "\n" + "" +
+          "\n" + "Tool installation: ./axiom install [TOOLKIT]" +
+          "\n" + "" +
+          "\n" + "  ./axiom install" +
+          "\n" + "  ./axiom install \"Demo Toolkit X\"" +
+          "\n" + "" +
+          "\n" + "Execution history: ./axiom runs [TOOL]" +
+          "\n" + "" +
+          "\n" + "  ./axiom runs" +
+          "\n" + "  ./axiom runs nmap" +
+          "\n" + "" +
+          "\n" + "Output files: ./axiom artifacts [SEARCH]" +
+          "\n" + "" +
+          "\n" + "  ./axiom artifacts" +
+          "\n" + "  ./axiom artifacts nmap" +
+          "\n" + "" +
+          "\n" + "Metrics: ./axiom stats [FORMAT]" +
+          "\n" + "" +
+          "\n" + "  ./axiom stats" +
+          "\n" + "  ./axiom stats json" +
+          "\n" + "  ./axiom stats prometheus" +
           "\n")
 
 
-def axiom_prompt(tool_list, tool_names, tools):
+def axiom_prompt(tool_list, tool_names, tools, tool_status):
     """ SUMMARY:  main interactive prompt loop of the program, handles multiple tool selection loops
-          INPUT:  1) list of two-item tuples (name, platform), 2) set of tool names, and 3) list of AxiomTool objects
+          INPUT:  1) list of two-item tuples (name, platform), 2) set of tool names, 3) list of AxiomTool objects,
+                  and 4) dictionary of tool status text
          OUTPUT:  exit value (int) to be immediately passed to exit() in __main__ """
 
     exit_code = 1
 
     while exit_code > 0:
-        exit_code = tool_selection_prompt(tool_list, tool_names, tools)
+        exit_code = tool_selection_prompt(tool_list, tool_names, tools, tool_status)
 
     return exit_code
 
 
-def branch(settings, tool_list, tools):
+def branch(settings, inventory, tool_list, tools):
     """ SUMMARY:  changes program flow based on user-supplied settings
-          INPUT:  1) a three-item dictionary, 2) a de-duplicated list of tuples, and 3) list of AxiomTool objects
+          INPUT:  1) a three-item dictionary, 2) a list of AxiomToolkit objects, 3) a de-duplicated list of tuples, and
+                  4) list of AxiomTool objects
          OUTPUT:  no return value, may exit the entire program """
 
     if settings.get("mode") in [None, "reload", "init"]:
@@ -113,6 +182,27 @@ def branch(settings, tool_list, tools):
     if settings.get("mode") == "new":
         new_generate_command()
 
+    if settings.get("mode") == "install":
+        exit(install_missing_tools(settings.get("tool"), inventory, tools))
+
+    if settings.get("mode") == "artifacts":
+        exit(print_artifacts(settings.get("tool")))
+
+    if settings.get("mode") == "runs":
+        exit(print_runs(settings.get("tool"), tool_list))
+
+    if settings.get("mode") == "stats":
+        exit(print_metrics(settings.get("tool")))
+
+    if settings.get("mode") in ["workspace", "bind", "unbind"]:
+        exit(manage_workspace(settings.get("mode"), settings.get("tool")))
+
+    if settings.get("mode") == "broker":
+        exit(manage_broker(settings.get("tool"), settings.get("num")))
+
+    if settings.get("mode") == "play":
+        exit(run_playbook(settings.get("file"), settings.get("resume"), tool_list, tools))
+
     if settings.get("num") == -1:
         print_error("ERROR: Invalid command ID")
         exit(1)
@@ -155,6 +245,18 @@ def branch(settings, tool_list, tools):
         else:
             number = int(settings.get("num") - 1)
             command_type, id_value = tool.resolve_command(number)
+            if settings.get("inputs") is not None:
+                if command_type != "command":
+                    print_error("ERROR: Selected action has no inputs")
+                    exit(1)
+                input_keys = set(x[0] for x in tool.command_list[id_value].input_list) | \
+                    set(x[1] for x in tool.command_list[id_value].input_list)
+                for key in settings.get("inputs"):
+                    if key not in input_keys:
+                        print_error(str("ERROR: Selected command has no input named " + key))
+                        exit(1)
+                workspaces.overrides = settings.get("inputs")
+            execution_cache.force = settings.get("force") is True
             if command_type == "action":
                 if tool.action_list[id_value].execution_type in ["standalone", "autonomous", "NX"]:
                     tool.action_list[id_value].run(tool)
@@ -169,6 +271,30 @@ def branch(settings, tool_list, tools):
                     exit(1)
             exit(0)
 
+    if settings.get("mode") in ["batch", "fanout"]:
+        if int(settings.get("num") - 1) not in range(tool.combined_list.__len__()):
+            print_error("ERROR: Invalid command specified")
+            exit(1)
+        else:
+            command_type, id_value = tool.resolve_command(int(settings.get("num") - 1))
+            if command_type != "command":
+                print_error("ERROR: Selected action has no inputs to vary")
+                exit(1)
+            elif settings.get("mode") == "batch":
+                exit(run_batch(tool, tool.command_list[id_value], settings.get("file")))
+            else:
+                exit(run_fanout(tool, tool.command_list[id_value]))
+
+    if settings.get("mode") == "build" and (settings.get("inputs") is not None or settings.get("file") is not None):
+        if int(settings.get("num") - 1) not in range(tool.combined_list.__len__()):
+            print_error("ERROR: Invalid command specified")
+            exit(1)
+        command_type, id_value = tool.resolve_command(int(settings.get("num") - 1))
+        if command_type != "command":
+            print_error("ERROR: Selected action has no inputs")
+            exit(1)
+        exit(build_commands(tool.command_list[id_value], settings.get("inputs"), settings.get("file")))
+
     if settings.get("mode") == "build":
         if settings.get("num") is None:
             print_error("ERROR: No command specified")
@@ -186,6 +312,71 @@ def branch(settings, tool_list, tools):
             exit(0)
 
 
+def build_commands(command, inputs, filename):
+    """ SUMMARY:  renders command text without prompting, from one set of input values or a stream of input sets, and
+                  writes each rendered command to STDOUT (multi-line commands are followed by an empty line)
+          INPUT:  1) an AxiomCommand object, 2) dictionary of input names and values (or None), and 3) JSONL/CSV input
+                  filename, "-" for STDIN (or None)
+         OUTPUT:  exit value (int), 0 if every input set was rendered """
+
+    if inputs is not None:
+        items = [(1, inputs)]
+    else:
+        items = load_batch_items(filename)
+
+    multiple_lines = isinstance(command.text[0], list)
+    resolvers = command.get_input_resolvers()
+    rendered = []
+    failures = 0
+
+    for item_number, item in items:
+        values = item if isinstance(item, str) else command.resolve_input_values(item, resolvers)
+
+        if isinstance(values, str):
+            failures += 1
+            print_error(str("ERROR: Input set " + str(item_number) + ": " + values))
+            continue
+
+        if multiple_lines:
+            rendered.append(str("\n".join(command.render(values)) + "\n"))
+        else:
+            rendered.append(command.render(values))
+
+        if rendered.__len__() >= 4096:
+            stdout.write(str("\n".join(rendered) + "\n"))
+            rendered = []
+
+    if rendered.__len__() > 0:
+        stdout.write(str("\n".join(rendered) + "\n"))
+    stdout.flush()
+
+    return 0 if failures == 0 else 1
+
+
+def check_unattended_execution(tool, command):
+    """ SUMMARY:  confirms a command can be executed without user interaction ("batch"/"fanout"/"play" modes)
+          INPUT:  1) an AxiomTool object and 2) an AxiomAction or AxiomCommand object
+         OUTPUT:  True or False, prints the reason when False """
+
+    if command.execution_type not in ["standalone", "autonomous"] or command.prompt_type != "bash":
+        print_error("ERROR: Unattended execution requires a standalone or autonomous bash command")
+        return False
+
+    if not command.can_run_in_background():
+        print_error("ERROR: Autonomous multi-line commands are unsupported")
+        return False
+
+    if not tool.platform_matches():
+        print_error(str("ERROR: Cannot execute " + tool.name + " (" + tool.platform + ") on " + config.axiom.platform))
+        return False
+
+    if not tool.is_installed():
+        print_error(str("ERROR: " + tool.name + " is not installed (see ./axiom install)"))
+        return False
+
+    return True
+
+
 def command_selection_prompt(tool):
     """ SUMMARY:  prompts user to select a listed command/action for the current tool and calls the execution function
           INPUT:  an AxiomTool object
@@ -193,15 +384,19 @@ def command_selection_prompt(tool):
 
     while True:
         tool.show()
-        number = prompt('\n[AXIOM] Select command: ')
+        jobs.notify()
+        dispatch.notify()
+        number = live_output_prompt('\n[AXIOM] Select command: ')
 
         if number == "back":
             return
         if number == "exit" or number == "quit":
+            if not confirm_exit():
+                continue
             print("Exiting...")
             exit(0)
 
-        if number == "":
+        if number == "" or job_control(number) or session_control(number) or workspace_control(number):
             continue
 
         try:
@@ -225,8 +420,25 @@ def command_selection_prompt(tool):
             if confirmed:
                 dispatch.continue_trigger.wait(timeout=None)
                 dispatch.continue_trigger.clear()
-                print()
-                input("[AXIOM] Press ENTER to continue ")
+                if dispatch.count_running() == 0:
+                    print()
+                    input("[AXIOM] Press ENTER to continue ")
+
+
+def confirm_exit():
+    """ SUMMARY:  asks user to confirm exiting while background jobs or interactive tasks are running, since exiting
+                  terminates them
+          INPUT:  none
+         OUTPUT:  True or False """
+
+    running = jobs.count_running() + dispatch.count_running()
+    if running == 0:
+        return True
+
+    response = input("[AXIOM] " + str(running) + " background job(s) or interactive task(s) still running, exit and " +
+                     "terminate them? [y/N] ")
+
+    return response in ["Y", "y", "Yes", "yes"]
 
 
 def create_missing_folder(folder):
@@ -339,6 +551,122 @@ def download_and_extract_zip(zip_url, extracted_folder, destination_folder, huma
             exit(1)
 
 
+def execute_input_sets(tool, command, input_sets, workers, rate):
+    """ SUMMARY:  executes one rendered command per input set on a bounded worker pool, streaming one JSON result line
+                  per finished item to STDOUT, input sets are consumed lazily so only a few are held in memory
+          INPUT:  1) AxiomTool object, 2) AxiomCommand object, 3) iterable of two-item tuples (item number, list of
+                  input values or an error string), 4) maximum concurrent executions (int), and 5) maximum executions
+                  started per second (float) or None for no limit
+         OUTPUT:  exit value (int), 0 only if every item executed and exited with code 0 """
+
+    log_folder = str(config.axiom.binary_folder + "/batch/" + strftime("%Y%m%d-%H%M%S", localtime()) + "-" +
+                     str(getpid()))
+    create_missing_folder(str(config.axiom.binary_folder + "/batch"))
+    create_missing_folder(log_folder)
+
+    active = set()
+    active_lock = Lock()
+    running = set()
+    completed = 0
+    failures = 0
+    total = 0
+    start_time = monotonic()
+    next_start = start_time
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for item_number, values in input_sets:
+                total += 1
+
+                if isinstance(values, str):
+                    completed += 1
+                    failures += print_batch_result({"item": item_number, "error": values}, completed)
+                    continue
+
+                if running.__len__() >= workers * 2:
+                    wait(running, return_when=FIRST_COMPLETED)
+
+                while True:
+                    for future in [x for x in running if x.done()]:
+                        running.remove(future)
+                        completed += 1
+                        failures += print_batch_result(future.result(), completed)
+
+                    delay = 0 if rate is None else next_start - monotonic()
+                    if delay <= 0:
+                        break
+                    wait(running, timeout=delay, return_when=FIRST_COMPLETED)
+
+                if rate is not None:
+                    next_start = max(next_start, monotonic() - 1 / rate) + 1 / rate
+
+                running.add(executor.submit(run_batch_item, tool, command, item_number, values, log_folder, active,
+                                            active_lock))
+
+            for future in as_completed(running):
+                completed += 1
+                failures += print_batch_result(future.result(), completed)
+
+        except KeyboardInterrupt:
+            for future in running:
+                future.cancel()
+            with active_lock:
+                for execution in active:
+                    execution.terminate("was interrupted")
+            raise
+
+    print(str(str(total - failures) + " of " + str(total) + " items succeeded in " +
+              str(round(monotonic() - start_time, 1)) + " seconds (output saved in " + log_folder + ")"), file=stderr)
+
+    return 0 if failures == 0 else 1
+
+
+def expand_range_input(input_type, value):
+    """ SUMMARY:  lazily expands a range input into its individual elements without materializing the range
+          INPUT:  1) input type (str), one of IPV4CIDR, IPV6CIDR, IPV4RNGE, IPV6RNGE, or INTRANGE, and 2) input value
+                  (str), comma-separated segments such as "10.0.0.0/24", "10.0.0.1-10.0.0.9", "10.0.0.1-9", or "1-1024"
+         OUTPUT:  generator of element strings, raises ValueError for invalid values """
+
+    for segment in value.split(","):
+        segment = segment.strip()
+
+        if input_type in ["IPV4CIDR", "IPV6CIDR"]:
+            network = ip_network(segment, strict=False)
+            if network.version != (4 if input_type == "IPV4CIDR" else 6):
+                raise ValueError(str("wrong IP version in " + segment))
+            for address in network.hosts():
+                yield str(address)
+
+        elif input_type in ["IPV4RNGE", "IPV6RNGE"]:
+            first, last = segment.split("-")
+            first = ip_address(first.strip())
+            if first.version != (4 if input_type == "IPV4RNGE" else 6):
+                raise ValueError(str("wrong IP version in " + segment))
+            if first.version == 4 and "." not in last:
+                last = str(".".join(str(first).split(".")[:3]) + "." + last.strip())
+            last = ip_address(last.strip())
+            if last.version != first.version or int(last) < int(first):
+                raise ValueError(str("invalid range " + segment))
+            current = int(first)
+            while current <= int(last):
+                yield str(IPv4Address(current) if first.version == 4 else IPv6Address(current))
+                current += 1
+
+        elif input_type == "INTRANGE":
+            if "-" in segment.lstrip("-"):
+                separator = segment.index("-", 1)
+                first, last = int(segment[:separator]), int(segment[separator + 1:])
+            else:
+                first = last = int(segment)
+            if last < first:
+                raise ValueError(str("invalid range " + segment))
+            for number in range(first, last + 1):
+                yield str(number)
+
+        else:
+            raise ValueError(str(input_type + " inputs cannot be expanded"))
+
+
 def get_args():
     """ SUMMARY:  processes command-line arguments to modify overall program execution flow
           INPUT:  none, checks argv for arguments supplied via CLI
@@ -347,7 +675,8 @@ def get_args():
     if argv.__len__() < 2:
         return {"mode": None, "tool": None, "num": None}
 
-    elif argv.__len__() > 4:
+    elif argv.__len__() > 4 and argv[1] not in ["batch", "--batch", "b", "bu", "bui", "buil", "build", "-b", "--build",
+                                                "r", "ru", "run", "-r", "--run"]:
         axiom_help()
         exit(1)
 
@@ -359,6 +688,18 @@ def get_args():
             return {"mode": "reload", "tool": None, "num": None}
         if argv[1] in ["n", "ne", "new", "-n", "--new"]:
             return {"mode": "new", "tool": None, "num": None}
+        if argv[1] in ["install", "--install"]:
+            return {"mode": "install", "tool": None, "num": None}
+        if argv[1] in ["runs", "--runs"]:
+            return {"mode": "runs", "tool": None, "num": None}
+        if argv[1] in ["artifacts", "--artifacts"]:
+            return {"mode": "artifacts", "tool": None, "num": None}
+        if argv[1] in ["stats", "--stats"]:
+            return {"mode": "stats", "tool": None, "num": None}
+        if argv[1] in ["workspace", "--workspace", "bind", "--bind"]:
+            return {"mode": "workspace", "tool": None, "num": None}
+        if argv[1] in ["broker", "--broker"]:
+            return {"mode": "broker", "tool": None, "num": None}
         else:
             axiom_help()
             exit(1)
@@ -367,6 +708,26 @@ def get_args():
 
         if argv[1] == "init":
             return {"mode": "init", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["install", "--install"] and argv.__len__() == 3:
+            return {"mode": "install", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["artifacts", "--artifacts"] and argv.__len__() == 3:
+            return {"mode": "artifacts", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["runs", "--runs"] and argv.__len__() == 3:
+            return {"mode": "runs", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["stats", "--stats"] and argv.__len__() == 3 and argv[2] in ["json", "prometheus"]:
+            return {"mode": "stats", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["workspace", "--workspace"] and argv.__len__() == 3:
+            return {"mode": "workspace", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["bind", "--bind", "unbind", "--unbind"] and argv.__len__() == 3:
+            return {"mode": argv[1].lstrip("-"), "tool": str(argv[2]), "num": None}
+        if argv[1] in ["broker", "--broker"] and argv.__len__() == 3 and argv[2] in ["list", "start", "stop", "serve"]:
+            return {"mode": "broker", "tool": str(argv[2]), "num": None}
+        if argv[1] in ["broker", "--broker"] and argv.__len__() == 4 and argv[2] == "kill":
+            try:
+                number = int(argv[3])
+            except (ValueError, TypeError):
+                number = -1
+            return {"mode": "broker", "tool": "kill", "num": number}
         if argv[1] in ["s", "sh", "sho", "show", "-s", "--show"]:
             if argv.__len__() == 3:
                 return {"mode": "show", "tool": str(argv[2]), "num": None}
@@ -380,22 +741,53 @@ def get_args():
         if argv[1] in ["r", "ru", "run", "-r", "--run"]:
             if argv.__len__() == 3:
                 return {"mode": "run", "tool": str(argv[2]), "num": None}
-            if argv.__len__() == 4:
+            if argv.__len__() >= 4:
                 try:
                     number = int(argv[3])
                 except (ValueError, TypeError):
                     number = -1
-                return {"mode": "run", "tool": str(argv[2]), "num": number}
+                options = [x for x in argv[4:] if x != "--force"]
+                inputs, filename = get_build_options(options)
+                if filename is not None:
+                    print_error("ERROR: Input files are only supported in batch and build modes")
+                    exit(1)
+                return {"mode": "run", "tool": str(argv[2]), "num": number, "inputs": inputs,
+                        "force": options.__len__() < argv[4:].__len__()}
+
+        if argv[1] in ["batch", "--batch"] and argv.__len__() > 5:
+            axiom_help()
+            exit(1)
+
+        if argv[1] in ["batch", "--batch"] and argv.__len__() in [4, 5]:
+            try:
+                number = int(argv[3])
+            except (ValueError, TypeError):
+                number = -1
+            return {"mode": "batch", "tool": str(argv[2]), "num": number,
+                    "file": str(argv[4]) if argv.__len__() == 5 else None}
+
+        if argv[1] in ["play", "--play"] and argv.__len__() == 3:
+            return {"mode": "play", "tool": None, "num": None, "file": str(argv[2]), "resume": False}
+        if argv[1] in ["play", "--play"] and argv.__len__() == 4 and argv[3] == "--resume":
+            return {"mode": "play", "tool": None, "num": None, "file": str(argv[2]), "resume": True}
+
+        if argv[1] in ["fanout", "--fanout"] and argv.__len__() == 4:
+            try:
+                number = int(argv[3])
+            except (ValueError, TypeError):
+                number = -1
+            return {"mode": "fanout", "tool": str(argv[2]), "num": number}
 
         if argv[1] in ["b", "bu", "bui", "buil", "build", "-b", "--build"]:
             if argv.__len__() == 3:
                 return {"mode": "build", "tool": str(argv[2]), "num": None}
-            if argv.__len__() == 4:
+            if argv.__len__() >= 4:
                 try:
                     number = int(argv[3])
                 except (ValueError, TypeError):
                     number = -1
-                return {"mode": "build", "tool": str(argv[2]), "num": number}
+                inputs, filename = get_build_options(argv[4:])
+                return {"mode": "build", "tool": str(argv[2]), "num": number, "inputs": inputs, "file": filename}
 
         else:
             axiom_help()
@@ -406,6 +798,68 @@ def get_args():
         exit(1)
 
 
+def get_batch_input_sets(command, filename):
+    """ SUMMARY:  converts input sets keyed by input name into ordered, validated, and normalized input values for
+                  execute_input_sets()
+          INPUT:  1) an AxiomCommand object and 2) input filename (str) or None for STDIN
+         OUTPUT:  yields two-item tuples (item number, list of input values or an error string) """
+
+    resolvers = command.get_input_resolvers()
+
+    for item_number, item in load_batch_items(filename):
+        if isinstance(item, str):
+            yield item_number, item
+        else:
+            yield item_number, command.resolve_input_values(item, resolvers)
+
+
+def get_build_options(arguments):
+    """ SUMMARY:  parses the options of non-interactive "build" mode
+          INPUT:  list of CLI arguments after the command number, "-i/--input NAME=VALUE" (repeatable) or "-f/--file
+                  FILE" ("-" for STDIN)
+         OUTPUT:  two-item tuple (dictionary of input names and values or None, filename or None) """
+
+    inputs = None
+    filename = None
+
+    i = 0
+    while i < arguments.__len__():
+        if arguments[i] in ["-i", "--input"] and i + 1 < arguments.__len__() and "=" in arguments[i + 1]:
+            name, value = arguments[i + 1].split("=", 1)
+            inputs = {} if inputs is None else inputs
+            inputs[name] = value
+        elif arguments[i] in ["-f", "--file"] and i + 1 < arguments.__len__() and filename is None:
+            filename = arguments[i + 1]
+        else:
+            axiom_help()
+            exit(1)
+        i += 2
+
+    if inputs is not None and filename is not None:
+        print_error("ERROR: Supply inputs via --input or --file, not both")
+        exit(1)
+
+    return inputs, filename
+
+
+def get_fanout_input_sets(values, target_index, targets):
+    """ SUMMARY:  produces one set of input values per expanded target, all other input values stay the same
+          INPUT:  1) list of input values (str), 2) index of the expanded input (int), and 3) iterable of targets (str)
+         OUTPUT:  yields two-item tuples (item number, list of input values), or an error string if expansion fails """
+
+    item_number = 0
+
+    try:
+        for target in targets:
+            item_number += 1
+            current_values = values[:]
+            current_values[target_index] = target
+            yield item_number, current_values
+
+    except ValueError as error:
+        yield item_number + 1, str("invalid target range (" + str(error) + ")")
+
+
 def get_input_types(input_types_list, text):
     """ SUMMARY:  parses placeholder text to determine the type of input required for command/action execution
           INPUT:  1) list of all possible input types (strings), and 2) the command text (list or str)
@@ -443,6 +897,48 @@ def get_input_types(input_types_list, text):
     return used_input_types
 
 
+def get_playbook_step_values(step, results):
+    """ SUMMARY:  resolves a playbook step's input values, replacing each output reference with the first matching
+                  file produced by the referenced step
+          INPUT:  1) step dictionary from load_playbook() and 2) dictionary of step names and finished step results
+         OUTPUT:  list of input values (str), or an error string describing the first unresolved or invalid input """
+
+    if not isinstance(step["command"], AxiomCommand):
+        return []
+
+    item = {}
+    for name, value in step["inputs"].items():
+        if isinstance(value, dict):
+            match = str(value.get("match", ""))
+            artifacts = [x for x in results[value["output"]].get("artifacts", []) if match in path.basename(x)]
+            if artifacts.__len__() == 0:
+                return str("step " + value["output"] + " produced no output file" +
+                           (" matching " + match if match != "" else ""))
+            item[name] = artifacts[0]
+        else:
+            item[name] = value
+
+    return step["command"].resolve_input_values(item)
+
+
+def get_tool_status(tools):
+    """ SUMMARY:  creates tool status text for display and starts a background probe for installation status
+          INPUT:  a list of AxiomTool objects
+         OUTPUT:  a dictionary with tool name keys and status text values, filled in as the probe completes """
+
+    tool_status = {}
+    for tool in tools:
+        if not tool.platform_matches():
+            if tool.name in tool_status:
+                tool_status[tool.name] = str(tool_status[tool.name] + ", " + tool.platform)
+            else:
+                tool_status[tool.name] = str(tool.platform)
+
+    detector.probe_in_background(tools, tool_status)
+
+    return tool_status
+
+
 def get_tool_names(tool_list):
     """ SUMMARY:  creates a list (set) of unique tool names for searching, auto-suggestion, etc.
           INPUT:  a list of two-item tuple (tool, platform)
@@ -503,6 +999,289 @@ def initialize(settings):
         exit(1)
 
 
+def install_missing_tools(toolkit_name, inventory, tools):
+    """ SUMMARY:  installs every undetected tool with a PTF module in one pass, running independent PTF sessions
+                  concurrently, skipping tools whose PTF module depends on a failed installation, and printing a
+                  summary of successes, failures, skipped tools, and timings
+          INPUT:  1) toolkit name (str) or None for all toolkits, 2) list of AxiomToolkit objects, and 3) list of
+                  AxiomTool objects
+         OUTPUT:  exit value (int), 0 if every installation succeeded """
+
+    if config.axiom.platform.lower() != "linux":
+        print_error(str("ERROR: Unable to run PTF on " + config.axiom.platform))
+        return 1
+
+    if toolkit_name is not None:
+        matching_toolkits = [x for x in inventory if x.name == toolkit_name]
+        if matching_toolkits.__len__() == 0:
+            print_error(str("ERROR: Toolkit \"" + toolkit_name + "\" not found"))
+            return 1
+        tools = [x for x in tools if (x.name, x.platform) in matching_toolkits[0].tool_name_list]
+
+    candidates = {}
+    for tool in tools:
+        if tool.platform_matches() and tool.ptf_module in detector.catalog and tool.ptf_module not in candidates:
+            if not tool.is_installed():
+                candidates[tool.ptf_module] = tool
+
+    if candidates.__len__() == 0:
+        print("All tools with PTF modules are already installed.")
+        return 0
+
+    print("\nUninstalled Tools\n")
+    for tool in sorted(candidates.values(), key=lambda x: x.name.casefold()):
+        print("  " + tool.name + "\t" + tool.ptf_module)
+
+    answer = input("\n[AXIOM] Install " + str(candidates.__len__()) + " tools via PTF? [Y/n] ")
+    if answer not in ["Y", "y", "Yes", "yes"]:
+        return 1
+
+    log_folder = str(config.axiom.binary_folder + "/install")
+    create_missing_folder(log_folder)
+
+    package_lock = Lock()
+    ptf_folders = Queue()
+    for i in range(min(config.axiom.install_workers, candidates.__len__())):
+        ptf_folders.put(str(log_folder + "/ptf-" + str(i + 1)))
+    pending = sorted(candidates.values(), key=lambda x: x.name.casefold())
+    failed = set()
+    finished = set()
+    running = {}
+    results = []
+    start_time = monotonic()
+
+    with ThreadPoolExecutor(max_workers=config.axiom.install_workers) as executor:
+        while pending.__len__() > 0 or running.__len__() > 0:
+            skipping = True
+            while skipping:
+                skipping = False
+                for tool in pending[:]:
+                    failed_dependencies = [x for x in detector.catalog[tool.ptf_module].dependencies if x in failed]
+                    if failed_dependencies.__len__() > 0:
+                        pending.remove(tool)
+                        failed.add(tool.ptf_module)
+                        results.append((tool, None, 0.0, str("skipped, " + failed_dependencies[0] + " failed")))
+                        print_error(str("ERROR: Skipped " + tool.name + " (" + failed_dependencies[0] + " failed)"))
+                        skipping = True
+
+            if pending.__len__() == 0 and running.__len__() == 0:
+                break
+
+            ready = [x for x in pending if all(y in finished or y not in candidates
+                                               for y in detector.catalog[x.ptf_module].dependencies)]
+
+            if ready.__len__() == 0 and running.__len__() == 0:
+                ready = pending[:]
+
+            for tool in ready:
+                if running.__len__() >= config.axiom.install_workers:
+                    break
+                pending.remove(tool)
+                print("Installing " + tool.name + "...")
+                running[executor.submit(install_ptf_module, tool, package_lock, log_folder, ptf_folders)] = tool
+
+            done, not_done = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+            for future in done:
+                tool = running.pop(future)
+                result = future.result()
+                results.append(result)
+
+                if result[1]:
+                    finished.add(tool.ptf_module)
+                    print("Installed " + tool.name + " in " + str(round(result[2], 1)) + " seconds")
+                else:
+                    failed.add(tool.ptf_module)
+                    print_error(str("ERROR: Failed to install " + tool.name + " (see " + result[3] + ")"))
+
+    while not ptf_folders.empty():
+        rmtree(ptf_folders.get(), ignore_errors=True)
+
+    return print_install_summary(results, monotonic() - start_time, log_folder)
+
+
+def install_ptf_module(tool, package_lock, log_folder, ptf_folders):
+    """ SUMMARY:  installs one tool via PTF from a private copy of the PTF folder, so concurrent sessions never share
+                  PTF's working files, and serializes installations that require operating system packages, the
+                  duration excludes copying the PTF folder and waiting for other installations
+          INPUT:  1) an AxiomTool object, 2) a Lock shared by all installations, 3) log folder name (str), and 4) Queue
+                  of PTF folder copies (str), one per worker, each copied from the PTF folder on first use
+         OUTPUT:  four-item tuple of the AxiomTool object, success (bool), duration in seconds (float), and log file """
+
+    module = detector.catalog[tool.ptf_module]
+    log_filename = str(log_folder + "/" + module.category + "-" + module.name + ".log")
+    requires_packages = any(x.__len__() > 0 for x in module.packages.values())
+    return_code = None
+    start_time = None
+
+    ptf_folder = ptf_folders.get()
+
+    try:
+        if not path.exists(ptf_folder):
+            copytree(config.axiom.ptf_folder, ptf_folder, symlinks=True)
+
+        with package_lock if requires_packages else nullcontext():
+            start_time = monotonic()
+            with open(log_filename, 'w') as log_file:
+                return_code = tool.install_via_ptf(log_file, ptf_folder)
+
+    except OSError:
+        print_error(str("ERROR: Failed to prepare PTF session for " + tool.name))
+
+    finally:
+        ptf_folders.put(ptf_folder)
+
+    try:
+        success = return_code is not None and detector.detect(tool)
+    except OSError:
+        success = False
+
+    duration = monotonic() - start_time if start_time is not None else 0.0
+    metrics.observe("axiom_install_seconds", duration, {"outcome": "succeeded" if success else "failed"})
+
+    return tool, success, duration, log_filename
+
+
+def job_control(text):
+    """ SUMMARY:  handles the background job commands available at the interactive prompts: "jobs" lists every job,
+                  "fg [ID]" displays a job's output until it finishes (CTRL+C detaches), "kill [ID]" terminates a job,
+                  and "tail [ID] [LINES]" displays the end of a job's output, ID defaults to the most recent job
+          INPUT:  text (str) entered at a prompt
+         OUTPUT:  True if the text was a job command, False otherwise """
+
+    words = text.split()
+
+    if words.__len__() == 0 or words[0] not in ["jobs", "fg", "kill", "tail"]:
+        return False
+
+    if words[0] == "jobs":
+        jobs.show()
+        return True
+
+    if words.__len__() > 1:
+        job = jobs.find(words[1])
+    elif jobs.jobs.__len__() > 0:
+        job = jobs.jobs[-1]
+    else:
+        job = None
+
+    if job is None:
+        print_error("\nERROR: Invalid job specified (see \"jobs\")")
+        return True
+
+    if words[0] == "fg":
+        print()
+        if job.follow():
+            job.notified = True
+            print("\n[AXIOM] Job " + str(job.job_id) + " " + job.describe_state() + " after " +
+                  str(round(job.get_elapsed(), 1)) + "s: " + job.name)
+        else:
+            print("[AXIOM] Job " + str(job.job_id) + " is still running in the background")
+
+    elif words[0] == "kill":
+        if job.done.is_set():
+            print_error(str("\nERROR: Job " + str(job.job_id) + " already finished"))
+        else:
+            job.execution.terminate("was killed by the user")
+            print("\n[AXIOM] Terminating job " + str(job.job_id))
+
+    else:
+        try:
+            count = int(words[2]) if words.__len__() > 2 else 20
+        except ValueError:
+            count = 20
+        print("\n" + "\n".join(job.tail(max(count, 1))))
+
+    return True
+
+
+def live_output_prompt(message, **kwargs):
+    """ SUMMARY:  displays a prompt_toolkit prompt while new output from idle interactive sessions (unless live_output
+                  is disabled in the configuration file), output from running interactive tasks, and completed
+                  background jobs and interactive tasks print above the input line in real time
+          INPUT:  prompt message (str) and any keyword arguments accepted by prompt_toolkit's prompt()
+         OUTPUT:  text (str) entered by the user """
+
+    live_output = config.axiom.live_output and dispatch.loop is not None
+
+    if not live_output and jobs.count_running() == 0 and dispatch.count_running() == 0:
+        return prompt(message, **kwargs)
+
+    with patch_stdout(raw=True):
+        dispatch.set_live_output(live_output)
+        dispatch.set_announcing(True)
+        jobs.set_announcing(True)
+        try:
+            return prompt(message, **kwargs)
+        finally:
+            jobs.set_announcing(False)
+            dispatch.set_announcing(False)
+            dispatch.set_live_output(False)
+
+
+def load_batch_items(filename):
+    """ SUMMARY:  lazily reads input sets keyed by input name from a JSONL or CSV (with header row) file or STDIN
+          INPUT:  filename (str), "-" or None for STDIN, CSV is detected by the ".csv" extension or a first line that
+                  does not begin with "{"
+         OUTPUT:  yields two-item tuples (item number, dictionary of input names and values or an error string) """
+
+    try:
+        batch_file = stdin if filename in [None, "-"] else open(filename, 'r', newline='')
+
+    except OSError:
+        print_error(str("ERROR: Failed to open batch input file " + filename))
+        exit(1)
+
+    with batch_file:
+        first_line = batch_file.readline()
+        while first_line.strip() == "" and first_line != "":
+            first_line = batch_file.readline()
+
+        if first_line == "":
+            return
+
+        if (filename is not None and filename.lower().endswith(".csv")) or not first_line.lstrip().startswith("{"):
+            reader = DictReader(chain([first_line], batch_file))
+            item_number = 0
+            try:
+                for row in reader:
+                    item_number += 1
+                    yield item_number, row
+            except CSVError as error:
+                yield item_number + 1, str("invalid CSV (" + str(error) + ")")
+            return
+
+        item_number = 0
+        for line in chain([first_line], batch_file):
+            if line.strip() == "":
+                continue
+            item_number += 1
+            try:
+                item = loads(line)
+            except ValueError:
+                yield item_number, "invalid JSON"
+                continue
+            if isinstance(item, dict):
+                yield item_number, item
+            else:
+                yield item_number, "input set is not a JSON object"
+
+
+def load_binary(binary_file):
+    """ SUMMARY:  deserializes data saved in a binary file by this version of AXIOM Framework
+          INPUT:  open binary file object
+         OUTPUT:  the saved data, or None if the file was saved by a different version and must be rebuilt """
+
+    try:
+        saved = load(binary_file)
+    except (AttributeError, EOFError, ImportError):
+        return None
+
+    if isinstance(saved, tuple) and saved.__len__() == 2 and saved[0] == BINARY_FORMAT:
+        return saved[1]
+
+    return None
+
+
 def load_commands(yam, inputs_pattern, input_types_list):
     """ SUMMARY:  creates all command and action objects for a given tool file's YAML data
           INPUT:  1) a list of 2 dicts from the source YAML file, 2) a regex pattern (str), and 3) a list of strings
@@ -530,6 +1309,15 @@ def load_commands(yam, inputs_pattern, input_types_list):
                 print_error(str("ERROR: " + tool_string + "contains non-unique action name \"" + name + "\""))
                 exit(1)
 
+        limits = {}
+        cache_ttl = None
+        source = str(yam[0]["name"] + " (" + yam[0]["os"] + ") command \"" + name + "\"")
+        for extra_item in list(current_cmd.values())[0][5:]:
+            if list(extra_item.keys())[0] == "limits":
+                limits = config.axiom.get_limits(list(extra_item.values())[0], source)
+            elif list(extra_item.keys())[0] == "cache":
+                cache_ttl = config.axiom.get_cache_ttl(list(extra_item.values())[0], source)
+
         prompt_type = str(list(list(current_cmd.values())[0][0].values())[0][0])
         execution_type = str(list(list(current_cmd.values())[0][0].values())[0][1])
         text = list(list(current_cmd.values())[0][1].values())[0]
@@ -544,10 +1332,12 @@ def load_commands(yam, inputs_pattern, input_types_list):
         if raw_input_list:
 
             tokens, input_list = load_text_and_inputs(text, inputs_pattern, input_types_list, raw_input_list)
-            command_list.append(AxiomCommand(name, prompt_type, execution_type, tokens, output_list, note, input_list))
+            command_list.append(AxiomCommand(name, prompt_type, execution_type, tokens, output_list, note, limits,
+                                             cache_ttl, input_list))
 
         else:
-            action_list.append(AxiomAction(name, prompt_type, execution_type, text, output_list, note))
+            action_list.append(AxiomAction(name, prompt_type, execution_type, text, output_list, note, limits,
+                                           cache_ttl))
 
         i += 1
 
@@ -563,13 +1353,17 @@ def load_inventory():
     if path.exists(loadable_inventory_file):
         try:
             with open(loadable_inventory_file, 'rb') as inventory_dump:
-                toolkits = load(inventory_dump)
+                toolkits = load_binary(inventory_dump)
 
         except (OSError, PickleError):
             print_error(str("ERROR: Failed to load inventory binary file " + loadable_inventory_file))
             exit(1)
         else:
-            return toolkits
+            if toolkits is not None:
+                metrics.increment("axiom_loader_cache_total", 1, {"file": "inventory", "result": "hit"})
+                return toolkits
+
+    metrics.increment("axiom_loader_cache_total", 1, {"file": "inventory", "result": "miss"})
 
     folders = []
     if path.exists(config.axiom.inventory_folder):
@@ -604,7 +1398,7 @@ def load_inventory():
 
     try:
         with open(loadable_inventory_file, 'wb') as inventory:
-            dump(toolkits, inventory)
+            dump((BINARY_FORMAT, toolkits), inventory)
 
     except (OSError, PickleError):
         print_error(str("ERROR: Failed to save inventory binary file " + loadable_inventory_file))
@@ -613,6 +1407,29 @@ def load_inventory():
     return toolkits
 
 
+def load_metrics():
+    """ SUMMARY:  combines the cumulative metrics saved by previous runs with the current process's metrics
+          INPUT:  none, reads the metrics file in the history folder
+         OUTPUT:  an AxiomMetrics object """
+
+    combined = AxiomMetrics()
+    metrics_filename = str(config.axiom.history_folder + "/metrics.json")
+
+    if path.exists(metrics_filename):
+        try:
+            with open(metrics_filename, 'r') as metrics_file:
+                combined.merge(loads(metrics_file.read()))
+
+        except (KeyError, OSError, TypeError, ValueError):
+            print_error(str("ERROR: Failed to load metrics file " + metrics_filename))
+            exit(1)
+
+    with metrics.lock:
+        combined.merge(metrics.get_snapshot())
+
+    return combined
+
+
 def load_outputs(raw_output_list, tool):
     """ SUMMARY:  retrieves a list of values representing each command/action output
           INPUT:  1) a list of outputs (str) taken directly from a YAML file 2) the target tool (str)
@@ -639,17 +1456,16 @@ def load_outputs(raw_output_list, tool):
                     elif list(list(current_output.values())[0].keys())[0] == "prefix":
                         input_number = int(list(list(current_output.values())[0].values())[0][0])
 
-                        if isinstance(list(list(current_output.values())[0].values())[0][1], str):  # single extension
-                            extension_string = str(list(list(current_output.values())[0].values())[0][1])
-                            output_list.append(("F_PREFIX", (input_number, extension_string)))
+                        if isinstance(list(list(current_output.values())[0].values())[0][1], list):  # [N, [ext, ...]]
+                            extensions = list(list(current_output.values())[0].values())[0][1]
+                        else:  # [N, ext, ...] as generated by "new" mode
+                            extensions = list(list(current_output.values())[0].values())[0][1:]
 
-                        elif isinstance(list(list(current_output.values())[0].values())[0][1], list):  # >1 extensions
-                            prefix_count = 0
-                            while prefix_count <= list(list(current_output.values())[0].values())[0][0]:
-                                extension_string = str(list(list(
-                                    current_output.values())[0].values())[0][1][prefix_count])
-                                output_list.append(("F_PREFIX", (input_number, extension_string)))
-                                prefix_count += 1
+                        prefix_count = 0
+                        while prefix_count < extensions.__len__():
+                            extension_string = str(extensions[prefix_count])
+                            output_list.append(("F_PREFIX", (input_number, extension_string)))
+                            prefix_count += 1
 
                 elif list(current_output)[0] == "PROMPT":
                     output_list.append(("PROMPT", str(list(current_output.values())[0])))
@@ -666,6 +1482,201 @@ def load_outputs(raw_output_list, tool):
     return output_list
 
 
+def load_playbook(filename, tool_list, tools):
+    """ SUMMARY:  reads and validates a YAML playbook whose steps reference tools and commands/actions by name (or
+                  number), bind input values (or output files of earlier steps), and depend on earlier steps
+          INPUT:  1) playbook filename (str), 2) de-duplicated list of tuples (name, platform), and 3) list of AxiomTool
+                  objects
+         OUTPUT:  list of step dictionaries in playbook order, exits if the playbook is invalid """
+
+    try:
+        with open(filename, 'r') as playbook_file:
+            playbook_yaml = safe_load(playbook_file)
+
+    except OSError:
+        print_error(str("ERROR: Failed to open playbook " + filename))
+        exit(1)
+
+    except (parser.ParserError, scanner.ScannerError):
+        print_error(str("ERROR: Failed to parse playbook " + filename))
+        exit(1)
+
+    if not isinstance(playbook_yaml, dict) or not isinstance(playbook_yaml.get("steps"), list) or \
+            playbook_yaml["steps"].__len__() == 0:
+        print_error("ERROR: Playbook must contain a list of steps")
+        exit(1)
+
+    steps = []
+    step_names = set()
+
+    for raw_step in playbook_yaml["steps"]:
+        step_number = steps.__len__() + 1
+
+        if not isinstance(raw_step, dict) or raw_step.get("name") in [None, ""] or \
+                raw_step.get("tool") in [None, ""] or raw_step.get("command") in [None, ""]:
+            print_error(str("ERROR: Playbook step " + str(step_number) + " requires a name, tool, and command"))
+            exit(1)
+
+        name = str(raw_step["name"])
+        if name in step_names:
+            print_error(str("ERROR: Duplicate playbook step name " + name))
+            exit(1)
+
+        tool_name = str(raw_step["tool"])
+        platforms = [x[1] for x in tool_list if x[0] == tool_name]
+        if raw_step.get("platform") is not None:
+            platform = str(raw_step["platform"])
+        elif platforms.__len__() == 1:
+            platform = platforms[0]
+        else:
+            platform = config.axiom.platform
+
+        tool_id = resolve_tool_id([tool_name, platform], tools)
+        if tool_id < 0:
+            print_error(str("ERROR: Playbook step " + name + " references unknown tool " + tool_name + " (" +
+                            platform + ")"))
+            exit(1)
+        tool = tools[tool_id]
+
+        if isinstance(raw_step["command"], int):
+            command_type, id_value = tool.resolve_command(raw_step["command"] - 1)
+        else:
+            command_type, id_value = tool.resolve_command_name(str(raw_step["command"]))
+
+        if id_value < 0:
+            print_error(str("ERROR: Playbook step " + name + " references unknown " + tool_name + " command " +
+                            str(raw_step["command"])))
+            exit(1)
+        command = tool.command_list[id_value] if command_type == "command" else tool.action_list[id_value]
+
+        if not check_unattended_execution(tool, command):
+            print_error(str("ERROR: Playbook step " + name + " (" + tool_name + " / " + command.name +
+                            ") cannot be executed"))
+            exit(1)
+
+        needs = raw_step.get("needs") or []
+        inputs = raw_step.get("inputs") or {}
+        if isinstance(needs, str):
+            needs = [needs]
+        if not isinstance(needs, list) or not isinstance(inputs, dict):
+            print_error(str("ERROR: Playbook step " + name + " has invalid needs or inputs"))
+            exit(1)
+        needs = [str(x) for x in needs]
+
+        if isinstance(command, AxiomCommand):
+            input_types = dict((x[0], x[1]) for x in command.input_list)
+            sample = {}
+            for input_name, value in inputs.items():
+                if isinstance(value, dict):
+                    value["output"] = str(value.get("output"))
+                    if input_types.get(input_name) not in ["FILE", "FULLPATH", "STR"]:
+                        print_error(str("ERROR: Playbook step " + name + " input " + str(input_name) +
+                                        " cannot receive an output file (FILE, FULLPATH, or STR inputs only)"))
+                        exit(1)
+                    needs.append(value["output"])
+                    sample[input_name] = path.abspath(value["output"])
+                else:
+                    sample[input_name] = value
+
+            validated = command.resolve_input_values(sample)
+            if isinstance(validated, str):
+                print_error(str("ERROR: Playbook step " + name + " has " + validated))
+                exit(1)
+
+        elif inputs.__len__() > 0:
+            print_error(str("ERROR: Playbook step " + name + " is an action, which has no inputs"))
+            exit(1)
+
+        for dependency in needs:
+            if dependency not in step_names:
+                print_error(str("ERROR: Playbook step " + name + " depends on " + dependency +
+                                ", which is not an earlier step"))
+                exit(1)
+
+        steps.append({"number": step_number, "name": name, "tool": tool, "command": command, "inputs": inputs,
+                      "needs": list(dict.fromkeys(needs))})
+        step_names.add(name)
+
+    return steps
+
+
+def load_ptf_catalog():
+    """ SUMMARY:  indexes every PTF module file once, loading the cached catalog from the binary folder if present
+          INPUT:  none
+         OUTPUT:  a dictionary with PTF module path keys (e.g. "modules/exploitation/metasploit") and AxiomPtfModule
+                  values """
+
+    loadable_catalog_file = str(config.axiom.binary_folder + "/ptf_catalog.axiom")
+    if path.exists(loadable_catalog_file):
+        try:
+            with open(loadable_catalog_file, 'rb') as catalog_dump:
+                catalog = load_binary(catalog_dump)
+
+        except (OSError, PickleError):
+            print_error(str("ERROR: Failed to load PTF catalog binary file " + loadable_catalog_file))
+            exit(1)
+
+        else:
+            if catalog is not None:
+                return catalog
+
+    catalog = {}
+    modules_folder = str(config.axiom.ptf_folder + "/modules")
+
+    for folder, subfolders, filenames in walk(modules_folder):
+        for filename in sorted(filenames):
+            if filename.endswith(".py") and filename != "__init__.py":
+                module_file = str(folder + "/" + filename)
+                module_path = path.relpath(module_file, config.axiom.ptf_folder)[:-3].replace(path.sep, "/")
+                ptf_module = load_ptf_module(module_file, module_path)
+
+                if ptf_module is not None:
+                    catalog[module_path] = ptf_module
+
+    try:
+        with open(loadable_catalog_file, 'wb') as catalog_dump:
+            dump((BINARY_FORMAT, catalog), catalog_dump)
+
+    except (OSError, PickleError):
+        print_error(str("ERROR: Failed to save PTF catalog binary file " + loadable_catalog_file))
+        exit(1)
+
+    return catalog
+
+
+def load_ptf_module(module_file, module_path):
+    """ SUMMARY:  extracts the install location, dependencies, and package requirements from a PTF module file
+          INPUT:  1) PTF module filename (str) and 2) module path relative to the PTF folder (str)
+         OUTPUT:  an AxiomPtfModule object or None if the file is not a valid PTF module """
+
+    values = {}
+
+    try:
+        with open(module_file, 'r', errors="replace") as open_file:
+            for line in open_file:
+                if "=" in line and line[:1].isupper():
+                    key, value = line.split("=", 1)
+                    value = value.strip()
+                    if value.startswith("\"") and value.count("\"") >= 2:
+                        values[key.strip()] = value.split("\"")[1]
+
+    except OSError:
+        print_error(str("ERROR: Failed to read PTF module " + module_file))
+        return None
+
+    if module_path.count("/") < 2 or values.get("INSTALL_LOCATION", "") == "":
+        return None
+
+    dependencies = [x.strip() for x in values.get("TOOL_DEPEND", "").split(",") if x.strip() != ""]
+
+    packages = {}
+    for platform_key in ["ARCHLINUX", "DEBIAN", "FEDORA"]:
+        packages[platform_key.lower()] = [x.strip() for x in values.get(platform_key, "").split(",") if x.strip() != ""]
+
+    return AxiomPtfModule(module_path, values.get("DESCRIPTION", ""), values.get("INSTALL_TYPE", ""),
+                          values["INSTALL_LOCATION"], dependencies, packages)
+
+
 def load_text_and_inputs(text, inputs_pattern, input_types_list, raw_input_list):
     """ SUMMARY:  retrieves executable command/action text (tokens) and the inputs required at execution
           INPUT:  1) command text (str), 2) regex pattern (str), 3) list of types (list), and 4) list of inputs (list)
@@ -709,14 +1720,15 @@ def load_tool_list(inventory):
     if path.exists(loadable_list_file):
         try:
             with open(loadable_list_file, 'rb') as list_dump:
-                loaded_list = load(list_dump)
+                loaded_list = load_binary(list_dump)
 
         except (OSError, PickleError):
             print_error(str("ERROR: Failed to load tool list binary file " + loadable_list_file))
             exit(1)
 
         else:
-            return loaded_list
+            if loaded_list is not None:
+                return loaded_list
 
     master_tool_list = []
 
@@ -728,7 +1740,7 @@ def load_tool_list(inventory):
 
     try:
         with open(loadable_list_file, 'wb') as tool_list:
-            dump(list(master_tool_list), tool_list)
+            dump((BINARY_FORMAT, list(master_tool_list)), tool_list)
 
     except (OSError, PickleError):
         print_error(str("ERROR: Failed to save tool list binary file " + loadable_list_file))
@@ -746,14 +1758,18 @@ def load_tools(inventory, unloaded_tools):
     if path.exists(loadable_tools_file):
         try:
             with open(loadable_tools_file, 'rb') as tools_dump:
-                loaded_tools = load(tools_dump)
+                loaded_tools = load_binary(tools_dump)
 
         except (OSError, PickleError):
             print_error(str("ERROR: Failed to load tools binary file " + loadable_tools_file))
             exit(1)
 
         else:
-            return loaded_tools
+            if loaded_tools is not None:
+                metrics.increment("axiom_loader_cache_total", 1, {"file": "tools", "result": "hit"})
+                return loaded_tools
+
+    metrics.increment("axiom_loader_cache_total", 1, {"file": "tools", "result": "miss"})
 
     tools = []
 
@@ -799,7 +1815,7 @@ def load_tools(inventory, unloaded_tools):
 
     try:
         with open(loadable_tools_file, 'wb') as axiom:
-            dump(tools, axiom)
+            dump((BINARY_FORMAT, tools), axiom)
 
     except (OSError, PickleError):
         print_error(str("ERROR: Failed to save tools binary file " + loadable_tools_file))
@@ -808,6 +1824,103 @@ def load_tools(inventory, unloaded_tools):
     return tools
 
 
+def manage_broker(action, session_id):
+    """ SUMMARY:  handles "broker" mode: lists the session broker's sessions, starts it in the background, runs it in
+                  the foreground ("serve"), terminates one of its sessions, or stops it along with every session
+          INPUT:  1) action (str or None) and 2) session ID (int or None)
+         OUTPUT:  exit value (int) """
+
+    if action == "serve":
+        return AxiomBroker().serve()
+
+    if action == "start":
+        if AxiomBroker.ping():
+            print("[AXIOM] Session broker is already running")
+            return 0
+        if not AxiomBroker.launch():
+            print_error("ERROR: Failed to start session broker")
+            return 1
+        print("[AXIOM] Session broker started")
+        return 0
+
+    if not AxiomBroker.ping():
+        print_error("ERROR: Session broker is not running (see \"./axiom broker start\")")
+        return 1
+
+    try:
+        if action == "stop":
+            dispatch.broker_request({"action": "stop"})
+            print("[AXIOM] Session broker stopped")
+            return 0
+
+        if action == "kill":
+            reply = dispatch.broker_request({"action": "kill", "id": session_id})[0]
+            if "error" in reply:
+                print_error(str("ERROR: " + reply["error"]))
+                return 1
+            print("[AXIOM] Terminated session " + str(session_id))
+            return 0
+
+        sessions = dispatch.broker_request({"action": "list"})[0].get("sessions", [])
+
+    except OSError:
+        print_error("ERROR: Failed to connect to session broker")
+        return 1
+
+    if sessions.__len__() == 0:
+        print("\nNo sessions (set \"broker: true\" in the configuration file and run an interactive command)\n")
+        return 0
+
+    print("\n" + "  ID  " + "PROMPT".ljust(14) + "STATE".ljust(10) + "PID".rjust(8) + "UNREAD".rjust(12) + "  STARTED")
+    for x in sessions:
+        print("  " + str(x["id"]).rjust(2) + "  " + str(x["prompt"]).ljust(14) + str(x["state"]).ljust(10) +
+              str(x["pid"]).rjust(8) + str(x["unread"]).rjust(12) + "  " +
+              strftime("%Y-%m-%d %H:%M:%S", localtime(x["started"])))
+    print()
+
+    return 0
+
+
+def manage_workspace(action, argument):
+    """ SUMMARY:  lists/activates workspaces of bound input values, or binds/unbinds a value in the active workspace
+          INPUT:  1) "workspace", "bind", or "unbind" (str) and 2) workspace name, "KEY=VALUE" binding (KEY is an input
+                  type or input name), or KEY (str), or None to list workspaces and bindings
+         OUTPUT:  exit value (int), 0 if successful """
+
+    if argument is None:
+        workspaces.show()
+        return 0
+
+    if action == "workspace":
+        workspaces.activate(argument)
+        workspaces.show()
+        return 0
+
+    if action == "unbind":
+        if not workspaces.unbind(argument):
+            print_error(str("ERROR: " + argument + " is not bound in workspace " + workspaces.active))
+            return 1
+        print("[AXIOM] Unbound " + argument + " in workspace " + workspaces.active)
+        return 0
+
+    if "=" not in argument:
+        print_error("ERROR: Bindings must be supplied as KEY=VALUE (KEY is an input type or input name)")
+        return 1
+
+    key, value = argument.split("=", 1)
+    key = key.strip()
+
+    if key in input_registry.registry:
+        value = input_registry.normalize(key, value)
+        if value is None:
+            print_error(str("ERROR: Invalid " + key + " value"))
+            return 1
+
+    workspaces.bind(key, value)
+    print("[AXIOM] Bound " + key + " = " + value + " in workspace " + workspaces.active)
+    return 0
+
+
 def merge(tool, tool_id, tools, inputs_pattern, input_types_list):
     """ SUMMARY:  merges new commands/actions into existing AxiomTool objects
           INPUT:  1) list of two dictionaries 2) tool ID value (int) 3) list of AxiomTool objects
@@ -1161,6 +2274,31 @@ def new_print_finalized_command_text(name, prompt_selection, execution_type, tex
     print()
 
 
+def print_artifacts(term):
+    """ SUMMARY:  displays recorded output files, newest first, optionally filtered by a search term
+          INPUT:  text (str) matched against filenames, tool names, and command names, or None
+         OUTPUT:  exit value (int), 0 if any recorded output files were found """
+
+    artifacts = result_store.search_artifacts(term, 50)
+
+    if artifacts.__len__() == 0:
+        print_error("ERROR: No recorded output files found")
+        return 1
+
+    print()
+    for artifact_id, recorded_time, tool, command, output_type, filename, size, digest, run_id in artifacts:
+        if digest is None:
+            status = "  [relative to an interactive session]"
+        else:
+            status = "" if path.exists(filename) else "  [missing]"
+        print("  " + strftime("%Y-%m-%d %H:%M:%S", localtime(recorded_time)) + "  " + filename + status +
+              "\n" + "      " + tool + " / " + command + " (run " + str(run_id) + ", " + output_type + ")" +
+              ("" if digest is None else str("  " + str(size) + " bytes  sha256:" + digest[:16])))
+
+    print()
+    return 0
+
+
 def print_banner(banner_file):
     """ SUMMARY:  displays ASCII art from file and other introductory info
           INPUT:  filename (str) of text file on filesystem
@@ -1186,6 +2324,136 @@ def print_banner(banner_file):
         print()
 
 
+def print_batch_result(result, completed):
+    """ SUMMARY:  streams one batch item's result to STDOUT as a single JSON line
+          INPUT:  1) dictionary from run_batch_item() or describing an invalid input set and 2) number of items
+                  completed so far, including this one (int)
+         OUTPUT:  1 if the item failed, otherwise 0 """
+
+    result["completed"] = completed
+    print(dumps(result), flush=True)
+
+    return 0 if result.get("exit_code") == 0 else 1
+
+
+def print_install_summary(results, total_time, log_folder):
+    """ SUMMARY:  displays and saves the outcome of every installation attempted or skipped in "install" mode
+          INPUT:  1) list of four-item tuples from install_ptf_module(), with success None and the reason instead of a
+                  log file for skipped tools, 2) total seconds (float), 3) log folder (str)
+         OUTPUT:  exit value (int), 0 if every installation succeeded """
+
+    lines = ["", "Installation Summary", ""]
+    failures = 0
+    skipped = 0
+
+    for tool, success, duration, log_filename in sorted(results, key=lambda x: x[0].name.casefold()):
+        if success is None:
+            skipped += 1
+        elif not success:
+            failures += 1
+        lines.append("  " + ("SKIP" if success is None else "OK  " if success else "FAIL") + "\t" +
+                     str(round(duration, 1)).rjust(7) + "s\t" + tool.name + "\t" + log_filename)
+
+    lines.append("")
+    lines.append(str(results.__len__() - failures - skipped) + " installed, " + str(failures) + " failed, " +
+                 str(skipped) + " skipped in " + str(round(total_time, 1)) + " seconds")
+    lines.append("")
+
+    print("\n".join(lines))
+
+    summary_filename = str(log_folder + "/summary.txt")
+    try:
+        with open(summary_filename, 'w') as summary_file:
+            summary_file.write("\n".join(lines))
+
+    except OSError:
+        print_error(str("ERROR: Failed to save installation summary " + summary_filename))
+
+    return 0 if failures == 0 and skipped == 0 else 1
+
+
+def print_metrics(export_format):
+    """ SUMMARY:  displays cumulative counters and histograms, or exports them for other monitoring tools
+          INPUT:  export format (str), "json", "prometheus", or None for a human-readable view
+         OUTPUT:  exit value (int) """
+
+    combined = load_metrics()
+
+    if export_format == "json":
+        print(combined.export_json())
+        return 0
+
+    if export_format == "prometheus":
+        print(combined.export_prometheus(), end='')
+        return 0
+
+    print("\n" + "Counters" + "\n")
+    for key in sorted(combined.counters):
+        print("  " + combined.describe_series(key[0], key[1]).ljust(70) + " " + str(combined.counters[key]))
+
+    print("\n" + "Histograms (seconds)" + "\n")
+    for key in sorted(combined.histograms):
+        histogram = combined.histograms[key]
+        median = combined.get_quantile(key, 0.5)
+        tail = combined.get_quantile(key, 0.95)
+        print("  " + combined.describe_series(key[0], key[1]).ljust(70) + " " +
+              str(histogram["count"]) + " observed, " +
+              str(round(histogram["sum"] / histogram["count"], 3)) + " avg, " +
+              "p50 <= " + (str(median) if median is not None else "+Inf") + ", " +
+              "p95 <= " + (str(tail) if tail is not None else "+Inf"))
+
+    print()
+    return 0
+
+
+def print_runs(tool_name, tool_list):
+    """ SUMMARY:  displays recent executions and per-command statistics from the result store
+          INPUT:  1) tool name (str) or None for every tool and 2) de-duplicated list of tuples (name, platform)
+         OUTPUT:  exit value (int), 0 if any recorded executions were found """
+
+    if tool_name is not None:
+        for name, platform in tool_list:
+            if name.casefold() == tool_name.casefold():
+                tool_name = name
+                break
+
+    recent_runs = result_store.recent(tool_name, 20)
+
+    if recent_runs.__len__() == 0:
+        print_error("ERROR: No recorded executions found")
+        return 1
+
+    print("\n" + "Recent executions" + "\n")
+    for run_id, start_time, tool, command, exit_code, termination, duration, cpu_time, max_rss, output_bytes, \
+            text in recent_runs:
+        if termination is not None:
+            status = termination
+        elif exit_code is not None:
+            status = str("exit " + str(exit_code))
+        else:
+            status = "prompt returned"
+        print("  " + str(run_id).rjust(5) + "  " + strftime("%Y-%m-%d %H:%M:%S", localtime(start_time)) + "  " +
+              tool + " / " + command + "  [" + status + "]  " +
+              (str(round(duration, 2)) + "s" if duration is not None else "-") + "  " +
+              (str(round(cpu_time, 2)) + "s CPU" if cpu_time is not None else "- CPU") + "  " +
+              (str(max_rss) + " KB RSS" if max_rss is not None else "- RSS") + "  " +
+              (str(output_bytes) + " bytes" if output_bytes is not None else "- bytes"))
+
+    print("\n" + "Totals per command" + "\n")
+    for tool, command, count, failures, average_duration, max_duration, average_cpu, max_rss, total_bytes in \
+            result_store.aggregate(tool_name):
+        print("  " + tool + " / " + command + "  " +
+              str(count) + " runs, " + str(failures) + " failed, " +
+              (str(round(average_duration, 2)) + "s avg, " if average_duration is not None else "") +
+              (str(round(max_duration, 2)) + "s max, " if max_duration is not None else "") +
+              (str(round(average_cpu, 2)) + "s avg CPU, " if average_cpu is not None else "") +
+              (str(max_rss) + " KB max RSS, " if max_rss is not None else "") +
+              str(total_bytes if total_bytes is not None else 0) + " bytes")
+
+    print()
+    return 0
+
+
 def print_stats(inventory, tool_list, tools):
     """ SUMMARY:  displays counts of loaded tools, commands/actions, and toolkits
           INPUT:  1) list of AxiomToolkit objects objects 2) de-deplicated list of tuples 3) list of AxiomTool objects
@@ -1235,6 +2503,295 @@ def resolve_tool_id(potential_tool, tools):
     return -1
 
 
+def run_batch(tool, command, filename):
+    """ SUMMARY:  renders and executes one command per input set read from a JSONL/CSV file or STDIN
+          INPUT:  1) an AxiomTool object, 2) an AxiomCommand object, and 3) input filename (str) or None for STDIN
+         OUTPUT:  exit value (int), 0 only if every item executed and exited with code 0 """
+
+    if not check_unattended_execution(tool, command):
+        return 1
+
+    return execute_input_sets(tool, command, get_batch_input_sets(command, filename), config.axiom.batch_workers,
+                              None)
+
+
+def run_batch_item(tool, command, item_number, values, log_folder, active, active_lock):
+    """ SUMMARY:  executes one rendered command with its output saved to a log file, called by worker threads
+          INPUT:  1) AxiomTool object, 2) AxiomCommand object, 3) item number (int), 4) list of input values (str),
+                  5) log folder (str), 6) set of running AxiomExecution objects, and 7) Lock guarding the set
+         OUTPUT:  dictionary describing the result """
+
+    text = command.render(values)
+    details = command.describe_run(tool, values)
+    log_filename = str(log_folder + "/item-" + str(item_number) + ".log")
+    result = {"item": item_number, "inputs": dict((x["name"], x["value"]) for x in details["inputs"]),
+              "output": path.abspath(log_filename)}
+
+    try:
+        with open(log_filename, 'wb') as log_file:
+            cache_key = None
+            if command.cache_ttl is not None:
+                cache_key = execution_cache.get_key(details, text)
+                if execution_cache.replay(cache_key, log_file):
+                    result["exit_code"] = 0
+                    result["cached"] = True
+                    result["artifacts"] = [x[1] for x in details["artifacts"] if path.exists(x[1])]
+                    return result
+
+            execution = command.create_execution(text, log_file)
+            if cache_key is not None:
+                execution_cache.start_capture(cache_key, execution)
+            with active_lock:
+                active.add(execution)
+            try:
+                if execution.start():
+                    execution.wait()
+                    result_store.record(details, text, execution.get_measurements())
+            finally:
+                with active_lock:
+                    active.discard(execution)
+                if cache_key is not None:
+                    execution_cache.store(cache_key, command.cache_ttl, details, execution)
+
+    except OSError:
+        result["error"] = str("failed to write " + log_filename)
+        return result
+
+    if execution.start_time is None:
+        result["error"] = "failed to execute"
+        return result
+
+    result["exit_code"] = execution.return_code
+    result["duration"] = round(execution.duration, 3)
+    if execution.describe_termination() is not None:
+        result["termination"] = execution.describe_termination()
+    result["artifacts"] = [x[1] for x in details["artifacts"] if path.exists(x[1])]
+
+    return result
+
+
+def run_fanout(tool, command):
+    """ SUMMARY:  prompts for command inputs, then executes the command once per element of its first range input
+                  (IPV4CIDR, IPV6CIDR, IPV4RNGE, IPV6RNGE, or INTRANGE), expanding the range lazily
+          INPUT:  1) an AxiomTool object and 2) an AxiomCommand object
+         OUTPUT:  exit value (int), 0 only if every target's execution exited with code 0 """
+
+    target_index = -1
+    input_count = 0
+    while input_count < command.input_list.__len__():
+        if command.input_list[input_count][1] in ["IPV4CIDR", "IPV6CIDR", "IPV4RNGE", "IPV6RNGE", "INTRANGE"]:
+            target_index = input_count
+            break
+        input_count += 1
+
+    if target_index < 0:
+        print_error("ERROR: Fan-out requires a command with an IPV4CIDR, IPV6CIDR, IPV4RNGE, IPV6RNGE, or INTRANGE "
+                    "input")
+        return 1
+
+    if not check_unattended_execution(tool, command):
+        return 1
+
+    values = command.collect_inputs()
+    targets = expand_range_input(command.input_list[target_index][1], values[target_index])
+
+    try:
+        first_target = next(targets)
+
+    except StopIteration:
+        print_error(str("ERROR: " + command.input_list[target_index][0] + " contains no targets"))
+        return 1
+
+    except ValueError as error:
+        print_error(str("ERROR: Invalid " + command.input_list[target_index][0] + " (" + str(error) + ")"))
+        return 1
+
+    print(str("Fanning out " + command.name + " over " + command.input_list[target_index][0] + " " +
+              values[target_index] + " (" + str(config.axiom.fanout_workers) + " concurrent" +
+              ("" if config.axiom.fanout_rate is None else ", " + str(config.axiom.fanout_rate) + " per second") +
+              ")"), file=stderr)
+
+    input_sets = get_fanout_input_sets(values, target_index, chain([first_target], targets))
+
+    return execute_input_sets(tool, command, input_sets, config.axiom.fanout_workers, config.axiom.fanout_rate)
+
+
+def run_playbook(filename, resume, tool_list, tools):
+    """ SUMMARY:  executes a playbook's steps on a bounded worker pool, starting each step once every step it depends
+                  on has succeeded, streaming one JSON result line per finished step to STDOUT and saving progress so a
+                  failed run can be resumed without re-running the steps that already succeeded
+          INPUT:  1) playbook filename (str), 2) True to skip steps completed by a previous run, 3) de-duplicated
+                  list of tuples (name, platform), and 4) list of AxiomTool objects
+         OUTPUT:  exit value (int), 0 only if every step succeeded """
+
+    steps = load_playbook(filename, tool_list, tools)
+
+    state_folder = str(config.axiom.history_folder + "/playbooks")
+    state_filename = str(state_folder + "/" + sha256(path.abspath(filename).encode()).hexdigest()[:16] + ".json")
+    create_missing_folder(state_folder)
+
+    previous = {}
+    if resume:
+        try:
+            with open(state_filename, 'r') as state_file:
+                previous = loads(state_file.read())["steps"]
+        except (OSError, KeyError, TypeError, ValueError):
+            print(str("No saved progress found for " + filename + ", executing every step"), file=stderr)
+
+    log_folder = str(config.axiom.binary_folder + "/playbooks/" + strftime("%Y%m%d-%H%M%S", localtime()) + "-" +
+                     str(getpid()))
+    create_missing_folder(str(config.axiom.binary_folder + "/playbooks"))
+    create_missing_folder(log_folder)
+
+    state = {"playbook": path.abspath(filename), "steps": dict(previous)}
+    results = {}
+    texts = {}
+    pending = steps[:]
+    running = {}
+    active = set()
+    active_lock = Lock()
+    completed = 0
+    failures = 0
+    start_time = monotonic()
+
+    with ThreadPoolExecutor(max_workers=config.axiom.playbook_workers) as executor:
+        try:
+            while pending.__len__() > 0 or running.__len__() > 0:
+                finished = []
+
+                for step in pending[:]:
+                    failed = [x for x in step["needs"] if x in results and results[x].get("exit_code") != 0]
+                    if failed.__len__() == 0 and [x for x in step["needs"] if x not in results].__len__() > 0:
+                        continue
+
+                    pending.remove(step)
+
+                    if failed.__len__() > 0:
+                        finished.append((step, {"item": step["number"], "step": step["name"],
+                                                "error": str("dependency " + failed[0] + " did not succeed")}))
+                        continue
+
+                    values = get_playbook_step_values(step, results)
+                    if isinstance(values, str):
+                        finished.append((step, {"item": step["number"], "step": step["name"], "error": values}))
+                        continue
+
+                    texts[step["name"]] = step["command"].render(values)
+                    saved = previous.get(step["name"])
+
+                    if saved is not None and saved.get("text") == texts[step["name"]] and \
+                            saved.get("exit_code") == 0 and all(path.exists(x) for x in saved.get("artifacts", [])):
+                        finished.append((step, {"item": step["number"], "step": step["name"], "resumed": True,
+                                                "exit_code": 0, "output": saved.get("output"),
+                                                "artifacts": saved.get("artifacts", [])}))
+                    else:
+                        running[executor.submit(run_batch_item, step["tool"], step["command"], step["number"], values,
+                                                log_folder, active, active_lock)] = step
+
+                if finished.__len__() == 0 and running.__len__() > 0:
+                    for future in wait(running, return_when=FIRST_COMPLETED)[0]:
+                        step = running.pop(future)
+                        result = future.result()
+                        result["step"] = step["name"]
+                        finished.append((step, result))
+
+                for step, result in finished:
+                    results[step["name"]] = result
+                    completed += 1
+                    failures += print_batch_result(result, completed)
+
+                    if result.get("exit_code") == 0:
+                        state["steps"][step["name"]] = {"text": texts[step["name"]], "exit_code": 0,
+                                                        "output": result.get("output"),
+                                                        "artifacts": result.get("artifacts", [])}
+                    else:
+                        state["steps"].pop(step["name"], None)
+
+                if finished.__len__() > 0:
+                    try:
+                        write_atomically(state_filename, dumps(state, indent=2))
+                    except OSError:
+                        print_error(str("ERROR: Failed to save playbook progress to " + state_filename))
+
+        except KeyboardInterrupt:
+            for future in running:
+                future.cancel()
+            with active_lock:
+                for execution in active:
+                    execution.terminate("was interrupted")
+            raise
+
+    print(str(str(completed - failures) + " of " + str(steps.__len__()) + " steps succeeded in " +
+              str(round(monotonic() - start_time, 1)) + " seconds (output saved in " + log_folder + ")"), file=stderr)
+
+    if failures > 0:
+        print(str("Resume with: ./axiom play " + filename + " --resume"), file=stderr)
+
+    return 0 if failures == 0 else 1
+
+
+def session_control(text):
+    """ SUMMARY:  handles the interactive session commands available at the interactive prompts: "sessions" lists every
+                  interactive subprocess, "backlog [ID]" displays a session's unread output (including output
+                  spilled to disk), ID defaults to the most recent session, "attach ID" reattaches a detached
+                  session owned by the session broker, "use ID" sends tasks for that session's prompt type to it, and
+                  "use all" broadcasts each task to every session with the task's starting prompt type
+          INPUT:  text (str) entered at a prompt
+         OUTPUT:  True if the text was a session command, False otherwise """
+
+    words = text.split()
+
+    if words.__len__() == 0 or words[0] not in ["sessions", "backlog", "attach", "use"]:
+        return False
+
+    if words[0] == "sessions":
+        dispatch.show()
+        return True
+
+    if words[0] == "attach":
+        if words.__len__() != 2:
+            print_error("\nERROR: Invalid session specified (see \"sessions\")")
+        else:
+            session = dispatch.attach(words[1])
+            if session is not None:
+                print("\n[AXIOM] Attached session " + str(session.id) + " (" + session.current_prompt + ")")
+                if not config.axiom.live_output and session.count_unread() > 0:
+                    print("[AXIOM] Enter \"backlog " + str(session.id) + "\" to display its unread output")
+        return True
+
+    if words[0] == "use":
+        if words.__len__() == 2 and words[1] == "all":
+            dispatch.broadcasting = True
+            print("\n[AXIOM] Broadcasting each task to every open session with its starting prompt type")
+            return True
+        session = dispatch.find(words[1]) if words.__len__() == 2 else None
+        if session is None or session.closed:
+            print_error("\nERROR: Invalid session specified (see \"sessions\")")
+        else:
+            dispatch.select(session)
+            print("\n[AXIOM] Sending " + session.current_prompt + " tasks to session " + str(session.id))
+        return True
+
+    if words.__len__() > 1:
+        session = dispatch.find(words[1])
+    elif dispatch.subprocesses.__len__() > 0:
+        session = dispatch.subprocesses[-1]
+    else:
+        session = None
+
+    if session is None:
+        print_error("\nERROR: Invalid session specified (see \"sessions\")")
+        return True
+
+    print()
+    if dispatch.print_backlog(session) == 0:
+        print("[AXIOM] No unread output from session " + str(session.id))
+    else:
+        print()
+
+    return True
+
+
 def set_user_expectations(settings):
     """ SUMMARY:  prints a message so the user expects to wait while the YAML is deserialized
           INPUT:  three-item settings dictionary
@@ -1246,7 +2803,7 @@ def set_user_expectations(settings):
             settings.get("mode") in ["init", "reload"]:
         return
     else:
-        print("Initializing...")
+        print("Initializing...", file=stderr)
 
 
 def setup_folders(settings):
@@ -1268,13 +2825,21 @@ def setup_folders(settings):
 def setup_ptf():
     """ SUMMARY:  deletes existing PTF folder and downloads/installs the latest version from GitHub master branch
           INPUT:  none
-         OUTPUT:  no return values, modifies the filesystem """
+         OUTPUT:  no return values, modifies the filesystem and discards the cached PTF catalog """
 
     download_and_extract_zip("https://github.com/trustedsec/ptf/archive/master.zip",
                              "ptf-master",
                              config.axiom.ptf_folder,
                              "The PenTesters Framework (PTF)")
 
+    loadable_catalog_file = str(config.axiom.binary_folder + "/ptf_catalog.axiom")
+    if path.exists(loadable_catalog_file):
+        try:
+            remove(loadable_catalog_file)
+        except OSError:
+            print_error(str("ERROR: Cannot delete PTF catalog binary file " + loadable_catalog_file))
+            exit(1)
+
 
 def setup_toolkits():
     """ SUMMARY:  deletes existing inventory folder, downloads all listed toolkits, and reloads the binary data
@@ -1292,12 +2857,13 @@ def setup_toolkits():
     reload()
 
 
-def tool_selection_prompt(tool_list, tool_names, tools):
-    """ SUMMARY:  prompts user to select a tool, provides a fuzzy word completer interface
-          INPUT:  1) list of two-item tuples (name, platform), 2) set of tool names, and 3) list of AxiomTool objects
+def tool_selection_prompt(tool_list, tool_names, tools, tool_status):
+    """ SUMMARY:  prompts user to select a tool, provides a fuzzy word completer interface showing tool status
+          INPUT:  1) list of two-item tuples (name, platform), 2) set of tool names, 3) list of AxiomTool objects,
+                  and 4) dictionary of tool status text
          OUTPUT:  exit value (int) """
 
-    tool_names = FuzzyCompleter(WordCompleter(tool_names))
+    tool_names = FuzzyCompleter(WordCompleter(tool_names, meta_dict=tool_status))
 
     completer_style = ptkStyle.from_dict({
         "completion-menu": "bg:#111111",
@@ -1311,12 +2877,19 @@ def tool_selection_prompt(tool_list, tool_names, tools):
         "completion-menu.completion.current fuzzymatch.inside": "nobold fg:#AAAAAA",
         "completion-menu.completion.current fuzzymatch.inside.character": "nobold nounderline fg:#AAAAAA"})
 
+    dispatch.warm_up()
+
     while True:
-        text = prompt('[AXIOM] Enter tool: ', completer=tool_names, complete_while_typing=True, style=completer_style)
+        jobs.notify()
+        dispatch.notify()
+        text = live_output_prompt('[AXIOM] Enter tool: ', completer=tool_names, complete_while_typing=True,
+                                  style=completer_style)
 
         if text == "exit" or text == "quit":
+            if not confirm_exit():
+                continue
             return 0
-        if text == "":
+        if text == "" or job_control(text) or session_control(text) or workspace_control(text):
             continue
 
         tool_id = disambiguate_tool_name(text, tool_list, tools)
@@ -1329,12 +2902,54 @@ def tool_selection_prompt(tool_list, tool_names, tools):
     return 1
 
 
-def validate_privileges(mode):
+def validate_privileges(mode, argument=None):
     """ SUMMARY:  confirms effective root privilege level if writing to the filesystem or spawning a subprocess
-          INPUT:  program mode type (str)
+          INPUT:  1) program mode type (str) and 2) optional mode argument (str), listing workspaces (no argument) is
+                  read-only while activating a workspace, binding, and unbinding write workspaces.json in the history
+                  folder
          OUTPUT:  none """
 
-    if mode not in ["show", "new"]:
+    read_only = mode in ["show", "new", "artifacts", "runs", "stats"] or (mode == "workspace" and argument is None)
+
+    if not read_only:
         if geteuid() != 0:
             print_error("ERROR: AXIOM requires root privileges")
             exit(1)
+
+
+def validate_ptf_modules(catalog, tools):
+    """ SUMMARY:  confirms every PTF module referenced by the inventory exists in the PTF module catalog
+          INPUT:  1) dictionary of AxiomPtfModule objects and 2) list of AxiomTool objects
+         OUTPUT:  number of invalid references (int), prints a single summary line if there are any """
+
+    invalid_tools = []
+
+    for tool in tools:
+        if tool.ptf_module not in ["", None] and tool.ptf_module not in catalog:
+            invalid_tools.append(str(tool.name + " (" + tool.platform + ")"))
+
+    if invalid_tools.__len__() > 0:
+        if catalog.__len__() == 0:
+            print_error(str("ERROR: PTF modules folder " + config.axiom.ptf_folder + "/modules not found, " +
+                            str(invalid_tools.__len__()) + " tools reference PTF modules"))
+        else:
+            print_error(str("ERROR: " + str(invalid_tools.__len__()) + " tools reference unknown PTF modules: " +
+                            ", ".join(invalid_tools)))
+
+    return invalid_tools.__len__()
+
+
+def workspace_control(text):
+    """ SUMMARY:  handles the workspace commands available at the interactive prompts: "workspace [NAME]", "bind
+                  [KEY=VALUE]", and "unbind KEY"
+          INPUT:  text (str) entered at a prompt
+         OUTPUT:  True if the text was a workspace command, False otherwise """
+
+    words = text.strip().split(None, 1)
+
+    if words.__len__() == 0 or words[0] not in ["workspace", "bind", "unbind"]:
+        return False
+
+    manage_workspace(words[0], words[1] if words.__len__() > 1 else None)
+
+    return True
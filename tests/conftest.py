@@ -0,0 +1,38 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" shared fixtures for the test suite, run from the top-level folder: python3 -m pytest """
+
+from os import chdir, makedirs, path
+from sys import path as import_path
+
+TOP_LEVEL_FOLDER = path.dirname(path.dirname(path.abspath(__file__)))
+
+chdir(TOP_LEVEL_FOLDER)
+import_path.insert(0, TOP_LEVEL_FOLDER)
+
+import lib.config as config
+import pytest
+
+
+@pytest.fixture
+def folders(tmp_path, monkeypatch):
+    """ points the binary and history folders at an empty temporary folder """
+
+    monkeypatch.setattr(config.axiom, "binary_folder", str(tmp_path / "bin"))
+    monkeypatch.setattr(config.axiom, "history_folder", str(tmp_path / "history"))
+    makedirs(config.axiom.binary_folder)
+    makedirs(config.axiom.history_folder)
+
+    return tmp_path
@@ -0,0 +1,103 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.functions as functions
+
+from json import loads
+from threading import Event
+from time import monotonic, sleep
+
+import pytest
+
+
+class FakeExecution:
+    """ stands in for a running AxiomExecution until it is terminated """
+
+    def __init__(self):
+        self.reason = None
+        self.stopped = Event()
+
+    def terminate(self, reason):
+        self.reason = reason
+        self.stopped.set()
+
+
+def test_execute_input_sets_streams_results_and_reports_failures(folders, monkeypatch, capsys):
+    def run_batch_item(tool, command, item_number, values, log_folder, active, active_lock):
+        return {"item": item_number, "exit_code": 0 if values == ["ok"] else 1}
+
+    monkeypatch.setattr(functions, "run_batch_item", run_batch_item)
+    input_sets = iter([(1, ["ok"]), (2, "missing input target"), (3, ["fail"]), (4, ["ok"])])
+
+    assert functions.execute_input_sets(None, None, input_sets, 2, None) == 1
+
+    results = dict((x["item"], x) for x in map(loads, capsys.readouterr().out.splitlines()))
+    assert sorted(results.keys()) == [1, 2, 3, 4]
+    assert results[2]["error"] == "missing input target"
+    assert [results[x].get("exit_code") for x in [1, 3, 4]] == [0, 1, 0]
+
+
+def test_execute_input_sets_prints_results_while_waiting_on_the_rate_limit(folders, monkeypatch):
+    printed = {}
+
+    def run_batch_item(tool, command, item_number, values, log_folder, active, active_lock):
+        sleep(0.05)
+        return {"item": item_number, "exit_code": 0}
+
+    def print_batch_result(result, completed):
+        printed[result["item"]] = monotonic()
+        return 0
+
+    monkeypatch.setattr(functions, "run_batch_item", run_batch_item)
+    monkeypatch.setattr(functions, "print_batch_result", print_batch_result)
+    start_time = monotonic()
+
+    assert functions.execute_input_sets(None, None, iter([(1, ["a"]), (2, ["b"]), (3, ["c"])]), 4, 2) == 0
+
+    assert sorted(printed.keys()) == [1, 2, 3]
+    assert printed[1] - start_time < 0.4
+    assert printed[2] - start_time < 0.9
+
+
+def test_execute_input_sets_interruption_terminates_running_items(folders, monkeypatch):
+    executions = []
+    started = []
+
+    def run_batch_item(tool, command, item_number, values, log_folder, active, active_lock):
+        started.append(item_number)
+        execution = FakeExecution()
+        with active_lock:
+            active.add(execution)
+        executions.append(execution)
+        execution.stopped.wait(10)
+        with active_lock:
+            active.discard(execution)
+        return {"item": item_number, "exit_code": None}
+
+    def input_sets():
+        yield 1, ["a"]
+        yield 2, ["b"]
+        while executions.__len__() == 0:
+            sleep(0.01)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(functions, "run_batch_item", run_batch_item)
+    start_time = monotonic()
+
+    with pytest.raises(KeyboardInterrupt):
+        functions.execute_input_sets(None, None, input_sets(), 1, None)
+
+    assert monotonic() - start_time < 5
+    assert started == [1]
+    assert executions[0].reason == "was interrupted"
@@ -0,0 +1,125 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.classes as classes
+import lib.config as config
+
+from lib.classes import AxiomBroker
+
+from base64 import b64decode
+from os import close, pipe, write
+
+
+class FakeProcess:
+    """ stands in for a broker-owned pseudoterminal subprocess, reading from a pipe instead """
+
+    def __init__(self, child_fd):
+        self.child_fd = child_fd
+        self.closed = False
+        self.pid = 4242
+
+    def close(self, force=False):
+        self.closed = True
+
+    def isalive(self):
+        return not self.closed
+
+
+def spawn_broker(monkeypatch):
+    """ returns a broker whose spawned sessions read from pipes, and the write end of each pipe """
+
+    writers = []
+
+    def spawn(command, timeout=None):
+        read_fd, write_fd = pipe()
+        writers.append(write_fd)
+        return FakeProcess(read_fd)
+
+    monkeypatch.setattr(classes.pty_spawn, "spawn", spawn)
+
+    return AxiomBroker(), writers
+
+
+def test_handle_request_spawns_lists_and_updates_sessions(monkeypatch):
+    broker, writers = spawn_broker(monkeypatch)
+
+    reply, fds = broker.handle_request("client", {"action": "spawn", "prompt": "bash"})
+    assert (reply["id"], reply["prompt"], reply["state"], reply["unread"]) == (1, "bash", "attached", 0)
+    assert fds == [broker.sessions[1]["process"].child_fd]
+
+    assert broker.handle_request("client", {"action": "spawn", "prompt": "bash"})[0]["id"] == 2
+    assert broker.handle_request("client", {"action": "update", "id": 2, "prompt": "mimikatz"}) == ({}, [])
+    assert [x["prompt"] for x in broker.handle_request("other", {"action": "list"})[0]["sessions"]] == \
+        ["bash", "mimikatz"]
+
+    for x in writers:
+        close(x)
+
+
+def test_handle_request_hands_detached_sessions_to_one_client(monkeypatch):
+    broker, writers = spawn_broker(monkeypatch)
+    broker.handle_request("first", {"action": "spawn", "prompt": "bash"})
+
+    assert broker.handle_request("second", {"action": "attach", "id": 1}) == \
+        ({"error": "Session is attached to another AXIOM Framework instance"}, [])
+    broker.handle_request("second", {"action": "detach", "id": 1})
+    assert broker.handle_request("first", {"action": "status", "id": 1})[0]["state"] == "attached"
+
+    broker.handle_request("first", {"action": "detach", "id": 1})
+    write(writers[0], b"output while detached\n")
+    broker.drain(broker.sessions[1])
+    assert broker.handle_request("first", {"action": "status", "id": 1})[0]["state"] == "detached"
+
+    reply, fds = broker.handle_request("second", {"action": "attach", "id": 1})
+    assert b64decode(reply["backlog"]) == b"output while detached\n"
+    assert fds == [broker.sessions[1]["process"].child_fd]
+    assert broker.sessions[1]["client"] == "second"
+
+    close(writers[0])
+
+
+def test_handle_request_kills_sessions_and_rejects_invalid_requests(monkeypatch):
+    broker, writers = spawn_broker(monkeypatch)
+    broker.handle_request("client", {"action": "spawn", "prompt": "bash"})
+    process = broker.sessions[1]["process"]
+
+    assert broker.handle_request("client", {"action": "kill", "id": 1}) == ({}, [])
+    assert process.closed
+    for action in ["attach", "detach", "kill", "status", "update"]:
+        assert broker.handle_request("client", {"action": action, "id": 1}) == \
+            ({"error": "Invalid session specified"}, [])
+    assert broker.handle_request("client", {"action": "restart"}) == ({"error": "Invalid request"}, [])
+
+    assert broker.running
+    assert broker.handle_request("client", {"action": "stop"}) == ({}, [])
+    assert not broker.running
+
+    close(writers[0])
+
+
+def test_drain_keeps_the_newest_output_and_detects_eof(monkeypatch):
+    monkeypatch.setattr(config.axiom, "session_buffer", 8)
+    broker, writers = spawn_broker(monkeypatch)
+    broker.handle_request("client", {"action": "spawn", "prompt": "bash"})
+    session = broker.sessions[1]
+
+    write(writers[0], b"0123456789abcdef")
+    broker.drain(session)
+    assert bytes(session["backlog"]) == b"89abcdef"
+    assert not session["closed"]
+
+    close(writers[0])
+    broker.drain(session)
+    assert session["closed"]
+    assert broker.describe(session)["state"] == "exited"
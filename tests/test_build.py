@@ -0,0 +1,101 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.functions as functions
+
+from io import StringIO
+from lib.classes import AxiomCommand
+
+import pytest
+
+
+def make_command():
+    """ returns a command with two menu inputs and one validated input, like an inventory "menu" command """
+
+    return AxiomCommand("menu", "other", "NX", ["mode=", " n=", " t=", ""], None, "note", {}, None,
+                        [("Mode", "STRMENU", ["fast", "slow"]), ("Level", "INTMENU", [3, 2, 1]), ("Range", "IPV4CIDR")])
+
+
+def test_get_build_options_parses_inputs_and_file():
+    assert functions.get_build_options([]) == (None, None)
+    assert functions.get_build_options(["-i", "Mode=fast", "--input", "Range=a=b"]) == \
+        ({"Mode": "fast", "Range": "a=b"}, None)
+    assert functions.get_build_options(["--file", "-"]) == (None, "-")
+
+
+@pytest.mark.parametrize("arguments", [["--input", "Mode"], ["-f"], ["-f", "a", "-f", "b"], ["-i", "A=1", "-f", "a"],
+                                       ["--verbose", "x"]])
+def test_get_build_options_rejects_invalid_arguments(arguments, monkeypatch):
+    monkeypatch.setattr(functions, "axiom_help", lambda: None)
+
+    with pytest.raises(SystemExit):
+        functions.get_build_options(arguments)
+
+
+def test_resolve_option_prefers_value_over_index():
+    assert AxiomCommand.resolve_option([3, 2, 1], "1") == "1"
+    assert AxiomCommand.resolve_option(["fast", "slow"], "2") == "slow"
+    assert AxiomCommand.resolve_option(["fast", "slow"], "02") == "slow"
+    assert AxiomCommand.resolve_option(["fast", "slow"], "3") is None
+    assert AxiomCommand.resolve_option(["fast", "slow"], "medium") is None
+
+
+def test_resolve_input_values_matches_with_and_without_resolvers():
+    command = make_command()
+    resolvers = command.get_input_resolvers()
+    items = [{"Mode": "2", "Level": 1, "Range": " 10.0.0.0/8 "},
+             {"Mode": "fast", "Level": "02", "Range": "10.0.0.0/8"},
+             {"Mode": "fast", "Level": "4", "Range": "10.0.0.0/8"},
+             {"Mode": "fast", "Level": "1", "Range": "10.0.0.0/33"},
+             {"Mode": "fast", "Level": "1"}]
+
+    for item in items:
+        assert command.resolve_input_values(item, resolvers) == command.resolve_input_values(item)
+
+    assert command.resolve_input_values(items[0]) == ["slow", "1", "10.0.0.0/8"]
+    assert command.resolve_input_values(items[1]) == ["fast", "2", "10.0.0.0/8"]
+    assert command.resolve_input_values(items[2]) == "invalid INTMENU value for Level: 4"
+    assert command.resolve_input_values(items[3]) == "invalid IPV4CIDR value for Range: 10.0.0.0/33"
+    assert command.resolve_input_values(items[4]) == "missing input Range"
+
+
+def test_build_commands_renders_input_option_values(monkeypatch):
+    monkeypatch.setattr(functions, "stdout", StringIO())
+
+    assert functions.build_commands(make_command(), {"Mode": "slow", "Level": "3", "Range": "10.0.0.0/8"}, None) == 0
+    assert functions.stdout.getvalue() == "mode=slow n=3 t=10.0.0.0/8\n"
+
+
+def test_build_commands_renders_file_and_reports_invalid_sets(tmp_path, monkeypatch):
+    errors = []
+    monkeypatch.setattr(functions, "print_error", errors.append)
+    monkeypatch.setattr(functions, "stdout", StringIO())
+    input_file = tmp_path / "inputs.jsonl"
+    input_file.write_text('{"Mode": "fast", "Level": 2, "Range": "10.0.0.0/8"}\n\nnot json\n'
+                          '{"Mode": "medium", "Level": 2, "Range": "10.0.0.0/8"}\n'
+                          '{"Mode": 1, "Level": "1", "Range": "192.168.0.0/16"}\n')
+
+    assert functions.build_commands(make_command(), None, str(input_file)) == 1
+
+    assert functions.stdout.getvalue() == "mode=fast n=2 t=10.0.0.0/8\nmode=fast n=1 t=192.168.0.0/16\n"
+    assert errors == ["ERROR: Input set 2: invalid JSON", "ERROR: Input set 3: invalid STRMENU value for Mode: medium"]
+
+
+def test_build_commands_reads_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(functions, "stdout", StringIO())
+    input_file = tmp_path / "inputs.csv"
+    input_file.write_text("Range,Mode,Level\n10.0.0.0/8,slow,3\n")
+
+    assert functions.build_commands(make_command(), None, str(input_file)) == 0
+    assert functions.stdout.getvalue() == "mode=slow n=3 t=10.0.0.0/8\n"
@@ -0,0 +1,101 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.classes as classes
+
+from io import BytesIO
+from os import listdir, remove
+
+
+class FakeExecution:
+    """ stands in for a finished AxiomExecution """
+
+    def __init__(self, return_code=0):
+        self.capture_file = None
+        self.return_code = return_code
+        self.start_time = 100.0
+
+    def describe_termination(self):
+        return None
+
+
+def describe(output_filename, input_filename=None):
+    inputs = [] if input_filename is None else [{"name": "wordlist", "type": "FILE", "value": input_filename}]
+    return {"tool": "nmap", "command": "TCP scan", "inputs": inputs, "artifacts": [["XML", output_filename, None]]}
+
+
+def execute(cache, key, details, output, ttl=60, return_code=0):
+    """ captures output and an output file the way a cached execution does, then stores the result """
+
+    execution = FakeExecution(return_code)
+    cache.start_capture(key, execution)
+    execution.capture_file.write(output)
+    with open(details["artifacts"][0][1], 'w') as output_file:
+        output_file.write("<nmaprun/>")
+    cache.store(key, ttl, details, execution)
+
+
+def test_replay_restores_output_and_output_files(folders):
+    cache = classes.AxiomExecutionCache()
+    details = describe(str(folders / "scan.xml"))
+    key = cache.get_key(details, "nmap -oX scan.xml 10.0.0.1")
+    execute(cache, key, details, b"Nmap done")
+    remove(str(folders / "scan.xml"))
+
+    replayed = BytesIO()
+    assert cache.replay(key, replayed)
+    assert replayed.getvalue() == b"Nmap done"
+    with open(str(folders / "scan.xml"), 'r') as output_file:
+        assert output_file.read() == "<nmaprun/>"
+
+
+def test_expired_entries_are_not_replayed_and_are_evicted(folders, monkeypatch):
+    cache = classes.AxiomExecutionCache()
+    details = describe(str(folders / "scan.xml"))
+    execute(cache, "expired", details, b"old", ttl=30)
+
+    monkeypatch.setattr(classes, "time", lambda: 10 ** 10)
+    assert not cache.replay("expired", BytesIO())
+
+    execute(cache, "fresh", details, b"new")
+    assert sorted(x for x in listdir(cache.folder) if x != "index.db") == ["fresh"]
+
+
+def test_failed_executions_and_forced_runs_are_not_replayed(folders):
+    cache = classes.AxiomExecutionCache()
+    details = describe(str(folders / "scan.xml"))
+    execute(cache, "failed", details, b"error", return_code=1)
+    execute(cache, "succeeded", details, b"done")
+
+    assert not cache.replay("failed", BytesIO())
+    assert [x for x in listdir(cache.folder) if x.endswith(".tmp")] == []
+
+    cache.force = True
+    assert not cache.replay("succeeded", BytesIO())
+
+
+def test_key_changes_with_input_file_contents(folders):
+    cache = classes.AxiomExecutionCache()
+    input_filename = str(folders / "wordlist.txt")
+    details = describe(str(folders / "scan.xml"), input_filename)
+
+    with open(input_filename, 'w') as input_file:
+        input_file.write("admin\n")
+    first_key = cache.get_key(details, "hydra -P wordlist.txt")
+    assert cache.get_key(details, "hydra -P wordlist.txt") == first_key
+
+    with open(input_filename, 'a') as input_file:
+        input_file.write("root\n")
+    assert cache.get_key(details, "hydra -P wordlist.txt") != first_key
+    assert cache.get_key(details, "hydra -P other.txt") != first_key
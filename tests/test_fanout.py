@@ -0,0 +1,52 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from lib.functions import expand_range_input
+
+from itertools import islice
+
+import pytest
+
+
+def test_ipv4_cidr_expands_to_hosts():
+    assert list(expand_range_input("IPV4CIDR", "10.0.0.0/30")) == ["10.0.0.1", "10.0.0.2"]
+    assert list(expand_range_input("IPV4CIDR", "10.0.0.5/32")) == ["10.0.0.5"]
+
+
+def test_ipv6_cidr_expands_lazily():
+    assert list(islice(expand_range_input("IPV6CIDR", "2001:db8::/32"), 2)) == ["2001:db8::1", "2001:db8::2"]
+
+
+def test_ipv4_range_accepts_shortened_last_address():
+    assert list(expand_range_input("IPV4RNGE", "10.0.0.254-10.0.1.1")) == \
+        ["10.0.0.254", "10.0.0.255", "10.0.1.0", "10.0.1.1"]
+    assert list(expand_range_input("IPV4RNGE", "10.0.0.1-3")) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+
+def test_ipv6_range_expands():
+    assert list(expand_range_input("IPV6RNGE", "2001:db8::fe-2001:db8::100")) == \
+        ["2001:db8::fe", "2001:db8::ff", "2001:db8::100"]
+
+
+def test_integer_range_joins_segments_in_order():
+    assert list(expand_range_input("INTRANGE", "8080, 1-3,-2--1")) == ["8080", "1", "2", "3", "-2", "-1"]
+
+
+@pytest.mark.parametrize("input_type, value", [("IPV4CIDR", "2001:db8::/64"), ("IPV6CIDR", "10.0.0.0/24"),
+                                               ("IPV4RNGE", "10.0.0.9-10.0.0.1"), ("IPV4RNGE", "10.0.0.1"),
+                                               ("IPV6RNGE", "2001:db8::1-10.0.0.1"), ("INTRANGE", "10-1"),
+                                               ("INTRANGE", "1-"), ("IPV4", "10.0.0.1")])
+def test_invalid_ranges_raise_value_error(input_type, value):
+    with pytest.raises(ValueError):
+        list(expand_range_input(input_type, value))
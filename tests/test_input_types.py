@@ -0,0 +1,41 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from lib.classes import AxiomInputTypes
+
+import pytest
+
+
+def test_normalize_ipv6_list_compresses_networks_and_ranges():
+    assert AxiomInputTypes.normalize_ipv6_list("2001:DB8:0:0::/32, 2001:0db8::1-2001:db8::00FF") == \
+        "2001:db8::/32,2001:db8::1-2001:db8::ff"
+
+
+def test_normalize_ipv6_list_keeps_scope_of_range_end():
+    assert AxiomInputTypes.normalize_ipv6_list("fe80::1-fe80::9%eth0") == "fe80::1-fe80::9%eth0"
+
+
+@pytest.mark.parametrize("value", ["2001:db8::/129", "2001:db8::/", "2001:db8::/x", "fe80::1%eth0/64",
+                                   "fe80::1%eth0-fe80::9", "2001:db8::1", "2001:db8::1-", "10.0.0.0/8",
+                                   "2001:db8::/32,", "2001:db8::g/64"])
+def test_normalize_ipv6_list_rejects_invalid_segments(value):
+    assert AxiomInputTypes.normalize_ipv6_list(value) is None
+
+
+def test_registry_normalizes_ipv6_inputs():
+    registry = AxiomInputTypes(["IPV6", "IPV6CIDR", "IPV6RNGE"])
+
+    assert registry.normalize("IPV6", " 2001:DB8::0001 ") == "2001:db8::1"
+    assert registry.normalize("IPV6CIDR", "2001:DB8::/48 ,2001:db8:1::/48") == "2001:db8::/48,2001:db8:1::/48"
+    assert registry.normalize("IPV6RNGE", "   ") is None
@@ -0,0 +1,127 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.config as config
+import lib.functions as functions
+
+from threading import Lock
+
+
+class FakeModule:
+    """ stands in for an AxiomPtfModule """
+
+    def __init__(self, name, dependencies):
+        self.category = "exploitation"
+        self.dependencies = dependencies
+        self.name = name
+        self.packages = {}
+
+
+class FakeTool:
+    """ stands in for an uninstalled AxiomTool with a PTF module """
+
+    def __init__(self, name):
+        self.name = name
+        self.platform = "Linux"
+        self.ptf_module = str("modules/exploitation/" + name)
+
+    def is_installed(self):
+        return False
+
+    def platform_matches(self):
+        return True
+
+
+def install(folders, monkeypatch, modules, failing):
+    """ installs tools for PTF modules (dictionary of names and dependency names) where the failing ones fail,
+        returns the exit value and the names of the installed tools in order """
+
+    installed = []
+
+    def install_ptf_module(tool, package_lock, log_folder, ptf_folders):
+        installed.append(tool.name)
+        return tool, tool.name not in failing, 1.0, str(tool.name + ".log")
+
+    monkeypatch.setattr(config.axiom, "platform", "Linux")
+    monkeypatch.setattr(functions.detector, "catalog",
+                        dict((str("modules/exploitation/" + x), FakeModule(x, [str("modules/exploitation/" + y)
+                                                                               for y in modules[x]]))
+                             for x in modules))
+    monkeypatch.setattr(functions, "install_ptf_module", install_ptf_module)
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+
+    exit_value = functions.install_missing_tools(None, [], [FakeTool(x) for x in modules])
+
+    return exit_value, installed
+
+
+def test_dependencies_install_first(folders, monkeypatch, capsys):
+    exit_value, installed = install(folders, monkeypatch, {"a": ["b"], "b": ["c"], "c": [], "d": []}, [])
+
+    assert exit_value == 0
+    assert installed.index("c") < installed.index("b") < installed.index("a")
+    assert sorted(installed) == ["a", "b", "c", "d"]
+    assert "4 installed, 0 failed, 0 skipped" in capsys.readouterr().out
+
+
+def test_failed_install_skips_every_dependent_tool(folders, monkeypatch, capsys):
+    exit_value, installed = install(folders, monkeypatch, {"a": ["b"], "b": ["c"], "c": [], "d": []}, ["c"])
+
+    assert exit_value == 1
+    assert sorted(installed) == ["c", "d"]
+
+    with open(str(folders / "bin" / "install" / "summary.txt"), 'r') as summary_file:
+        summary = summary_file.read().splitlines()
+    assert [x.split("\t")[0].strip() + " " + x.split("\t")[2] for x in summary if "\t" in x] == \
+        ["SKIP a", "SKIP b", "FAIL c", "OK d"]
+    assert "1 installed, 1 failed, 2 skipped" in summary[-1]
+    assert "skipped, modules/exploitation/c failed" in "\n".join(summary)
+
+
+def test_ptf_session_runs_from_a_copy_of_the_ptf_folder(folders, monkeypatch):
+    ptf_folder = folders / "ptf"
+    ptf_folder.mkdir()
+    (ptf_folder / "ptf").write_text("")
+    sessions = []
+
+    class Tool(FakeTool):
+        def install_via_ptf(self, log_file, folder):
+            sessions.append(folder)
+            return 0
+
+    monkeypatch.setattr(config.axiom, "ptf_folder", str(ptf_folder))
+    monkeypatch.setattr(functions.detector, "catalog", {"modules/exploitation/a": FakeModule("a", [])})
+    monkeypatch.setattr(functions.detector, "detect", lambda tool: True)
+    ptf_folders = functions.Queue()
+    ptf_folders.put(str(folders / "ptf-1"))
+
+    tool, success, duration, log_filename = functions.install_ptf_module(Tool("a"), Lock(), str(folders), ptf_folders)
+
+    assert success
+    assert sessions == [str(folders / "ptf-1")]
+    assert (folders / "ptf-1" / "ptf").exists()
+    assert ptf_folders.get() == str(folders / "ptf-1")
+
+
+def test_ptf_session_that_cannot_run_is_a_failed_install(folders, monkeypatch):
+    class Tool(FakeTool):
+        def install_via_ptf(self, log_file, folder):
+            return None
+
+    monkeypatch.setattr(functions.detector, "catalog", {"modules/exploitation/a": FakeModule("a", [])})
+    monkeypatch.setattr(functions.detector, "detect", lambda tool: True)
+    ptf_folders = functions.Queue()
+    ptf_folders.put(str(folders))
+
+    assert not functions.install_ptf_module(Tool("a"), Lock(), str(folders), ptf_folders)[1]
@@ -0,0 +1,107 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.functions as functions
+
+from json import loads
+
+
+class FakeCommand:
+    """ stands in for an AxiomAction that always renders the same text """
+
+    def __init__(self, text):
+        self.text = text
+
+    def render(self, values):
+        return self.text
+
+
+def make_steps(*specifications):
+    return [{"number": number, "name": name, "tool": None, "command": FakeCommand(str("run " + name)), "inputs": {},
+             "needs": needs} for number, (name, needs) in enumerate(specifications, 1)]
+
+
+def run(monkeypatch, capsys, filename, steps, exit_codes, resume=False):
+    """ runs a playbook whose steps exit with the given codes, returns the exit value, the names of the executed
+        steps in order, and the result of every step by name """
+
+    executed = []
+
+    def run_batch_item(tool, command, item_number, values, log_folder, active, active_lock):
+        name = steps[item_number - 1]["name"]
+        executed.append(name)
+        return {"item": item_number, "exit_code": exit_codes.get(name, 0), "output": str(name + ".log"),
+                "artifacts": []}
+
+    monkeypatch.setattr(functions, "load_playbook", lambda *args: steps)
+    monkeypatch.setattr(functions, "run_batch_item", run_batch_item)
+
+    exit_value = functions.run_playbook(filename, resume, [], [])
+    results = dict((x["step"], x) for x in map(loads, capsys.readouterr().out.splitlines()))
+
+    return exit_value, executed, results
+
+
+def test_steps_run_after_their_dependencies(folders, monkeypatch, capsys):
+    steps = make_steps(("report", ["scan", "enumerate"]), ("enumerate", ["scan"]), ("scan", []))
+
+    exit_value, executed, results = run(monkeypatch, capsys, str(folders / "playbook.yml"), steps, {})
+
+    assert exit_value == 0
+    assert executed == ["scan", "enumerate", "report"]
+    assert [results[x]["exit_code"] for x in executed] == [0, 0, 0]
+
+
+def test_failed_dependency_skips_dependent_steps_only(folders, monkeypatch, capsys):
+    steps = make_steps(("scan", []), ("enumerate", ["scan"]), ("report", ["enumerate"]), ("lookup", []))
+
+    exit_value, executed, results = run(monkeypatch, capsys, str(folders / "playbook.yml"), steps, {"scan": 1})
+
+    assert exit_value == 1
+    assert sorted(executed) == ["lookup", "scan"]
+    assert results["enumerate"]["error"] == "dependency scan did not succeed"
+    assert results["report"]["error"] == "dependency enumerate did not succeed"
+
+
+def test_resume_skips_steps_that_already_succeeded(folders, monkeypatch, capsys):
+    filename = str(folders / "playbook.yml")
+    steps = make_steps(("scan", []), ("enumerate", ["scan"]), ("lookup", []))
+
+    assert run(monkeypatch, capsys, filename, steps, {"enumerate": 1})[0] == 1
+
+    exit_value, executed, results = run(monkeypatch, capsys, filename, steps, {}, resume=True)
+
+    assert exit_value == 0
+    assert executed == ["enumerate"]
+    assert results["scan"]["resumed"] and results["lookup"]["resumed"]
+    assert results["scan"]["output"] == "scan.log"
+
+
+def test_resume_reruns_steps_whose_text_changed(folders, monkeypatch, capsys):
+    filename = str(folders / "playbook.yml")
+    steps = make_steps(("scan", []), ("lookup", []))
+
+    run(monkeypatch, capsys, filename, steps, {})
+    steps[1]["command"] = FakeCommand("run lookup --verbose")
+
+    assert run(monkeypatch, capsys, filename, steps, {}, resume=True)[1] == ["lookup"]
+
+
+def test_without_resume_every_step_runs_again(folders, monkeypatch, capsys):
+    filename = str(folders / "playbook.yml")
+    steps = make_steps(("scan", []), ("lookup", []))
+
+    run(monkeypatch, capsys, filename, steps, {})
+
+    assert sorted(run(monkeypatch, capsys, filename, steps, {})[1]) == ["lookup", "scan"]
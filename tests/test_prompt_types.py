@@ -0,0 +1,47 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from lib.classes import AxiomPromptTypes
+
+import pytest
+
+PROMPTS = [("bash", r"[#$] "), ("mimikatz", r"mimikatz # "), ("msf", r"msf\d? [^>]*> "), ("other", r"")]
+
+
+def test_detect_classifies_the_prompt_ending_the_output():
+    prompt_types = AxiomPromptTypes(PROMPTS)
+
+    assert prompt_types.detect("root@host:~# ") == "bash"
+    assert prompt_types.detect("[*] Starting\nmsf6 exploit(handler) > ") == "msf"
+    assert prompt_types.detect("user@host:~$ ls\nfile.txt\n") is None
+    assert prompt_types.detect("") is None
+
+
+def test_detect_prefers_the_leftmost_match():
+    prompt_types = AxiomPromptTypes(PROMPTS)
+
+    assert prompt_types.detect("  .#####.   mimikatz 2.2.0\n\nmimikatz # ") == "mimikatz"
+    assert AxiomPromptTypes(list(reversed(PROMPTS))).detect("mimikatz # ") == "mimikatz"
+
+
+def test_detect_ignores_the_other_prompt_type():
+    prompt_types = AxiomPromptTypes([("other", r".*")])
+
+    assert prompt_types.detect("anything at all") is None
+    assert prompt_types.patterns["other"] == r".*"
+
+
+def test_invalid_prompt_pattern_exits():
+    with pytest.raises(SystemExit):
+        AxiomPromptTypes([("bash", r"[#$ ")])
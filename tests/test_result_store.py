@@ -0,0 +1,88 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from lib.classes import AxiomCommand, AxiomResultStore
+
+from os import path
+
+
+def describe(artifacts=None):
+    return {"tool": "nmap", "platform": "Linux", "command": "TCP scan", "execution_type": "standalone",
+            "prompt_type": "bash", "inputs": [{"name": "target", "type": "IPV4", "value": "10.0.0.1"}],
+            "artifacts": artifacts or []}
+
+
+def test_record_stores_text_and_measurements(folders):
+    store = AxiomResultStore()
+
+    run_id = store.record(describe(), ["nmap -sT 10.0.0.1", "exit"],
+                          {"start_time": 100.0, "end_time": 102.5, "duration": 2.5, "exit_code": 0,
+                           "user_time": 0.5, "system_time": 0.25, "max_rss": 2048, "output_bytes": 10})
+
+    assert run_id == 1
+    assert store.recent(None, 10) == [(1, 100.0, "nmap", "TCP scan", 0, None, 2.5, 0.75, 2048, 10,
+                                       "nmap -sT 10.0.0.1\nexit")]
+
+
+def test_record_keeps_missing_measurements_as_null(folders):
+    store = AxiomResultStore()
+
+    store.record(describe(), "nmap -sT 10.0.0.1", {"exit_code": 1, "termination": "was interrupted"})
+
+    assert store.query("SELECT duration, exit_code, termination, max_rss FROM runs", ()) == \
+        [(None, 1, "was interrupted", None)]
+
+
+def test_record_ignores_executions_without_details(folders):
+    assert AxiomResultStore().record(None, "nmap", {}) is None
+
+
+def test_aggregate_counts_failures_per_command(folders):
+    store = AxiomResultStore()
+
+    for exit_code in [0, 1, None]:
+        store.record(describe(), "nmap", {"exit_code": exit_code, "duration": 1.0, "output_bytes": 5})
+
+    assert store.aggregate("nmap")[0][:4] == ("nmap", "TCP scan", 3, 1)
+    assert store.aggregate("other") == []
+
+
+def test_record_indexes_existing_output_files(folders):
+    store = AxiomResultStore()
+    output_filename = str(folders / "scan.xml")
+    with open(output_filename, 'w') as output_file:
+        output_file.write("<nmaprun/>")
+
+    run_id = store.record(describe([["XML", output_filename, None], ["XML", str(folders / "missing.xml"), None]]),
+                          "nmap", {"exit_code": 0})
+
+    assert [x[5:] for x in store.search_artifacts(None, 10)] == \
+        [(output_filename, 10, AxiomResultStore.hash_file(output_filename), run_id)]
+
+
+def test_record_keeps_relative_output_files_of_interactive_sessions(folders):
+    store = AxiomResultStore()
+
+    run_id = store.record(describe([["F_INPUT", "loot/hashes.txt", None]]), "hashdump", {})
+
+    assert [x[5:] for x in store.search_artifacts(None, 10)] == [("loot/hashes.txt", None, None, run_id)]
+
+
+def test_resolve_artifacts_makes_relative_filenames_absolute_only_for_local_executions():
+    command = AxiomCommand("scan", "bash", "standalone", ["nmap -oA ", " ", ""], [("F_PREFIX", (1, ".xml"))], "note",
+                           {}, None, [("Output prefix", "FILE"), ("Target", "IPV4")])
+
+    assert command.resolve_artifacts(["scans/web", "10.0.0.1"], True) == \
+        [("F_PREFIX", path.abspath("scans/web.xml"), path.abspath("scans/web"))]
+    assert command.resolve_artifacts(["scans/web", "10.0.0.1"], False) == [("F_PREFIX", "scans/web.xml", "scans/web")]
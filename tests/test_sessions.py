@@ -0,0 +1,188 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.config as config
+
+from lib.classes import AxiomExecutingSubprocess, AxiomDispatcher, AxiomInteractiveTask
+
+from asyncio import run
+from os import close, path, pipe, write
+
+
+class FakeProcess:
+    """ stands in for a pseudoterminal subprocess, reading from a pipe instead """
+
+    def __init__(self, child_fd):
+        self.child_fd = child_fd
+
+
+def make_sessions(dispatcher, prompts):
+    """ adds one pipe-backed session per prompt type name to a dispatcher, returns them and their pipe descriptors """
+
+    descriptors = []
+
+    for prompt_type in prompts:
+        read_fd, write_fd = pipe()
+        descriptors += [read_fd, write_fd]
+        dispatcher.subprocesses.append(AxiomExecutingSubprocess(dispatcher.subprocesses.__len__() + 1, prompt_type,
+                                                                FakeProcess(read_fd), "unused.log"))
+
+    return dispatcher.subprocesses, descriptors
+
+
+def read_everything(session):
+    output = bytes()
+    while True:
+        data = run(session.read_available(None))
+        if not data:
+            return output
+        output += data
+
+
+def test_spilled_output_is_replayed_before_buffered_output(folders, monkeypatch):
+    monkeypatch.setattr(config.axiom, "session_buffer", 1000)
+    read_fd, write_fd = pipe()
+    session = AxiomExecutingSubprocess(1, "bash", FakeProcess(read_fd), str(folders / "sessions" / "session-1.log"))
+    expected = bytes()
+
+    for i in range(10):
+        block = bytes([65 + i]) * 700
+        write(write_fd, block)
+        expected += block
+        session.drain()
+
+    assert session.spilled > 0
+    assert session.count_unread() == expected.__len__()
+    assert read_everything(session) == expected
+    assert session.count_unread() == 0
+    assert session.tail == str(bytes([74]) * 512, "ascii")
+
+    close(write_fd)
+    close(read_fd)
+
+
+def test_spill_file_is_removed_once_a_closed_session_is_read(folders, monkeypatch):
+    monkeypatch.setattr(config.axiom, "session_buffer", 1000)
+    spill_filename = str(folders / "sessions" / "session-1.log")
+    read_fd, write_fd = pipe()
+    session = AxiomExecutingSubprocess(1, "bash", FakeProcess(read_fd), spill_filename)
+
+    write(write_fd, b"x" * 5000)
+    close(write_fd)
+    session.drain()
+
+    assert session.closed and path.exists(spill_filename)
+    assert read_everything(session) == b"x" * 5000
+    assert not path.exists(spill_filename)
+
+    close(read_fd)
+
+
+def test_spill_folder_is_removed_at_exit(folders, monkeypatch):
+    monkeypatch.setattr(config.axiom, "session_buffer", 1000)
+    dispatcher = AxiomDispatcher()
+    dispatcher.spill_folder = str(folders / "sessions" / "run")
+    read_fd, write_fd = pipe()
+    session = AxiomExecutingSubprocess(1, "bash", FakeProcess(read_fd), str(dispatcher.spill_folder + "/session-1.log"))
+    dispatcher.subprocesses.append(session)
+
+    write(write_fd, b"password: hunter2\n" * 100)
+    session.drain()
+    assert path.exists(session.spill_filename)
+
+    dispatcher.remove_spill_files()
+
+    assert not path.exists(dispatcher.spill_folder)
+
+    close(write_fd)
+    close(read_fd)
+
+
+def test_matching_subprocesses_orders_open_sessions_by_last_use(folders):
+    dispatcher = AxiomDispatcher()
+    sessions, descriptors = make_sessions(dispatcher, ["bash", "mimikatz", "bash", "bash"])
+    sessions[3].closed = True
+
+    assert dispatcher.matching_subprocesses("bash") == [sessions[2], sessions[0]]
+    assert dispatcher.matching_subprocesses("msf") == []
+
+    dispatcher.broadcasting = True
+    dispatcher.select(sessions[0])
+
+    assert dispatcher.matching_subprocesses("bash") == [sessions[0], sessions[2]]
+    assert not dispatcher.broadcasting
+
+    for x in descriptors:
+        close(x)
+
+
+def test_route_task_sends_to_one_session_broadcasts_or_spawns(folders):
+    dispatcher = AxiomDispatcher()
+    sessions, descriptors = make_sessions(dispatcher, ["bash", "bash", "mimikatz"])
+    routed = []
+
+    async def broadcast(targets, current_task):
+        routed.append(("broadcast", [x.id for x in targets]))
+
+    async def read_and_transmit(session, current_task, capture=False):
+        routed.append(("session", session.id))
+
+    async def spawn_and_transmit(current_task):
+        routed.append(("spawn", current_task.starting_prompt))
+
+    dispatcher.broadcast = broadcast
+    dispatcher.read_and_transmit = read_and_transmit
+    dispatcher.spawn_and_transmit = spawn_and_transmit
+    task = AxiomInteractiveTask("whoami", "bash", "bash", None)
+
+    run(dispatcher.route_task(task))
+    assert task.sessions == [sessions[1]]
+
+    dispatcher.broadcasting = True
+    run(dispatcher.route_task(task))
+    run(dispatcher.route_task(AxiomInteractiveTask("coffee", "mimikatz", "mimikatz", None)))
+
+    for x in sessions:
+        x.closed = True
+
+    run(dispatcher.route_task(task))
+    run(dispatcher.route_task(AxiomInteractiveTask("coffee", "mimikatz", "mimikatz", None)))
+
+    assert routed == [("session", 2), ("broadcast", [2, 1]), ("session", 3), ("spawn", "bash")]
+
+    for x in descriptors:
+        close(x)
+
+
+def test_broadcast_displays_each_session_output_and_returns_first_failure(folders):
+    dispatcher = AxiomDispatcher()
+    sessions, descriptors = make_sessions(dispatcher, ["bash", "bash", "bash"])
+    displayed = []
+
+    async def read_and_transmit(session, current_task, capture=False):
+        assert capture
+        session.capture = bytearray(str("output " + str(session.id)).encode())
+        return None if session.id == 1 else str("failure " + str(session.id))
+
+    dispatcher.read_and_transmit = read_and_transmit
+    dispatcher.write_output = lambda session, data: displayed.append((session.id, data))
+    task = AxiomInteractiveTask("id", "bash", "bash", None)
+
+    assert run(dispatcher.broadcast(sessions, task)) == "failure 2"
+    assert task.sessions == sessions
+    assert displayed == [(1, b"output 1"), (2, b"output 2"), (3, b"output 3")]
+    assert all(x.capture is None for x in sessions)
+
+    for x in descriptors:
+        close(x)
@@ -0,0 +1,80 @@
+# Copyright 2020 Mike Iacovacci
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import lib.classes as classes
+
+from lib.classes import AxiomCommand, AxiomWorkspaces
+
+
+def make_command():
+    """ returns a command with a validated input and a menu input """
+
+    return AxiomCommand("scan", "bash", "standalone", ["nmap ", " -T", ""], None, "note", {}, None,
+                        [("Target", "IPV4"), ("Timing", "INTMENU", [1, 2, 3, 4, 5])])
+
+
+def test_lookup_prefers_overrides_then_names(folders):
+    workspaces = AxiomWorkspaces()
+    workspaces.bind("IPV4", "10.0.0.1")
+
+    assert workspaces.lookup("Target", "IPV4") == "10.0.0.1"
+    assert workspaces.lookup("Source", "IPV6") is None
+
+    workspaces.bind("Target", "10.0.0.2")
+    assert workspaces.lookup("Target", "IPV4") == "10.0.0.2"
+    assert workspaces.lookup("Source", "IPV4") == "10.0.0.1"
+
+    workspaces.overrides["IPV4"] = "10.0.0.3"
+    assert workspaces.lookup("Target", "IPV4") == "10.0.0.3"
+
+    workspaces.overrides["Target"] = "10.0.0.4"
+    assert workspaces.lookup("Target", "IPV4") == "10.0.0.4"
+
+
+def test_bindings_are_saved_per_workspace(folders):
+    workspaces = AxiomWorkspaces()
+    workspaces.bind("IPV4", "10.0.0.1")
+    workspaces.activate("client")
+    workspaces.bind("IPV4", "192.168.0.1")
+
+    reloaded = AxiomWorkspaces()
+
+    assert reloaded.lookup("Target", "IPV4") == "192.168.0.1"
+    reloaded.activate("default")
+    assert reloaded.lookup("Target", "IPV4") == "10.0.0.1"
+    assert reloaded.unbind("IPV4") is True
+    assert reloaded.unbind("IPV4") is False
+    assert reloaded.lookup("Target", "IPV4") is None
+
+
+def test_resolve_bound_value_normalizes_and_rejects_invalid_values(folders, monkeypatch):
+    errors = []
+    workspaces = AxiomWorkspaces()
+    monkeypatch.setattr(classes, "print_error", errors.append)
+    monkeypatch.setattr(classes, "workspaces", workspaces)
+    command = make_command()
+
+    assert command.resolve_bound_value(0) is None
+
+    workspaces.bind("Target", " 10.0.0.1 ")
+    workspaces.bind("INTMENU", "4")
+    assert command.resolve_bound_value(0) == "10.0.0.1"
+    assert command.resolve_bound_value(1) == "4"
+
+    workspaces.bind("Target", "10.0.0.256")
+    workspaces.bind("Timing", "6")
+    assert command.resolve_bound_value(0) is None
+    assert command.resolve_bound_value(1) is None
+    assert errors == ["[AXIOM] Ignoring bound value for Target (invalid IPV4 value: 10.0.0.256)",
+                      "[AXIOM] Ignoring bound value for Timing (invalid INTMENU value: 6)"]